@@ -1,10 +1,24 @@
 """Init file."""
 
+from typing import TYPE_CHECKING, Any
+
 from .agents import Agent, AgentChain, AgentResult
 from .chains import Chain, ChainBase
 from .contexts import AgentContext, Budget, ChainContext, ChatHistory, ChatMessage, LLMContext, SkillContext
 from .controllers import BasicController, ControllerBase, ExecutionUnit, LLMController
 from .evaluators import BasicEvaluator, EvaluatorBase, LLMEvaluator
 from .filters import BasicFilter, FilterBase
-from .llm import AnthropicLLM, AzureLLM, OpenAILLM, GeminiLLM, GroqLLM, OllamaLLM
+from . import llm
 from .runners import DoWhile, If, Parallel, ParallelFor, RunnerGenerator, RunnerPredicate, Sequential, While
+
+if TYPE_CHECKING:
+    from .llm import AnthropicLLM, AzureLLM, OpenAILLM, GeminiLLM, GroqLLM, OllamaLLM
+
+_LAZY_LLMS = ("AnthropicLLM", "AzureLLM", "OpenAILLM", "GeminiLLM", "GroqLLM", "OllamaLLM")
+
+
+def __getattr__(name: str) -> Any:
+    # provider classes are resolved on first use, see `council.llm.base.providers`
+    if name in _LAZY_LLMS:
+        return getattr(llm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,7 @@ from council.contexts import AgentContext, Budget, ChainContext, InfiniteBudget,
 from council.controllers import BasicController, ControllerBase, ExecutionUnit
 from council.evaluators import BasicEvaluator, EvaluatorBase
 from council.filters import BasicFilter, FilterBase
-from council.runners import new_runner_executor
+from council.runners import RunnerExecutor, RunnerTimeoutError, shared_runner_executor
 from council.skills import SkillBase
 
 from .agent_result import AgentResult
@@ -21,7 +21,12 @@ class Agent(Monitorable):
     """
 
     def __init__(
-        self, controller: ControllerBase, evaluator: EvaluatorBase, filter: FilterBase, name: str = "agent"
+        self,
+        controller: ControllerBase,
+        evaluator: EvaluatorBase,
+        filter: FilterBase,
+        name: str = "agent",
+        executor: Optional[RunnerExecutor] = None,
     ) -> None:
         """
         Initializes the Agent object.
@@ -31,6 +36,8 @@ class Agent(Monitorable):
             evaluator (EvaluatorBase): The evaluator responsible for evaluating the agent's performance.
             filter (FilterBase): The filter responsible to filter responses.
             name (str): name of the agent
+            executor (Optional[RunnerExecutor]): The executor running the chains, shared by all agents by default.
+                The agent does not shut it down.
         """
         super().__init__(base_type="agent")
         self.monitor.name = name
@@ -39,6 +46,7 @@ class Agent(Monitorable):
         self._chains: List[Monitored[ChainBase]] = self.new_monitors("chains", self.controller.chains)
         self._evaluator: Monitored[EvaluatorBase] = self.new_monitor("evaluator", evaluator)
         self._filter: Monitored[FilterBase] = self.new_monitor("filter", filter)
+        self._executor = executor
 
     @property
     def name(self) -> str:
@@ -47,6 +55,13 @@ class Agent(Monitorable):
         """
         return self.monitor.name
 
+    @property
+    def executor(self) -> RunnerExecutor:
+        """
+        the executor running the chains of the agent
+        """
+        return self._executor if self._executor is not None else shared_runner_executor()
+
     @property
     def controller(self) -> ControllerBase:
         """
@@ -85,7 +100,6 @@ class Agent(Monitorable):
             return self._execute(context)
 
     def _execute(self, context: AgentContext) -> AgentResult:
-        executor = new_runner_executor("agent")
         try:
             context.logger.info('message="agent execution started"')
             while not context.budget.is_expired():
@@ -112,20 +126,25 @@ class Agent(Monitorable):
             return AgentResult()
         finally:
             context.logger.info('message="agent execution ended"')
-            executor.shutdown(wait=False, cancel_futures=True)
 
     def execute_plan(self, iteration_context: AgentContext, plan: Sequence[ExecutionUnit]):
-        executor = new_runner_executor("agent")
+        executor = self.executor
         fs = []
         try:
             for group in self._group_units(plan):
-                fs = [executor.submit(self._execute_unit, iteration_context, unit) for unit in group]
+                fs = [executor.submit(self._execute_unit, iteration_context, unit, executor) for unit in group]
                 dones, _ = futures.wait(fs, iteration_context.budget.remaining_duration, futures.FIRST_EXCEPTION)
-                # rethrow exception if any
-                [d.result(0) for d in dones]
+                # rethrow exception if any, but a unit timing out with the budget is the same as timing out here
+                [d.result(0) for d in dones if not self._timed_out_with(iteration_context, d)]
         finally:
             for f in fs:
                 f.cancel()
+            # units still running are bounded by the same budget, let them record their outcome before returning
+            futures.wait(fs)
+
+    @staticmethod
+    def _timed_out_with(context: AgentContext, future: futures.Future) -> bool:
+        return isinstance(future.exception(0), RunnerTimeoutError) and context.budget.is_expired()
 
     @staticmethod
     def _group_units(plan: Sequence[ExecutionUnit]) -> List[List[ExecutionUnit]]:
@@ -148,7 +167,7 @@ class Agent(Monitorable):
         return result
 
     @staticmethod
-    def _execute_unit(iteration_context: AgentContext, unit: ExecutionUnit) -> None:
+    def _execute_unit(iteration_context: AgentContext, unit: ExecutionUnit, executor: RunnerExecutor) -> None:
         with iteration_context.new_agent_context_for_execution_unit(unit.name) as context:
             chain = unit.chain
             context.logger.info(f'message="chain execution started" chain="{chain.name}" execution_unit="{unit.name}"')
@@ -157,7 +176,7 @@ class Agent(Monitorable):
             )
             if unit.initial_state is not None:
                 chain_context.append(unit.initial_state)
-            chain.execute(chain_context)
+            chain.execute(chain_context, executor)
             context.logger.info(f'message="chain execution ended" chain="{chain.name}" execution_unit="{unit.name}"')
 
     @staticmethod
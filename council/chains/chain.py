@@ -2,7 +2,7 @@ from typing import Optional, Sequence
 
 from council.chains.chain_base import ChainBase
 from council.contexts import ChainContext, Monitored
-from council.runners import RunnerBase, RunnerExecutor, Sequential
+from council.runners import RunnerBase, RunnerExecutor, Sequential, shared_runner_executor
 
 
 class Chain(ChainBase):
@@ -37,8 +37,8 @@ class Chain(ChainBase):
         context: ChainContext,
         executor: Optional[RunnerExecutor] = None,
     ) -> None:
-        executor = (
-            RunnerExecutor(max_workers=10, thread_name_prefix=f"chain_{self.name}") if executor is None else executor
-        )
-
+        executor = shared_runner_executor() if executor is None else executor
         self._runner.inner.fork_run_merge(self._runner, context, executor)
+
+    async def _aexecute(self, context: ChainContext) -> None:
+        await self._runner.inner.afork_run_merge(self._runner, context)
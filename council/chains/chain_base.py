@@ -1,4 +1,5 @@
 import abc
+import asyncio
 from typing import Optional
 
 from council.contexts import ChainContext, Monitorable
@@ -52,10 +53,26 @@ class ChainBase(Monitorable, abc.ABC):
         with context:
             self._execute(context, executor)
 
+    async def aexecute(self, context: ChainContext) -> None:
+        """
+        Executes the chain of skills asynchronously, in the event loop of the caller.
+
+        Args:
+            context (ChainContext): The context for executing the chain.
+        """
+        with context:
+            await self._aexecute(context)
+
     @abc.abstractmethod
     def _execute(self, context: ChainContext, executor: Optional[RunnerExecutor] = None) -> None:
         pass
 
+    async def _aexecute(self, context: ChainContext) -> None:
+        """
+        Asynchronous implementation of the chain. Defaults to :meth:`_execute` in a worker thread.
+        """
+        await asyncio.to_thread(self._execute, context)
+
     def __repr__(self) -> str:
         return f"Chain({self.name}, {self.description})"
 
@@ -16,6 +16,12 @@ from ._context_logger import ContextLogger
 from ._execution_context import ExecutionContext
 from ._execution_log import ExecutionLog
 from ._execution_log_entry import ExecutionLogEntry
+from ._execution_log_sink import (
+    CallbackExecutionLogSink,
+    ExecutionLogSinkBase,
+    JsonLinesExecutionLogSink,
+    RingBufferExecutionLogSink,
+)
 from ._llm_context import LLMContext
 from ._message_collection import MessageCollection
 from ._message_list import MessageList
@@ -8,6 +8,7 @@ from ._chat_history import ChatHistory
 from ._chat_message import ScoredChatMessage
 from ._context_base import ContextBase
 from ._execution_context import ExecutionContext
+from ._execution_log import ExecutionLog
 from ._message_collection import MessageCollection
 from ._monitored import Monitored
 
@@ -21,29 +22,35 @@ class AgentContext(ContextBase):
         super().__init__(store, execution_context, budget)
 
     @staticmethod
-    def empty(budget: Optional[Budget] = None) -> AgentContext:
+    def empty(budget: Optional[Budget] = None, execution_log: Optional[ExecutionLog] = None) -> AgentContext:
         """
         creates a new instance with no data
 
         Args:
             budget (Budget): Optional, budget allocated for the agent execution
+            execution_log (ExecutionLog): Optional, execution log to record into, e.g. streaming to sinks
         """
-        return AgentContext.from_chat_history(ChatHistory(), budget)
+        return AgentContext.from_chat_history(ChatHistory(), budget, execution_log)
 
     @staticmethod
-    def from_chat_history(chat_history: ChatHistory, budget: Optional[Budget] = None) -> AgentContext:
+    def from_chat_history(
+        chat_history: ChatHistory, budget: Optional[Budget] = None, execution_log: Optional[ExecutionLog] = None
+    ) -> AgentContext:
         """
         creates a new instance from a :class:`ChatHistory`
 
         Args:
             chat_history (ChatHistory): The chat history to initialize the new agent context
             budget (Budget): Optional, budget allocated for the agent execution
+            execution_log (ExecutionLog): Optional, execution log to record into, e.g. streaming to sinks
         """
-        store = AgentContextStore(chat_history)
+        store = AgentContextStore(chat_history, execution_log)
         return AgentContext(store, ExecutionContext(store.execution_log, "agent"), budget or Budget.default())
 
     @staticmethod
-    def from_user_message(message: str, budget: Optional[Budget] = None) -> AgentContext:
+    def from_user_message(
+        message: str, budget: Optional[Budget] = None, execution_log: Optional[ExecutionLog] = None
+    ) -> AgentContext:
         """
         creates a new instance from a user message.
         The :class:`ChatHistory` contains only the given message
@@ -51,8 +58,9 @@ class AgentContext(ContextBase):
         Args:
             message: the user message to start with
             budget (Budget): Optional, budget allocated for the agent execution
+            execution_log (ExecutionLog): Optional, execution log to record into, e.g. streaming to sinks
         """
-        return AgentContext.from_chat_history(ChatHistory.from_user_message(message), budget)
+        return AgentContext.from_chat_history(ChatHistory.from_user_message(message), budget, execution_log)
 
     def new_agent_context_for(self, monitored: Monitored) -> AgentContext:
         """
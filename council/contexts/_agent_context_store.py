@@ -1,4 +1,4 @@
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Optional, Sequence
 
 from ._agent_iteration_context_store import AgentIterationContextStore
 from ._cancellation_token import CancellationToken
@@ -14,11 +14,11 @@ class AgentContextStore:
     Actual data storage used during the execution of an :class:`council.agents.Agent`
     """
 
-    def __init__(self, chat_history: ChatHistory) -> None:
+    def __init__(self, chat_history: ChatHistory, execution_log: Optional[ExecutionLog] = None) -> None:
         self._cancellation_token = CancellationToken()
         self._chat_history = chat_history
         self._iterations: List[AgentIterationContextStore] = []
-        self._log = ExecutionLog()
+        self._log = execution_log or ExecutionLog()
 
     @property
     def cancellation_token(self) -> CancellationToken:
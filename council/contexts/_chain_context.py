@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
-
-import more_itertools
+from typing import Iterable, List, Optional, Sequence
 
 from ._agent_context import AgentContext
 from ._agent_context_store import AgentContextStore
@@ -30,15 +28,39 @@ class ChainContext(ContextBase, MessageCollection):
         name: str,
         budget: Budget,
         messages: Optional[Iterable[ChatMessage]] = None,
+        parent: Optional[ChainContext] = None,
     ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            store: the store of the agent execution
+            execution_context: the execution context
+            name: the name of the chain
+            budget: the budget
+            messages: the messages visible to the chain, in addition to the messages of the parent
+            parent: the context this context is forked from.
+                Its messages at the time of the fork are shared with this context rather than copied.
+        """
         super().__init__(store, execution_context, budget)
         self._name = name
         self._current_messages = MessageList()
-        self._previous_messages = MessageList(messages)
+
+        # messages are only ever appended, a fork shares a snapshot of the messages of its parent and owns its own
+        self._previous_collections: List[MessageCollection] = []
+        if parent is not None:
+            self._previous_collections.extend(parent._previous_collections)
+            if len(parent._current_messages) > 0:
+                self._previous_collections.append(parent._current_messages.snapshot())
+        if messages is not None:
+            self._previous_collections.append(MessageList(messages))
+        self._previous_messages = CompositeMessageCollection(self._previous_collections)
 
         self._current_iteration_messages = CompositeMessageCollection([self._previous_messages, self._current_messages])
-        self._previous_iteration_messages = CompositeMessageCollection(
-            list(self._store.chain_iterations(self._name))[:-1]
+        self._previous_iteration_messages: MessageCollection = (
+            parent._previous_iteration_messages
+            if parent is not None
+            else CompositeMessageCollection(list(self._store.chain_iterations(self._name))[:-1])
         )
         self._all_iteration_messages = CompositeMessageCollection(
             [self._previous_iteration_messages, self._current_iteration_messages]
@@ -98,6 +120,14 @@ class ChainContext(ContextBase, MessageCollection):
         """
         return self._current_iteration_messages
 
+    @property
+    def new_messages(self) -> Sequence[ChatMessage]:
+        """
+        Returns the messages added to this context, excluding the messages inherited from the context it was forked
+        from.
+        """
+        return list(self._current_messages.messages)
+
     @staticmethod
     def from_agent_context(context: AgentContext, monitored: Monitored, name: str, budget: Optional[Budget] = None):
         """
@@ -113,11 +143,7 @@ class ChainContext(ContextBase, MessageCollection):
         forks the context for the given object, adjust the execution context appropriately
         """
         return ChainContext(
-            self._store,
-            self._execution_context.new_for(monitored),
-            self._name,
-            budget or self._budget,
-            more_itertools.flatten([self._previous_messages.messages, self._current_messages.messages]),
+            self._store, self._execution_context.new_for(monitored), self._name, budget or self._budget, parent=self
         )
 
     def should_stop(self) -> bool:
@@ -141,7 +167,13 @@ class ChainContext(ContextBase, MessageCollection):
         merge the given context to the context
         """
         for context in contexts:
-            self._current_messages.add_messages(context._current_messages.messages)
+            self.merge_messages(context._current_messages.messages)
+
+    def merge_messages(self, messages: Iterable[ChatMessage]) -> None:
+        """
+        merge the given messages, already recorded by the context that added them, to the context
+        """
+        self._current_messages.add_messages(messages)
 
     def append(self, message: ChatMessage) -> None:
         """
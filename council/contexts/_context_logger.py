@@ -1,4 +1,5 @@
 import logging
+import sys
 from typing import Any
 
 from ._execution_log_entry import ExecutionLogEntry
@@ -59,10 +60,9 @@ class ContextLogger:
 
     @staticmethod
     def _logger_log(level: int, message: str, *args: Any, exc_info: bool = False) -> bool:
-        import inspect
-
-        stack = inspect.stack()
-        logger_name = stack[2].frame.f_globals["__name__"]
-        logger = logging.getLogger(logger_name)
+        # the caller of the public logging method is two frames up
+        logger = logging.getLogger(sys._getframe(2).f_globals["__name__"])
+        if not logger.isEnabledFor(level):
+            return False
         logger.log(level, message, *args, stacklevel=3, exc_info=exc_info)
-        return logger.isEnabledFor(level)
+        return True
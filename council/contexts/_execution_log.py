@@ -1,7 +1,12 @@
 import json
-from typing import Any, Dict, List, Optional
+from collections import deque
+from functools import partial
+from threading import Lock
+from typing import Any, Deque, Dict, List, MutableMapping, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
 
 from ._execution_log_entry import ExecutionLogEntry
+from ._execution_log_sink import ExecutionLogSinkBase
 from ._monitorable import Monitorable
 
 
@@ -9,10 +14,37 @@ class ExecutionLog:
     """
     represents the log of execution for each executable items (i.e. :class:`~council.agents.Agent`,
     :class:`~council.chains.Chain`, :class:`~council.skills.SkillBase` ...)
+
+    By default, every entry is kept in memory. For long-running sessions, entries can be streamed to
+    :class:`ExecutionLogSinkBase` as they close, keeping only the last `retention` closed entries in memory.
+    An entry closed again, when its context is reused, is written again with only the records added since, if any.
     """
 
-    def __init__(self) -> None:
-        self._entries: List[ExecutionLogEntry] = []
+    def __init__(
+        self,
+        sinks: Optional[Sequence[ExecutionLogSinkBase]] = None,
+        retention: Optional[int] = None,
+        debug_sample_rate: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            sinks: destinations each entry is written to when it closes
+            retention: maximum number of closed entries kept in memory. Unbounded if `None`.
+                When bounded, entries still open are only kept while they are referenced elsewhere:
+                an entry whose context is dropped without being exited is lost, neither kept nor written to the sinks.
+            debug_sample_rate: fraction of debug logs recorded into the entries, between 0 and 1
+        """
+        if retention is not None and retention < 0:
+            raise ValueError("retention must be positive or zero")
+        if not 0.0 <= debug_sample_rate <= 1.0:
+            raise ValueError("debug_sample_rate must be between 0 and 1")
+
+        self._sinks = list(sinks) if sinks is not None else []
+        self._debug_sample_rate = debug_sample_rate
+        self._lock = Lock()
+        self._count = 0
+        self._open: MutableMapping[int, ExecutionLogEntry] = {} if retention is None else WeakValueDictionary()
+        self._closed: Deque[Tuple[int, ExecutionLogEntry]] = deque(maxlen=retention)
 
     def new_entry(self, name: str, node: Optional[Monitorable]) -> ExecutionLogEntry:
         """
@@ -24,10 +56,51 @@ class ExecutionLog:
         Returns:
             the newly added entry
         """
-        result = ExecutionLogEntry(name, node)
-        self._entries.append(result)
+        with self._lock:
+            index = self._count
+            self._count += 1
+            result = ExecutionLogEntry(
+                name, node, on_close=partial(self._close_entry, index), debug_sample_rate=self._debug_sample_rate
+            )
+            self._open[index] = result
         return result
 
+    def _close_entry(self, index: int, entry: ExecutionLogEntry) -> None:
+        # a context reused after being closed exits its entry again, only the new records are then written
+        with self._lock:
+            if self._open.pop(index, None) is not None:
+                self._closed.append((index, entry))
+            if len(self._sinks) == 0:
+                return
+            unwritten = entry._take_unwritten()
+            if unwritten is None:
+                return
+
+        for sink in self._sinks:
+            sink.write(unwritten)
+
+    @property
+    def entries(self) -> List[ExecutionLogEntry]:
+        """
+        the entries kept in memory, in creation order
+        """
+        with self._lock:
+            items = list(self._closed) + list(self._open.items())
+        return [entry for _, entry in sorted(items, key=lambda item: item[0])]
+
+    def close(self) -> None:
+        """
+        writes the entries still open to the sinks, then closes all sinks
+        """
+        with self._lock:
+            unwritten = [entry._take_unwritten() for _, entry in sorted(self._open.items(), key=lambda item: item[0])]
+
+        for sink in self._sinks:
+            for entry in unwritten:
+                if entry is not None:
+                    sink.write(entry)
+            sink.close()
+
     def to_json(self) -> str:
         """
         serialize the execution log as a `json` string
@@ -41,6 +114,6 @@ class ExecutionLog:
         """
         convert into a dictionary
         """
-        result = {"entries": [item.to_dict() for item in self._entries]}
+        result = {"entries": [item.to_dict() for item in self.entries]}
 
         return result
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
+import random
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from ._budget import Consumption
 from ._chat_message import ChatMessage
@@ -11,7 +14,13 @@ class ExecutionLogEntry:
     represents one entry in the :class:`ExecutionLog`
     """
 
-    def __init__(self, source: str, node: Optional[Monitorable]) -> None:
+    def __init__(
+        self,
+        source: str,
+        node: Optional[Monitorable],
+        on_close: Optional[Callable[[ExecutionLogEntry], None]] = None,
+        debug_sample_rate: float = 1.0,
+    ) -> None:
         self._source = source
         self._node = node
         self._start = datetime.now(timezone.utc)
@@ -19,7 +28,12 @@ class ExecutionLogEntry:
         self._error = None
         self._consumptions: List[Consumption] = []
         self._messages: List[ChatMessage] = []
+        self._on_close = on_close
+        self._depth = 0
+        self._debug_sample_rate = debug_sample_rate
         self._logs: List[Tuple[datetime, str, str]] = []
+        # numbers of consumptions, messages and logs already written to the sinks of the log, if written
+        self._written: Optional[Tuple[int, int, int]] = None
 
     @property
     def source(self) -> str:
@@ -56,11 +70,16 @@ class ExecutionLogEntry:
         self._messages.append(message)
 
     def __enter__(self):
+        self._depth += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._duration = (datetime.now(timezone.utc) - self._start).total_seconds()
         self._error = exc_val
+        # the same entry can be entered by nested contexts, it is closed when the outermost one exits
+        self._depth = max(0, self._depth - 1)
+        if self._depth == 0 and self._on_close is not None:
+            self._on_close(self)
 
     def __repr__(self) -> str:
         return (
@@ -90,11 +109,37 @@ class ExecutionLogEntry:
 
         return result
 
+    def _take_unwritten(self) -> Optional[ExecutionLogEntry]:
+        """
+        returns a copy of the entry with only the records added since the previous call, `None` if there are none,
+        so that an entry closed again, when its context is reused, is not written twice to the sinks
+        """
+        consumptions, messages, logs = self._written if self._written is not None else (0, 0, 0)
+        unchanged = (len(self._consumptions), len(self._messages), len(self._logs)) == self._written
+        if unchanged:
+            return None
+
+        result = ExecutionLogEntry(self._source, self._node)
+        result._start = self._start
+        result._duration = self._duration
+        result._error = self._error
+        result._consumptions = self._consumptions[consumptions:]
+        result._messages = self._messages[messages:]
+        result._logs = self._logs[logs:]
+        self._written = (
+            consumptions + len(result._consumptions),
+            messages + len(result._messages),
+            logs + len(result._logs),
+        )
+        return result
+
     def _log_message(self, level: str, message: str, *args: Any) -> None:
         msg = message % args if len(args) > 0 else message
         self._logs.append((datetime.now(timezone.utc), level, msg))
 
     def log_debug(self, message: str, *args: Any) -> None:
+        if self._debug_sample_rate < 1.0 and random.random() >= self._debug_sample_rate:
+            return
         self._log_message("DEBUG", message, *args)
 
     def log_info(self, message: str, *args: Any) -> None:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import abc
+import json
+import os
+from collections import deque
+from threading import Lock
+from typing import IO, Any, Callable, Deque, Dict, List, Optional
+
+from ._execution_log_entry import ExecutionLogEntry
+
+
+class ExecutionLogSinkBase(abc.ABC):
+    """
+    base class for a destination of :class:`ExecutionLogEntry`, written by the :class:`ExecutionLog` as they close
+    """
+
+    @abc.abstractmethod
+    def write(self, entry: ExecutionLogEntry) -> None:
+        """
+        writes a closed entry. Might be called concurrently from different threads.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        releases any resources held by the sink
+        """
+        pass
+
+
+class JsonLinesExecutionLogSink(ExecutionLogSinkBase):
+    """
+    appends each entry as one `json` line to a file
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: path of the file, created if needed
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._path = path
+        self._lock = Lock()
+        self._file: Optional[IO[str]] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def write(self, entry: ExecutionLogEntry) -> None:
+        line = json.dumps(entry.to_dict(), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self._path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RingBufferExecutionLogSink(ExecutionLogSinkBase):
+    """
+    keeps the dictionary representation of the last `capacity` entries in memory
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Args:
+            capacity: maximum number of entries kept
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._lock = Lock()
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+
+    @property
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        the retained entries, oldest first
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def write(self, entry: ExecutionLogEntry) -> None:
+        value = entry.to_dict()
+        with self._lock:
+            self._entries.append(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        convert into a dictionary, with the same layout as :meth:`ExecutionLog.to_dict`
+        """
+        return {"entries": self.entries}
+
+
+class CallbackExecutionLogSink(ExecutionLogSinkBase):
+    """
+    forwards each entry to a callback
+    """
+
+    def __init__(self, callback: Callable[[ExecutionLogEntry], None]) -> None:
+        self._callback = callback
+
+    def write(self, entry: ExecutionLogEntry) -> None:
+        self._callback(entry)
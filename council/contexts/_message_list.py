@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Any, Iterable, List, Optional
 
 from ._chat_message import ChatMessage
@@ -54,5 +55,32 @@ class MessageList(MessageCollection):
     def add_messages(self, messages: Iterable[ChatMessage]) -> None:
         self._messages.extend(messages)
 
+    def snapshot(self) -> MessageCollection:
+        """
+        returns an immutable view of the current messages, sharing them rather than copying them
+        """
+        return _MessageListSnapshot(self._messages, len(self._messages))
+
     def __len__(self):
         return len(self._messages)
+
+
+class _MessageListSnapshot(MessageCollection):
+    """
+    The first messages of an append-only list, unaffected by the messages appended afterward
+    """
+
+    def __init__(self, messages: List[ChatMessage], length: int) -> None:
+        self._messages = messages
+        self._length = length
+
+    @property
+    def messages(self) -> Iterable[ChatMessage]:
+        return islice(self._messages, self._length)
+
+    @property
+    def reversed(self) -> Iterable[ChatMessage]:
+        return (self._messages[index] for index in range(self._length - 1, -1, -1))
+
+    def __len__(self):
+        return self._length
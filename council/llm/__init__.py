@@ -1,28 +1,37 @@
 """This package provides clients to use various LLMs."""
 
+from typing import TYPE_CHECKING, Any
+
+from . import base
+
 from .base import (
-    AnthropicLLM,
-    AnthropicLLMConfiguration,
-    AzureChatGPTConfiguration,
-    AzureLLM,
+    AdaptiveConcurrencyLimit,
+    CircuitBreaker,
+    CircuitState,
     DefaultLLMConsumptionCalculator,
-    GeminiLLM,
-    GeminiLLMConfiguration,
-    GroqLLM,
-    GroqLLMConfiguration,
     LLMAnswer,
+    LLMAdaptiveConcurrency,
     LLMBase,
+    LLMBatchClientBase,
+    LLMBatchException,
+    LLMBatchStatus,
     LLMCacheControlData,
     LLMCallException,
     LLMCallTimeoutException,
+    LLMCircuitBreaker,
+    LLMCircuitOpenException,
     LLMConfigObject,
     LLMConfigSpec,
     LLMConfigurationBase,
     LLMConsumptionCalculatorBase,
+    LLMContextWindow,
     LLMCostCard,
     LLMCostManagerObject,
     LLMException,
     LLMFallback,
+    LLMHedging,
+    LLMLoadBalancer,
+    LLMLoadBalancingSpec,
     LLMMessage,
     LLMMessageData,
     LLMMessageRole,
@@ -32,13 +41,15 @@ from .base import (
     LLMProperty,
     LLMProvider,
     LLMProviders,
+    LLMRateLimiter,
+    LLMRateLimitException,
     LLMResult,
+    LLMRetryPolicy,
+    LLMStreamChunk,
+    LLMTokenEstimator,
     LLMTokenLimitException,
+    LoadBalancingStrategy,
     MonitoredLLM,
-    OllamaLLM,
-    OllamaLLMConfiguration,
-    OpenAIChatGPTConfiguration,
-    OpenAILLM,
     TokenKind,
     get_default_llm,
     get_llm_from_config,
@@ -46,13 +57,18 @@ from .base import (
     llm_property,
 )
 from .llm_function import (
+    AsyncExecuteLLMRequest,
     BaseModelResponseParser,
     CodeBlocksResponseParser,
     EchoResponseParser,
     ExecuteLLMRequest,
     FunctionOutOfRetryError,
+    InMemoryLLMCacheStore,
     JSONBlockResponseParser,
     JSONResponseParser,
+    LLMAsyncMiddleware,
+    LLMBatchExecutor,
+    LLMCacheStoreBase,
     LLMCachingMiddleware,
     LLMFileLoggingMiddleware,
     LLMFunction,
@@ -69,7 +85,33 @@ from .llm_function import (
     LLMRetryMiddleware,
     LLMTimestampFileLoggingMiddleware,
     ParallelExecutor,
+    SQLiteLLMCacheStore,
     StringResponseParser,
     YAMLBlockResponseParser,
     YAMLResponseParser,
 )
+
+if TYPE_CHECKING:
+    from .base import (
+        AnthropicLLM,
+        AnthropicLLMConfiguration,
+        AzureChatGPTConfiguration,
+        AzureLLM,
+        FileBatchClient,
+        GeminiLLM,
+        GeminiLLMConfiguration,
+        GroqLLM,
+        GroqLLMConfiguration,
+        OllamaLLM,
+        OllamaLLMConfiguration,
+        OpenAIBatchClient,
+        OpenAIChatGPTConfiguration,
+        OpenAILLM,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # provider classes are resolved on first use, see `council.llm.base.providers`
+    if name in base._LAZY_PROVIDER_ATTRIBUTES:
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
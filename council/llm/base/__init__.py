@@ -1,6 +1,6 @@
-from typing import Optional, Type
+from typing import TYPE_CHECKING, Any, Optional
 
-from .llm_config_object import LLMProvider, LLMConfigObject, LLMConfigSpec, LLMProviders
+from .llm_config_object import LLMProvider, LLMConfigObject, LLMConfigSpec, LLMLoadBalancingSpec, LLMProviders
 from .llm_answer import llm_property, LLMAnswer, LLMProperty, LLMParsingException
 from .llm_exception import (
     LLMException,
@@ -8,9 +8,13 @@ from .llm_exception import (
     LLMCallTimeoutException,
     LLMTokenLimitException,
     LLMOutOfRetriesException,
+    LLMRateLimitException,
+    LLMCircuitOpenException,
+    LLMBatchException,
+    is_retryable_status,
 )
 from .llm_message import LLMMessageRole, LLMMessage, LLMMessageData, LLMCacheControlData, LLMMessageTokenCounterBase
-from .llm_base import LLMBase, LLMResult, LLMConfigurationBase, T_Configuration
+from .llm_base import LLMBase, LLMResult, LLMStreamChunk, LLMConfigurationBase, T_Configuration
 from .llm_cost import (
     LLMCostCard,
     LLMCostManagerObject,
@@ -18,42 +22,62 @@ from .llm_cost import (
     LLMConsumptionCalculatorBase,
     DefaultLLMConsumptionCalculator,
 )
+from .llm_batch import LLMBatchClientBase, LLMBatchStatus
+from .llm_circuit_breaker import CircuitBreaker, CircuitState, LLMCircuitBreaker
+from .llm_context_window import LLMContextWindow
 from .llm_fallback import LLMFallback
+from .llm_concurrency_limiter import AdaptiveConcurrencyLimit, LLMAdaptiveConcurrency
+from .llm_hedging import LLMHedging
+from .llm_load_balancer import LLMLoadBalancer, LoadBalancingStrategy
+from .llm_rate_limiter import LLMRateLimiter
+from .llm_retry_policy import LLMRetryPolicy
+from .llm_token_estimator import LLMTokenEstimator
 from .monitored_llm import MonitoredLLM
 
-from .providers import (
-    _build_llm,
-    _PROVIDER_TO_LLM,
-    AzureLLM,
-    AzureChatGPTConfiguration,
-    OpenAILLM,
-    OpenAIChatGPTConfiguration,
-    AnthropicLLM,
-    AnthropicLLMConfiguration,
-    GeminiLLM,
-    GeminiLLMConfiguration,
-    GroqLLM,
-    GroqLLMConfiguration,
-    OllamaLLM,
-    OllamaLLMConfiguration,
-)
+from . import providers
+from .providers import _build_llm, _PROVIDER_TO_LLM, _LAZY_ATTRIBUTES as _LAZY_PROVIDER_ATTRIBUTES
 from ...utils import read_env_str
 
+if TYPE_CHECKING:
+    from .providers import (
+        AzureLLM,
+        AzureChatGPTConfiguration,
+        OpenAILLM,
+        OpenAIChatGPTConfiguration,
+        OpenAIBatchClient,
+        FileBatchClient,
+        AnthropicLLM,
+        AnthropicLLMConfiguration,
+        GeminiLLM,
+        GeminiLLMConfiguration,
+        GroqLLM,
+        GroqLLMConfiguration,
+        OllamaLLM,
+        OllamaLLMConfiguration,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # provider classes are resolved on first use, see `providers`
+    if name in _LAZY_PROVIDER_ATTRIBUTES:
+        return getattr(providers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_default_llm(max_retries: Optional[int] = None) -> LLMBase:
     """Get default LLM based on `COUNCIL_DEFAULT_LLM_PROVIDER` env variable."""
     provider_str = read_env_str("COUNCIL_DEFAULT_LLM_PROVIDER", default=LLMProviders.OpenAI).unwrap()
     provider_str = provider_str.lower() + "spec"
 
-    llm_class: Optional[Type[LLMBase]] = next(
-        (llm_class for provider_enum, llm_class in _PROVIDER_TO_LLM.items() if provider_str == provider_enum.lower()),
+    provider_enum: Optional[LLMProviders] = next(
+        (provider_enum for provider_enum in _PROVIDER_TO_LLM if provider_str == provider_enum.lower()),
         None,
     )
 
-    if llm_class is None:
+    if provider_enum is None:
         raise ValueError(f"Provider {provider_str} not supported by Council.")
 
-    llm = llm_class.from_env()
+    llm = _PROVIDER_TO_LLM[provider_enum].from_env()
 
     if max_retries is not None and max_retries > 0:
         return LLMFallback(llm=llm, fallback=llm, retry_before_fallback=max_retries - 1)
@@ -69,9 +93,34 @@ def get_llm_from_config(filename: str) -> LLMBase:
 
 def get_llm_from_config_obj(llm_config: LLMConfigObject):
     llm = _build_llm(llm_config)
+    load_balancing = llm_config.spec.load_balancing
+    if load_balancing is not None and len(load_balancing.providers) > 0:
+        llm = _build_load_balancer(llm_config, llm, load_balancing)
     fallback_provider = llm_config.spec.fallback_provider
     if fallback_provider is not None:
         llm_config.spec.provider = fallback_provider
         llm_with_fallback = _build_llm(llm_config)
         return LLMFallback(llm, llm_with_fallback)
     return llm
+
+
+def _build_load_balancer(
+    llm_config: LLMConfigObject, llm: LLMBase, load_balancing: LLMLoadBalancingSpec
+) -> LLMLoadBalancer:
+    provider = llm_config.spec.provider
+    llms = [llm]
+    weights = [provider.weight]
+    for member_provider in load_balancing.providers:
+        llm_config.spec.provider = member_provider
+        llms.append(_build_llm(llm_config))
+        weights.append(member_provider.weight)
+    llm_config.spec.provider = provider
+
+    return LLMLoadBalancer(
+        llms,
+        strategy=LoadBalancingStrategy(load_balancing.strategy),
+        weights=weights,
+        max_failures=load_balancing.max_failures,
+        ejection_duration=load_balancing.ejection_duration,
+        failure_penalty=load_balancing.failure_penalty,
+    )
@@ -1,11 +1,27 @@
 import abc
-from typing import Any, Dict, Final, Generic, Optional, Sequence, Type, TypeVar, get_args, get_origin
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Final,
+    Generic,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 
 from council.contexts import Consumption, LLMContext, Monitorable
 from typing_extensions import Self
 
 from .llm_config_object import LLMConfigObject, LLMConfigSpec
 from .llm_message import LLMMessage, LLMMessageTokenCounterBase
+from .llm_rate_limiter import LLMRateLimiter
+from .llm_token_estimator import LLMTokenEstimator
 
 _DEFAULT_TIMEOUT: Final[int] = 30
 
@@ -70,6 +86,37 @@ class LLMResult:
         return self._raw_response
 
 
+class LLMStreamChunk:
+    """
+    Represents a piece of a streamed LLM response.
+    The final chunk carries the complete :class:`LLMResult`, including its consumptions.
+    """
+
+    def __init__(self, content: str, result: Optional[LLMResult] = None) -> None:
+        self._content = content
+        self._result = result
+
+    @property
+    def content(self) -> str:
+        """Text generated since the previous chunk."""
+        return self._content
+
+    @property
+    def is_final(self) -> bool:
+        """Whether this is the last chunk of the response."""
+        return self._result is not None
+
+    @property
+    def result(self) -> Optional[LLMResult]:
+        """The complete result, only set on the final chunk."""
+        return self._result
+
+    @property
+    def consumptions(self) -> Sequence[Consumption]:
+        """Consumptions of the whole request, only set on the final chunk."""
+        return self._result.consumptions if self._result is not None else []
+
+
 class LLMBase(Generic[T_Configuration], Monitorable, abc.ABC):
     """
     Abstract base class representing chat LLM.
@@ -85,11 +132,32 @@ class LLMBase(Generic[T_Configuration], Monitorable, abc.ABC):
         self._token_counter = token_counter
         self._name = name or f"llm_{self.__class__.__name__}"
         self._configuration = configuration
+        self._rate_limiter: Optional[LLMRateLimiter] = None
 
     @property
     def configuration(self) -> T_Configuration:
         return self._configuration
 
+    @property
+    def token_counter(self) -> Optional[LLMMessageTokenCounterBase]:
+        """
+        The token counter of the model, if any.
+        """
+        return self._token_counter
+
+    @property
+    def rate_limiter(self) -> Optional[LLMRateLimiter]:
+        """
+        The client-side rate limiter applied to the requests of this LLM, if any.
+        """
+        return self._rate_limiter
+
+    def set_rate_limiter(self, rate_limiter: Optional[LLMRateLimiter]) -> None:
+        """
+        Set the client-side rate limiter applied to the requests of this LLM, or remove it with `None`.
+        """
+        self._rate_limiter = rate_limiter
+
     @property
     def model_name(self) -> str:
         return self.configuration.model_name()
@@ -111,13 +179,15 @@ class LLMBase(Generic[T_Configuration], Monitorable, abc.ABC):
             Exception: If an error occurs during the execution of the chat request.
         """
 
-        if self._token_counter is not None:
-            _ = self._token_counter.count_messages_token(messages=messages)
+        tokens = self._count_tokens(messages)
 
         context.logger.debug(f'message="starting execution of llm {self._name} request"')
         try:
             with context:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire(tokens, context.budget.remaining_duration, self._name)
                 result = self._post_chat_request(context, messages, **kwargs)
+                self._reconcile_tokens(tokens, result.consumptions, messages)
                 context.budget.add_consumptions(result.consumptions)
                 return result
         except Exception as e:
@@ -126,10 +196,164 @@ class LLMBase(Generic[T_Configuration], Monitorable, abc.ABC):
         finally:
             context.logger.debug(f'message="done execution of llm {self._name} request"')
 
+    async def apost_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        """
+        Sends a chat request to the language model without blocking the event loop.
+        See :meth:`post_chat_request`.
+
+        Parameters:
+            context (LLMContext): a context to track execution metrics
+            messages (Sequence[LLMMessage]): A list of LLMMessage objects representing the chat messages.
+            **kwargs: Additional keyword arguments for the chat request.
+
+        Returns:
+            LLMResult: The response from the language model.
+
+        Raises:
+            LLMTokenLimitException: If messages exceed the maximum number of tokens.
+            Exception: If an error occurs during the execution of the chat request.
+        """
+
+        tokens = self._count_tokens(messages)
+
+        context.logger.debug(f'message="starting async execution of llm {self._name} request"')
+        try:
+            with context:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.aacquire(tokens, context.budget.remaining_duration, self._name)
+                result = await self._apost_chat_request(context, messages, **kwargs)
+                self._reconcile_tokens(tokens, result.consumptions, messages)
+                context.budget.add_consumptions(result.consumptions)
+                return result
+        except Exception as e:
+            context.logger.exception(f'message="failed async execution of llm {self._name} request" exception="{e}" ')
+            raise e
+        finally:
+            context.logger.debug(f'message="done async execution of llm {self._name} request"')
+
+    def stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        """
+        Sends a chat request to the language model, yielding the response as it is generated.
+        See :meth:`post_chat_request`.
+
+        Parameters:
+            context (LLMContext): a context to track execution metrics
+            messages (Sequence[LLMMessage]): A list of LLMMessage objects representing the chat messages.
+            **kwargs: Additional keyword arguments for the chat request.
+
+        Returns:
+            Iterator[LLMStreamChunk]: chunks of the response. The final one carries the complete :class:`LLMResult`.
+
+        Raises:
+            LLMTokenLimitException: If messages exceed the maximum number of tokens.
+            Exception: If an error occurs during the execution of the chat request.
+        """
+
+        tokens = self._count_tokens(messages)
+
+        context.logger.debug(f'message="starting streamed execution of llm {self._name} request"')
+        try:
+            with context:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire(tokens, context.budget.remaining_duration, self._name)
+                for chunk in self._stream_chat_request(context, messages, **kwargs):
+                    if chunk.is_final:
+                        self._reconcile_tokens(tokens, chunk.consumptions, messages)
+                        context.budget.add_consumptions(chunk.consumptions)
+                    yield chunk
+        except Exception as e:
+            context.logger.exception(
+                f'message="failed streamed execution of llm {self._name} request" exception="{e}" '
+            )
+            raise e
+        finally:
+            context.logger.debug(f'message="done streamed execution of llm {self._name} request"')
+
+    async def astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Asynchronous version of :meth:`stream_chat_request`.
+        """
+
+        tokens = self._count_tokens(messages)
+
+        context.logger.debug(f'message="starting async streamed execution of llm {self._name} request"')
+        try:
+            with context:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.aacquire(tokens, context.budget.remaining_duration, self._name)
+                async for chunk in self._astream_chat_request(context, messages, **kwargs):
+                    if chunk.is_final:
+                        self._reconcile_tokens(tokens, chunk.consumptions, messages)
+                        context.budget.add_consumptions(chunk.consumptions)
+                    yield chunk
+        except Exception as e:
+            context.logger.exception(
+                f'message="failed async streamed execution of llm {self._name} request" exception="{e}" '
+            )
+            raise e
+        finally:
+            context.logger.debug(f'message="done async streamed execution of llm {self._name} request"')
+
+    def _count_tokens(self, messages: Sequence[LLMMessage]) -> int:
+        """
+        Count the tokens of the messages with the token counter, checking the model limit.
+        Without a token counter, tokens are only estimated when a rate limiter needs them.
+        """
+        if self._token_counter is not None:
+            return self._token_counter.count_messages_token(messages=messages)
+        if self._rate_limiter is not None:
+            return LLMRateLimiter.estimate_tokens(messages)
+        return 0
+
+    def _reconcile_tokens(
+        self, tokens: int, consumptions: Sequence[Consumption], messages: Sequence[LLMMessage]
+    ) -> None:
+        if isinstance(self._token_counter, LLMTokenEstimator):
+            self._token_counter.calibrate(messages, consumptions)
+        if self._rate_limiter is not None:
+            self._rate_limiter.reconcile(tokens, consumptions)
+
     @abc.abstractmethod
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
         pass
 
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        """
+        Streaming implementation of the chat request.
+        Defaults to a single final chunk from :meth:`_post_chat_request`; providers supporting streaming override it.
+        """
+        result = self._post_chat_request(context, messages, **kwargs)
+        yield LLMStreamChunk(result.first_choice, result)
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Asynchronous streaming implementation of the chat request.
+        Defaults to pulling each chunk of :meth:`_stream_chat_request` from a worker thread.
+        """
+        iterator = self._stream_chat_request(context, messages, **kwargs)
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        """
+        Asynchronous implementation of the chat request.
+        Defaults to running :meth:`_post_chat_request` in a worker thread; providers with an async client override it.
+        """
+        return await asyncio.to_thread(self._post_chat_request, context, messages, **kwargs)
+
     @classmethod
     def _get_configuration_class(cls) -> Type[T_Configuration]:
         """
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import abc
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Sequence, Union
+
+from .llm_base import LLMResult
+from .llm_exception import LLMException
+from .llm_message import LLMMessage
+
+
+class LLMBatchStatus(str, Enum):
+    """
+    The lifecycle of a batch of requests, following the OpenAI batch API.
+    """
+
+    Validating = "validating"
+    InProgress = "in_progress"
+    Finalizing = "finalizing"
+    Completed = "completed"
+    Failed = "failed"
+    Expired = "expired"
+    Cancelling = "cancelling"
+    Cancelled = "cancelled"
+
+    @property
+    def is_done(self) -> bool:
+        """
+        Whether the batch will not change anymore.
+        """
+        return self in (
+            LLMBatchStatus.Completed,
+            LLMBatchStatus.Failed,
+            LLMBatchStatus.Expired,
+            LLMBatchStatus.Cancelled,
+        )
+
+
+class LLMBatchClientBase(abc.ABC):
+    """
+    Abstract client of the batch endpoint of a provider.
+
+    Requests are identified by a `custom_id`, used to join their results back, since a batch may complete
+    its requests in any order.
+    """
+
+    @abc.abstractmethod
+    def build_request(self, custom_id: str, messages: Sequence[LLMMessage], **kwargs: Any) -> Dict[str, Any]:
+        """
+        Build one line of the batch input file.
+        """
+
+    @abc.abstractmethod
+    def submit(self, requests: Sequence[Dict[str, Any]]) -> str:
+        """
+        Submit a batch of requests built with :meth:`build_request`, returning the id of the batch.
+        """
+
+    @abc.abstractmethod
+    def status(self, batch_id: str) -> LLMBatchStatus:
+        """
+        Get the status of a batch.
+        """
+
+    @abc.abstractmethod
+    def results(self, batch_id: str) -> Mapping[str, Union[LLMResult, LLMException]]:
+        """
+        Get the results of a completed batch by `custom_id`, or the exception of each failed request.
+        Requests missing from the mapping were not executed, e.g. when the batch expired.
+        """
+
+    def cancel(self, batch_id: str) -> None:
+        """
+        Cancel a batch, when supported by the provider.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support cancelling a batch.")
+
+    @staticmethod
+    def custom_ids(count: int) -> List[str]:
+        """
+        The `custom_id` of `count` requests, matching :meth:`LLMDatasetObject.save_jsonl_requests`.
+        """
+        return [f"request-{i}" for i in range(count)]
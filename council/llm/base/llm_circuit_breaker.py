@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from enum import Enum
+from threading import Lock
+from typing import Any, AsyncIterator, Deque, Iterator, Optional, Sequence
+
+from council.contexts import LLMContext
+
+from .llm_base import LLMBase, LLMConfigurationBase, LLMResult, LLMStreamChunk, T_Configuration
+from .llm_config_object import LLMConfigSpec
+from .llm_exception import LLMCallException, LLMCallTimeoutException, LLMCircuitOpenException
+from .llm_message import LLMMessage
+
+
+class CircuitState(str, Enum):
+    """
+    The states of a :class:`CircuitBreaker`.
+    """
+
+    Closed = "closed"
+    """Requests go through, their outcomes are recorded."""
+
+    Open = "open"
+    """Requests are refused until `open_duration` has elapsed."""
+
+    HalfOpen = "halfOpen"
+    """A limited number of probe requests go through to decide whether to close or open the circuit again."""
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a provider known to be failing.
+
+    The circuit opens when at least `failure_rate` of the last `window` requests failed, once `min_calls`
+    requests have been recorded. After `open_duration` seconds, up to `probes` requests are let through:
+    the circuit closes when they all succeed, and opens again on the first failure.
+
+    Timeouts and server side errors (status code 408, 429 or 5xx) are failures. Other errors mean the provider
+    answered, they count as successes. Cancelled requests are not recorded.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        open_duration: float = 30.0,
+        probes: int = 1,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            failure_rate: fraction of failed requests in the window opening the circuit, between 0 and 1
+            window: number of recent requests considered
+            min_calls: number of requests recorded before the circuit can open
+            open_duration: seconds the circuit stays open before probing the provider
+            probes: number of successful probe requests closing the circuit
+        """
+        if not 0.0 < failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0 and 1")
+        if not 1 <= min_calls <= window:
+            raise ValueError("expected 1 <= min_calls <= window")
+
+        self._failure_rate = failure_rate
+        self._min_calls = min_calls
+        self._open_duration = open_duration
+        self._probes = max(1, probes)
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.Closed
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probes_succeeded = 0
+        self._generation = 0
+        self._lock = Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """
+        Seconds before the circuit lets a probe request through, 0 when not open.
+        """
+        with self._lock:
+            self._update_state()
+            if self._state != CircuitState.Open:
+                return 0.0
+            return max(0.0, self._opened_at + self._open_duration - time.monotonic())
+
+    def acquire(self) -> Optional[int]:
+        """
+        Ask to send a request, returning a ticket to pass to :meth:`release`, or None when the circuit refuses it.
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == CircuitState.Open:
+                return None
+            if self._state == CircuitState.HalfOpen:
+                if self._probes_in_flight + self._probes_succeeded >= self._probes:
+                    return None
+                self._probes_in_flight += 1
+            return self._generation
+
+    def release(self, ticket: Optional[int], exception: Optional[BaseException]) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            ticket: the value returned by :meth:`acquire`
+            exception: the exception raised by the request, None if it succeeded
+        """
+        if ticket is None:
+            return
+        with self._lock:
+            # outcomes of requests sent before the last change of state are stale
+            if ticket != self._generation:
+                return
+            if exception is not None and not isinstance(exception, Exception):
+                if self._state == CircuitState.HalfOpen:
+                    self._probes_in_flight -= 1
+                return
+
+            failed = exception is not None and self.is_failure(exception)
+            if self._state == CircuitState.HalfOpen:
+                self._probes_in_flight -= 1
+                if failed:
+                    self._open()
+                else:
+                    self._probes_succeeded += 1
+                    if self._probes_succeeded >= self._probes:
+                        self._transition(CircuitState.Closed)
+                return
+
+            self._outcomes.append(failed)
+            if len(self._outcomes) >= self._min_calls:
+                if sum(self._outcomes) >= self._failure_rate * len(self._outcomes):
+                    self._open()
+
+    def _update_state(self) -> None:
+        if self._state == CircuitState.Open and time.monotonic() >= self._opened_at + self._open_duration:
+            self._transition(CircuitState.HalfOpen)
+
+    def _open(self) -> None:
+        self._transition(CircuitState.Open)
+        self._opened_at = time.monotonic()
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._generation += 1
+        self._outcomes.clear()
+        self._probes_in_flight = 0
+        self._probes_succeeded = 0
+
+    @staticmethod
+    def is_failure(exception: BaseException) -> bool:
+        """
+        Whether an exception signals a failing provider: a timeout, or a server side status code.
+        """
+        if isinstance(exception, LLMCallTimeoutException):
+            return True
+        if isinstance(exception, LLMCallException):
+            return exception.code >= 500 or exception.code == 408 or exception.code == 429
+        return False
+
+
+class LLMCircuitBreakerConfiguration(LLMConfigurationBase):
+    """
+    A configuration class for the LLMCircuitBreaker class.
+    """
+
+    def __init__(self, *, llm_config: T_Configuration) -> None:
+        super().__init__()
+        self._llm_config = llm_config
+
+    def model_name(self) -> str:
+        return self._llm_config.model_name()
+
+    @classmethod
+    def from_env(cls, *args: Any, **kwargs: Any) -> LLMCircuitBreakerConfiguration:
+        raise NotImplementedError("LLMCircuitBreakerConfiguration doesn't support from_env() initialization.")
+
+    @classmethod
+    def from_spec(cls, spec: LLMConfigSpec) -> LLMCircuitBreakerConfiguration:
+        raise NotImplementedError("LLMCircuitBreakerConfiguration doesn't support from_spec() initialization.")
+
+
+class LLMCircuitBreaker(LLMBase[LLMCircuitBreakerConfiguration]):
+    """
+    A class that wraps a language model with a :class:`CircuitBreaker`.
+
+    While the circuit is open, requests fail immediately with :class:`LLMCircuitOpenException`,
+    which :class:`LLMFallback` does not retry.
+    """
+
+    def __init__(self, llm: LLMBase, circuit_breaker: Optional[CircuitBreaker] = None) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            llm: the wrapped language model
+            circuit_breaker: the circuit breaker, possibly shared with other LLMs. A new one is created if None
+        """
+        super().__init__(configuration=LLMCircuitBreakerConfiguration(llm_config=llm.configuration))
+        self._llm = self.new_monitor("llm", llm)
+        self._circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+
+    @property
+    def llm(self) -> LLMBase:
+        return self._llm.inner
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit_breaker
+
+    def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        ticket = self._acquire()
+        try:
+            result = self.llm.post_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._circuit_breaker.release(ticket, e)
+            raise
+        self._circuit_breaker.release(ticket, None)
+        return result
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        ticket = self._acquire()
+        try:
+            result = await self.llm.apost_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._circuit_breaker.release(ticket, e)
+            raise
+        self._circuit_breaker.release(ticket, None)
+        return result
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        ticket = self._acquire()
+        try:
+            yield from self.llm.stream_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._circuit_breaker.release(ticket, e)
+            raise
+        self._circuit_breaker.release(ticket, None)
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        ticket = self._acquire()
+        try:
+            async for chunk in self.llm.astream_chat_request(context, messages, **kwargs):
+                yield chunk
+        except BaseException as e:
+            self._circuit_breaker.release(ticket, e)
+            raise
+        self._circuit_breaker.release(ticket, None)
+
+    def _acquire(self) -> int:
+        ticket = self._circuit_breaker.acquire()
+        if ticket is None:
+            raise LLMCircuitOpenException(self._circuit_breaker.retry_after, self.model_name)
+        return ticket
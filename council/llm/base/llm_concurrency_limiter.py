@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Iterator, Optional, Sequence, Union
+
+from council.contexts import LLMContext
+
+from .llm_base import LLMBase, LLMConfigurationBase, LLMResult, LLMStreamChunk, T_Configuration
+from .llm_config_object import LLMConfigSpec
+from .llm_exception import LLMCallException, LLMCallTimeoutException, is_retryable_status
+from .llm_message import LLMMessage
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    Additive-increase/multiplicative-decrease (AIMD) limit on the number of in-flight requests.
+
+    The limit grows by one every `limit` healthy requests, i.e. about once per round trip at full concurrency,
+    as long as latency stays within `latency_tolerance` times its moving average.
+    It is multiplied by `backoff` on overload (rate limited, unavailable or timed out requests),
+    at most once per round trip so that concurrent failures of a single burst count as one signal.
+
+    Callers are served in order, whether they wait from a thread or an event loop.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            initial_limit: number of in-flight requests allowed at start
+            min_limit: lower bound of the limit
+            max_limit: upper bound of the limit
+            backoff: factor applied to the limit on overload, between 0 and 1
+            latency_tolerance: ratio to the average latency above which a request is not considered healthy
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError("backoff must be between 0 and 1")
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff = backoff
+        self._latency_tolerance = latency_tolerance
+        self._average_latency: Optional[float] = None
+        self._last_backoff = 0.0
+        self._in_flight = 0
+        self._waiters: Deque[Union[threading.Event, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """
+        The current number of in-flight requests allowed.
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The current number of in-flight requests.
+        """
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of requests waiting for a slot.
+        """
+        return len(self._waiters)
+
+    def acquire(self, timeout: Optional[float] = None, llm_name: Optional[str] = None) -> float:
+        """
+        Wait for a slot, returning the time the request starts, to pass to :meth:`release`.
+
+        Args:
+            timeout: maximum number of seconds to wait, e.g. the remaining duration of the caller's budget
+            llm_name: name of the LLM, for error reporting
+
+        Raises:
+            LLMCallTimeoutException: if no slot was available within `timeout`
+        """
+        with self._lock:
+            if self._try_acquire():
+                return time.monotonic()
+            event = threading.Event()
+            self._waiters.append(event)
+        if not event.wait(timeout):
+            self._withdraw(event)
+            raise LLMCallTimeoutException(timeout, llm_name)
+        return time.monotonic()
+
+    async def aacquire(self, timeout: Optional[float] = None, llm_name: Optional[str] = None) -> float:
+        """
+        Asynchronous version of :meth:`acquire`.
+        """
+        with self._lock:
+            if self._try_acquire():
+                return time.monotonic()
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as e:
+            self._withdraw(future)
+            raise LLMCallTimeoutException(timeout, llm_name) from e
+        except asyncio.CancelledError:
+            self._withdraw(future)
+            raise
+        return time.monotonic()
+
+    def release(self, started: Optional[float], overloaded: bool) -> None:
+        """
+        Free a slot and adapt the limit from the outcome of the request.
+
+        Args:
+            started: the time returned by :meth:`acquire`, None if the request did not complete
+            overloaded: whether the request failed because the provider is overloaded
+        """
+        with self._lock:
+            if started is not None:
+                self._adapt(started, overloaded)
+            self._in_flight -= 1
+            while len(self._waiters) > 0 and self._in_flight < self.limit:
+                self._in_flight += 1
+                self._wake(self._waiters.popleft())
+
+    def _withdraw(self, waiter: Union[threading.Event, asyncio.Future]) -> None:
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                return
+        # the slot was handed over while giving up
+        self.release(None, overloaded=False)
+
+    def _try_acquire(self) -> bool:
+        if len(self._waiters) == 0 and self._in_flight < self.limit:
+            self._in_flight += 1
+            return True
+        return False
+
+    def _adapt(self, started: float, overloaded: bool) -> None:
+        if overloaded:
+            # requests started before the last backoff already account for it
+            if started >= self._last_backoff:
+                self._limit = max(float(self._min_limit), self._limit * self._backoff)
+                self._last_backoff = time.monotonic()
+            return
+
+        latency = time.monotonic() - started
+        if self._average_latency is None:
+            self._average_latency = latency
+        healthy = latency <= self._latency_tolerance * self._average_latency
+        self._average_latency += 0.1 * (latency - self._average_latency)
+        if healthy and self._in_flight >= self.limit:
+            self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+
+    @staticmethod
+    def _wake(waiter: Union[threading.Event, asyncio.Future]) -> None:
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            waiter.get_loop().call_soon_threadsafe(AdaptiveConcurrencyLimit._resolve, waiter)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    @staticmethod
+    def is_overload(exception: BaseException) -> bool:
+        """
+        Whether an exception signals an overloaded provider: a timeout, or a retryable status code.
+        """
+        if isinstance(exception, LLMCallTimeoutException):
+            return True
+        return isinstance(exception, LLMCallException) and is_retryable_status(exception.code)
+
+
+class LLMAdaptiveConcurrencyConfiguration(LLMConfigurationBase):
+    """
+    A configuration class for the LLMAdaptiveConcurrency class.
+    """
+
+    def __init__(self, *, llm_config: T_Configuration) -> None:
+        super().__init__()
+        self._llm_config = llm_config
+
+    def model_name(self) -> str:
+        return self._llm_config.model_name()
+
+    @classmethod
+    def from_env(cls, *args: Any, **kwargs: Any) -> LLMAdaptiveConcurrencyConfiguration:
+        raise NotImplementedError("LLMAdaptiveConcurrencyConfiguration doesn't support from_env() initialization.")
+
+    @classmethod
+    def from_spec(cls, spec: LLMConfigSpec) -> LLMAdaptiveConcurrencyConfiguration:
+        raise NotImplementedError("LLMAdaptiveConcurrencyConfiguration doesn't support from_spec() initialization.")
+
+
+class LLMAdaptiveConcurrency(LLMBase[LLMAdaptiveConcurrencyConfiguration]):
+    """
+    A class that wraps a language model with an :class:`AdaptiveConcurrencyLimit` on its in-flight requests.
+
+    Share one instance (or one limit) between every runner calling the same provider, so that they converge
+    together on its sustainable throughput instead of tuning each `parallelism` by hand.
+    """
+
+    def __init__(self, llm: LLMBase, limit: Optional[AdaptiveConcurrencyLimit] = None) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            llm: the wrapped language model
+            limit: the concurrency limit, possibly shared with other LLMs. A new one is created if None
+        """
+        super().__init__(configuration=LLMAdaptiveConcurrencyConfiguration(llm_config=llm.configuration))
+        self._llm = self.new_monitor("llm", llm)
+        self._limit = limit if limit is not None else AdaptiveConcurrencyLimit()
+
+    @property
+    def llm(self) -> LLMBase:
+        return self._llm.inner
+
+    @property
+    def limit(self) -> AdaptiveConcurrencyLimit:
+        return self._limit
+
+    def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        started = self._limit.acquire(context.budget.remaining_duration, self._name)
+        try:
+            result = self.llm.post_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._release(started, e)
+            raise
+        self._limit.release(started, overloaded=False)
+        return result
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        started = await self._limit.aacquire(context.budget.remaining_duration, self._name)
+        try:
+            result = await self.llm.apost_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._release(started, e)
+            raise
+        self._limit.release(started, overloaded=False)
+        return result
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        # the slot is held until the stream is fully consumed or closed
+        started = self._limit.acquire(context.budget.remaining_duration, self._name)
+        try:
+            yield from self.llm.stream_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._release(started, e)
+            raise
+        self._limit.release(started, overloaded=False)
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        started = await self._limit.aacquire(context.budget.remaining_duration, self._name)
+        try:
+            async for chunk in self.llm.astream_chat_request(context, messages, **kwargs):
+                yield chunk
+        except BaseException as e:
+            self._release(started, e)
+            raise
+        self._limit.release(started, overloaded=False)
+
+    def _release(self, started: float, exception: BaseException) -> None:
+        if AdaptiveConcurrencyLimit.is_overload(exception):
+            self._limit.release(started, overloaded=True)
+        else:
+            # other failures, cancellations and early closes say nothing about the provider load
+            self._limit.release(None, overloaded=False)
@@ -25,11 +25,35 @@ class LLMProviders(str, Enum):
 
 
 class LLMProvider:
-    def __init__(self, name: str, description: str, specs: Dict[str, Any], kind: LLMProviders) -> None:
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        specs: Dict[str, Any],
+        kind: LLMProviders,
+        rate_limit: Optional[Dict[str, Any]] = None,
+        weight: float = 1.0,
+    ) -> None:
         self.name = name
         self.description = description
         self._specs = specs
         self._kind = kind
+        self._rate_limit = rate_limit
+        self._weight = weight
+
+    @property
+    def rate_limit(self) -> Optional[Dict[str, Any]]:
+        """
+        The client-side rate limit of the provider, with `requestsPerMinute`, `tokensPerMinute` and `failFast` keys.
+        """
+        return self._rate_limit
+
+    @property
+    def weight(self) -> float:
+        """
+        The relative capacity of the provider when load balancing, see :class:`LLMLoadBalancingSpec`.
+        """
+        return self._weight
 
     @property
     def kind(self) -> LLMProviders:
@@ -42,6 +66,8 @@ class LLMProvider:
     def from_dict(cls, values: Dict[str, Any]) -> LLMProvider:
         name = values.get("name", "")
         description = values.get("description", "")
+        rate_limit = values.get("rateLimit", None)
+        weight = float(values.get("weight", 1.0))
 
         provider_specs: Mapping[LLMProviders, Optional[Dict[str, Any]]] = {
             provider: values.get(provider) for provider in LLMProviders.all()
@@ -49,12 +75,16 @@ class LLMProvider:
 
         for provider, spec in provider_specs.items():
             if spec is not None:
-                return LLMProvider(name, description, spec, provider)
+                return LLMProvider(name, description, spec, provider, rate_limit, weight)
 
         raise ValueError("Unsupported model provider")
 
     def to_dict(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {"name": self.name, "description": self.description}
+        if self._rate_limit is not None:
+            result["rateLimit"] = self._rate_limit
+        if self._weight != 1.0:
+            result["weight"] = self._weight
 
         for provider in LLMProviders.all():
             if self.is_of_kind(provider):
@@ -86,14 +116,60 @@ class LLMProvider:
         return f"{self._kind}: {self.name} ({self.description})"
 
 
+class LLMLoadBalancingSpec:
+    """
+    Spreads requests across the provider of an LLMConfig and additional providers, see :class:`LLMLoadBalancer`.
+    """
+
+    def __init__(
+        self,
+        strategy: str,
+        providers: List[LLMProvider],
+        max_failures: int = 3,
+        ejection_duration: float = 30.0,
+        failure_penalty: float = 10.0,
+    ) -> None:
+        self.strategy = strategy
+        self.providers = providers
+        self.max_failures = max_failures
+        self.ejection_duration = ejection_duration
+        self.failure_penalty = failure_penalty
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> LLMLoadBalancingSpec:
+        providers = [LLMProvider.from_dict(provider) for provider in values.get("providers", [])]
+        return LLMLoadBalancingSpec(
+            strategy=values.get("strategy", "leastOutstanding"),
+            providers=providers,
+            max_failures=int(values.get("maxFailures", 3)),
+            ejection_duration=float(values.get("ejectionDuration", 30.0)),
+            failure_penalty=float(values.get("failurePenalty", 10.0)),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "providers": [provider.to_dict() for provider in self.providers],
+            "maxFailures": self.max_failures,
+            "ejectionDuration": self.ejection_duration,
+            "failurePenalty": self.failure_penalty,
+        }
+
+
 class LLMConfigSpec(DataObjectSpecBase):
     def __init__(
-        self, description: str, provider: LLMProvider, fallback: Optional[LLMProvider], parameters: Dict[str, Any]
+        self,
+        description: str,
+        provider: LLMProvider,
+        fallback: Optional[LLMProvider],
+        parameters: Dict[str, Any],
+        load_balancing: Optional[LLMLoadBalancingSpec] = None,
     ) -> None:
         self.description = description
         self.provider = provider
         self.parameters = parameters
         self.fallback_provider = fallback
+        self.load_balancing = load_balancing
 
     @classmethod
     def from_dict(cls, values: Dict[str, Any]) -> LLMConfigSpec:
@@ -101,16 +177,20 @@ class LLMConfigSpec(DataObjectSpecBase):
         parameters = values.get("parameters", {})
         fallback_spec: Optional[Dict[str, Any]] = values.get("fallbackProvider", None)
         fallback = LLMProvider.from_dict(fallback_spec) if fallback_spec is not None else None
+        load_balancing_spec: Optional[Dict[str, Any]] = values.get("loadBalancing", None)
+        load_balancing = LLMLoadBalancingSpec.from_dict(load_balancing_spec) if load_balancing_spec else None
         provider = LLMProvider.from_dict(values["provider"])
         if provider is None:
             raise ValueError("provider needs to be defined.")
 
-        return LLMConfigSpec(description, provider, fallback, parameters)
+        return LLMConfigSpec(description, provider, fallback, parameters, load_balancing)
 
     def to_dict(self) -> Dict[str, Any]:
         result = {"description": self.description, "provider": self.provider, "parameters": self.parameters}
         if self.fallback_provider is not None:
             result["fallback_provider"] = self.fallback_provider
+        if self.load_balancing is not None:
+            result["loadBalancing"] = self.load_balancing.to_dict()
         return result
 
     def __str__(self) -> str:
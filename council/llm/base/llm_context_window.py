@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Sequence
+
+from .llm_message import LLMMessage, LLMMessageRole, LLMMessageTokenCounterBase
+
+
+class LLMContextWindow:
+    """
+    The messages of a conversation with the running sums of their token counts,
+    to trim the conversation to the context window of a model.
+
+    Each message is counted once, when added to the window. Trimming finds the cut point by binary search over
+    the running sums, without counting the conversation again.
+    Leading system messages are pinned by default: they are kept whatever the trimming, as long as they fit.
+    """
+
+    def __init__(
+        self,
+        token_counter: LLMMessageTokenCounterBase,
+        messages: Optional[Iterable[LLMMessage]] = None,
+        pin_system: bool = True,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            token_counter: the token counter of the model
+            messages: the initial messages of the conversation
+            pin_system: always keep the leading system messages when trimming
+        """
+        self._token_counter = token_counter
+        self._pin_system = pin_system
+        self._messages: List[LLMMessage] = []
+        self._prefix_sums: List[int] = [0]
+        self._pinned = 0
+        # tokens counted for the conversation itself, such as the priming of the reply
+        self._overhead = token_counter._count_unchecked([])
+        if messages is not None:
+            self.extend(messages)
+
+    @property
+    def messages(self) -> Sequence[LLMMessage]:
+        return list(self._messages)
+
+    @property
+    def token_count(self) -> int:
+        """
+        The number of tokens of the whole conversation, including assistant tokens.
+        """
+        return self._prefix_sums[-1] + self._overhead
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def append(self, message: LLMMessage) -> None:
+        self.extend([message])
+
+    def extend(self, messages: Iterable[LLMMessage]) -> None:
+        """
+        Add messages at the end of the conversation, counting only these messages.
+        """
+        messages = list(messages)
+        counts = self._token_counter.count_each_message_token(messages)
+        for message, count in zip(messages, counts):
+            if self._pin_system and self._pinned == len(self._messages) and message.is_of_role(LLMMessageRole.System):
+                self._pinned += 1
+            self._messages.append(message)
+            self._prefix_sums.append(self._prefix_sums[-1] + count)
+
+    def last_messages(self, max_tokens: int) -> List[LLMMessage]:
+        """
+        The pinned messages followed by the most recent messages, such that the conversation, including assistant
+        tokens, counts at most `max_tokens` tokens.
+        Returns an empty list if the pinned messages do not fit.
+        """
+        budget = max_tokens - self._overhead - self._prefix_sums[self._pinned]
+        if budget < 0:
+            return []
+        start = bisect_left(self._prefix_sums, self._prefix_sums[-1] - budget, lo=self._pinned)
+        return self._messages[: self._pinned] + self._messages[start:]
+
+    def first_messages(self, max_tokens: int) -> List[LLMMessage]:
+        """
+        The oldest messages such that the conversation, including assistant tokens, counts at most `max_tokens`
+        tokens.
+        """
+        end = bisect_right(self._prefix_sums, max_tokens - self._overhead) - 1
+        return self._messages[: max(end, 0)]
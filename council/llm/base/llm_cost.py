@@ -12,9 +12,10 @@ from council.utils import DataObject, DataObjectSpecBase
 class LLMCostCard:
     """LLM cost per million token"""
 
-    def __init__(self, input: float, output: float) -> None:
+    def __init__(self, input: float, output: float, context_window: Optional[int] = None) -> None:
         self._input = input
         self._output = output
+        self._context_window = context_window
 
     @property
     def input(self) -> float:
@@ -26,6 +27,11 @@ class LLMCostCard:
         """Cost per million output (completion) tokens."""
         return self._output
 
+    @property
+    def context_window(self) -> Optional[int]:
+        """Maximum number of tokens of a request, if known."""
+        return self._context_window
+
     def __str__(self) -> str:
         return f"${self.input}/${self.output} per 1m tokens"
 
@@ -43,7 +49,12 @@ class LLMCostCard:
 
     @staticmethod
     def from_dict(data: Dict[str, float]) -> LLMCostCard:
-        return LLMCostCard(input=data["input"], output=data["output"])
+        context_window = data.get("contextWindow")
+        return LLMCostCard(
+            input=data["input"],
+            output=data["output"],
+            context_window=int(context_window) if context_window is not None else None,
+        )
 
 
 class TokenKind(str, Enum):
@@ -91,6 +102,11 @@ class LLMConsumptionCalculatorBase(abc.ABC):
         """Get LLMCostCard for self to calculate cost consumptions."""
         pass
 
+    def find_context_window(self) -> Optional[int]:
+        """Get the context window of the model from its LLMCostCard, if known."""
+        cost_card = self.find_model_costs()
+        return cost_card.context_window if cost_card is not None else None
+
     @staticmethod
     def filter_zeros(consumptions: List[Consumption]) -> List[Consumption]:
         return list(filter(lambda consumption: consumption.value > 0, consumptions))
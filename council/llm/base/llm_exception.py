@@ -40,12 +40,20 @@ class LLMCallTimeoutException(LLMException):
         super().__init__(f"LLM call timed out after {timeout} seconds", llm_name)
 
 
+def is_retryable_status(code: int) -> bool:
+    """
+    Whether a status code returned by a Large Language Model signals a transient failure worth retrying:
+    a timeout, rate limit or unavailable provider.
+    """
+    return code == 408 or code == 429 or code == 503 or code == 504
+
+
 class LLMCallException(LLMException):
     """
     Custom exception raised when the Large Language Model is executed.
     """
 
-    def __init__(self, code: int, error: str, llm_name: Optional[str]) -> None:
+    def __init__(self, code: int, error: str, llm_name: Optional[str], retry_after: Optional[float] = None) -> None:
         """
         Initializes an instance of LLMCallException.
 
@@ -53,6 +61,7 @@ class LLMCallException(LLMException):
             code (int): The error code
             error (str): The error message
             llm_name (Optional[str]): The name of the LLM
+            retry_after (Optional[float]): seconds to wait before retrying, when requested by the provider
 
         Returns:
             None
@@ -60,6 +69,7 @@ class LLMCallException(LLMException):
         super().__init__(message=f"Wrong status code: {code}. Reason: {error}", llm_name=llm_name)
         self._code = code
         self._error = error
+        self._retry_after = retry_after
 
     @property
     def code(self) -> int:
@@ -69,6 +79,13 @@ class LLMCallException(LLMException):
     def error(self) -> str:
         return self._error
 
+    @property
+    def retry_after(self) -> Optional[float]:
+        """
+        Seconds to wait before retrying, from the `Retry-After` or rate limit reset headers of the response.
+        """
+        return self._retry_after
+
 
 class LLMTokenLimitException(LLMException):
     """
@@ -88,6 +105,8 @@ class LLMTokenLimitException(LLMException):
             None
         """
         super().__init__(f"token_count={token_count} is exceeding model {model} limit of {limit} tokens.", llm_name)
+        self.token_count = token_count
+        self.limit = limit
 
 
 class LLMOutOfRetriesException(LLMException):
@@ -103,3 +122,65 @@ class LLMOutOfRetriesException(LLMException):
         """
         super().__init__(f"Exceeded maximum retries after {retry_count} attempts", llm_name)
         self.exceptions = exceptions if exceptions is not None else []
+
+
+class LLMRateLimitException(LLMException):
+    """
+    Custom exception raised when a request cannot be sent within the client-side rate limit.
+    """
+
+    def __init__(self, wait: float, llm_name: Optional[str]) -> None:
+        """
+        Initializes an instance of LLMRateLimitException.
+
+        Parameters:
+            wait (float): seconds the request would have to wait for capacity
+            llm_name (Optional[str]): The name of the LLM
+
+        Returns:
+            None
+        """
+        super().__init__(f"rate limit reached, request would wait {wait:.2f} seconds", llm_name)
+        self.wait = wait
+
+
+class LLMCircuitOpenException(LLMException):
+    """
+    Custom exception raised when a request is refused because the circuit breaker of a Large Language Model is open.
+    """
+
+    def __init__(self, retry_after: float, llm_name: Optional[str]) -> None:
+        """
+        Initializes an instance of LLMCircuitOpenException.
+
+        Parameters:
+            retry_after (float): seconds before the circuit lets a probe request through
+            llm_name (Optional[str]): The name of the LLM
+
+        Returns:
+            None
+        """
+        super().__init__(f"circuit open, retry after {retry_after:.2f} seconds", llm_name)
+        self.retry_after = retry_after
+
+
+class LLMBatchException(LLMException):
+    """
+    Custom exception raised when a batch of requests to a Large Language Model did not complete.
+    """
+
+    def __init__(self, batch_id: str, status: str, llm_name: Optional[str]) -> None:
+        """
+        Initializes an instance of LLMBatchException.
+
+        Parameters:
+            batch_id (str): The id of the batch
+            status (str): The last known status of the batch
+            llm_name (Optional[str]): The name of the LLM
+
+        Returns:
+            None
+        """
+        super().__init__(f"batch {batch_id} did not complete, status {status}", llm_name)
+        self.batch_id = batch_id
+        self.status = status
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any, Sequence
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
 
 from council.contexts import LLMContext
 
-from .llm_base import LLMBase, LLMConfigurationBase, LLMResult, T_Configuration
+from .llm_base import LLMBase, LLMConfigurationBase, LLMResult, LLMStreamChunk, T_Configuration
+from .llm_circuit_breaker import CircuitBreaker
 from .llm_config_object import LLMConfigSpec
-from .llm_exception import LLMCallException, LLMException
+from .llm_exception import LLMCallException, LLMCircuitOpenException, LLMException, is_retryable_status
 from .llm_message import LLMMessage
+from .llm_retry_policy import LLMRetryPolicy
 
 
 class LLMFallbackConfiguration(LLMConfigurationBase):
@@ -45,16 +48,29 @@ class LLMFallback(LLMBase[LLMFallbackConfiguration]):
         _fallback (LLMBase): The fallback language model instance.
         _retry_before_fallback (int): The number of retry attempts with the primary language model
             before switching to the fallback.
+        _retry_policy (LLMRetryPolicy): The delays between attempts with the primary language model.
+            Retrying stops early, switching to the fallback, when the next attempt would not fit in the budget.
+        _circuit_breaker (Optional[CircuitBreaker]): When set, requests go straight to the fallback while the
+            circuit of the primary language model is open, instead of paying for its retries.
 
     """
 
-    def __init__(self, llm: LLMBase, fallback: LLMBase, retry_before_fallback: int = 2) -> None:
+    def __init__(
+        self,
+        llm: LLMBase,
+        fallback: LLMBase,
+        retry_before_fallback: int = 2,
+        retry_policy: Optional[LLMRetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         config = LLMFallbackConfiguration(llm_config=llm.configuration, llm_fallback_config=fallback.configuration)
         super().__init__(configuration=config)
 
         self._llm = self.new_monitor("primary", llm)
         self._fallback = self.new_monitor("fallback", fallback)
         self._retry_before_fallback = retry_before_fallback
+        self._retry_policy = retry_policy if retry_policy is not None else LLMRetryPolicy(base_delay=1.25)
+        self._circuit_breaker = circuit_breaker
 
     @property
     def llm(self) -> LLMBase:
@@ -64,6 +80,10 @@ class LLMFallback(LLMBase[LLMFallbackConfiguration]):
     def fallback(self) -> LLMBase:
         return self._fallback.inner
 
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self._circuit_breaker
+
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
         try:
             return self._llm_call_with_retry(context, messages, **kwargs)
@@ -75,19 +95,135 @@ class LLMFallback(LLMBase[LLMFallbackConfiguration]):
 
     def _llm_call_with_retry(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
         retry_count = 0
+        delay: Optional[float] = None
         while retry_count == 0 or retry_count < self._retry_before_fallback:
             try:
-                return self.llm.post_chat_request(context, messages, **kwargs)
+                return self._call_llm(context, messages, **kwargs)
             except LLMCallException as e:
                 retry_count += 1
-                if self._is_retryable(e.code) and retry_count < self._retry_before_fallback:
-                    time.sleep(1.25**retry_count)
-                else:
+                delay = self._next_delay(context, delay, e, retry_count)
+                if delay is None:
                     raise e
+                time.sleep(delay)
             except Exception:
                 raise
         raise LLMException(message=f"Main LLM failed after {retry_count} retries", llm_name=self._llm.name)
 
-    @staticmethod
-    def _is_retryable(code: int) -> bool:
-        return code == 408 or code == 429 or code == 503 or code == 504
+    def _call_llm(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        ticket = self._acquire_circuit()
+        try:
+            result = self.llm.post_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._release_circuit(ticket, e)
+            raise
+        self._release_circuit(ticket, None)
+        return result
+
+    async def _acall_llm(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        ticket = self._acquire_circuit()
+        try:
+            result = await self.llm.apost_chat_request(context, messages, **kwargs)
+        except BaseException as e:
+            self._release_circuit(ticket, e)
+            raise
+        self._release_circuit(ticket, None)
+        return result
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        try:
+            return await self._allm_call_with_retry(context, messages, **kwargs)
+        except Exception as base_exception:
+            try:
+                return await self.fallback.apost_chat_request(context.new_for(self._fallback), messages, **kwargs)
+            except Exception as e:
+                raise e from base_exception
+
+    async def _allm_call_with_retry(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        retry_count = 0
+        delay: Optional[float] = None
+        while retry_count == 0 or retry_count < self._retry_before_fallback:
+            try:
+                return await self._acall_llm(context, messages, **kwargs)
+            except LLMCallException as e:
+                retry_count += 1
+                delay = self._next_delay(context, delay, e, retry_count)
+                if delay is None:
+                    raise e
+                await asyncio.sleep(delay)
+        raise LLMException(message=f"Main LLM failed after {retry_count} retries", llm_name=self._llm.name)
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        # a stream can only fall back until its first chunk has been delivered
+        started = False
+        ticket: Optional[int] = None
+        try:
+            ticket = self._acquire_circuit()
+            for chunk in self.llm.stream_chat_request(context, messages, **kwargs):
+                started = True
+                yield chunk
+        except BaseException as base_exception:
+            self._release_circuit(ticket, base_exception)
+            if started or not isinstance(base_exception, Exception):
+                raise
+            try:
+                yield from self.fallback.stream_chat_request(context.new_for(self._fallback), messages, **kwargs)
+            except Exception as e:
+                raise e from base_exception
+            return
+        self._release_circuit(ticket, None)
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        started = False
+        ticket: Optional[int] = None
+        try:
+            ticket = self._acquire_circuit()
+            async for chunk in self.llm.astream_chat_request(context, messages, **kwargs):
+                started = True
+                yield chunk
+        except BaseException as base_exception:
+            self._release_circuit(ticket, base_exception)
+            if started or not isinstance(base_exception, Exception):
+                raise
+            try:
+                async for chunk in self.fallback.astream_chat_request(
+                    context.new_for(self._fallback), messages, **kwargs
+                ):
+                    yield chunk
+            except Exception as e:
+                raise e from base_exception
+            return
+        self._release_circuit(ticket, None)
+
+    def _acquire_circuit(self) -> Optional[int]:
+        """
+        Ask the circuit breaker to call the primary LLM, raising when its circuit is open.
+        """
+        if self._circuit_breaker is None:
+            return None
+        ticket = self._circuit_breaker.acquire()
+        if ticket is None:
+            raise LLMCircuitOpenException(self._circuit_breaker.retry_after, self.llm.model_name)
+        return ticket
+
+    def _release_circuit(self, ticket: Optional[int], exception: Optional[BaseException]) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.release(ticket, exception)
+
+    def _next_delay(
+        self, context: LLMContext, previous_delay: Optional[float], e: LLMCallException, retry_count: int
+    ) -> Optional[float]:
+        """
+        Returns the delay before retrying the primary LLM, or None to switch to the fallback.
+        """
+        if not is_retryable_status(e.code) or retry_count >= self._retry_before_fallback:
+            return None
+        delay = self._retry_policy.next_delay(previous_delay, e)
+        return delay if self._retry_policy.can_wait(delay, context.budget) else None
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from threading import Event, Lock
+from typing import Any, Deque, List, Optional, Sequence, Union
+
+from council.contexts import Budget, Consumption, LLMContext, Monitored
+
+from .llm_base import LLMBase, LLMConfigurationBase, LLMResult, T_Configuration
+from .llm_config_object import LLMConfigSpec
+from .llm_exception import LLMCallTimeoutException
+from .llm_message import LLMMessage
+
+
+class LLMHedgingConfiguration(LLMConfigurationBase):
+    """
+    A configuration class for the LLMHedging class.
+    """
+
+    def __init__(self, *, llm_config: T_Configuration, llm_hedge_config: T_Configuration) -> None:
+        super().__init__()
+        self._llm_config = llm_config
+        self._llm_hedge_config = llm_hedge_config
+
+    def model_name(self) -> str:
+        return f"{self._llm_config.model_name()} with hedge_{self._llm_hedge_config.model_name()}"
+
+    @classmethod
+    def from_env(cls, *args: Any, **kwargs: Any) -> LLMHedgingConfiguration:
+        raise NotImplementedError("LLMHedgingConfiguration doesn't support from_env() initialization.")
+
+    @classmethod
+    def from_spec(cls, spec: LLMConfigSpec) -> LLMHedgingConfiguration:
+        raise NotImplementedError("LLMHedgingConfiguration doesn't support from_spec() initialization.")
+
+
+class _Started:
+    """
+    When a synchronous primary request started running.
+    """
+
+    def __init__(self) -> None:
+        self.event = Event()
+        self.at = 0.0
+
+
+class LLMHedging(LLMBase[LLMHedgingConfiguration]):
+    """
+    A class that cuts the tail latency of a language model with hedged requests.
+
+    When a request is still running after the `quantile` of the latencies of recent requests, a duplicate is sent
+    to the hedge language model (the same model by default, or e.g. the fallback of an :class:`LLMFallback`).
+    The first answer wins and the other request is cancelled.
+    At most `max_hedge_rate` of the recent requests are hedged.
+
+    The result reports a `hedged_call` consumption for every duplicate sent, and the consumptions of the losing
+    request, if it completed, with `hedged_` units, keeping the cost of hedging apart from the regular usage.
+    Only the latencies of the primary language model are learned, including those of primary requests that lost.
+
+    Synchronous requests run on a private thread pool; the hedge delay starts when the primary request starts
+    running on it, and a request that cannot start within its budget raises :class:`LLMCallTimeoutException`.
+    A losing synchronous request cannot be interrupted: it completes in the background, its result is discarded
+    and its consumptions are added to the budget of the caller with `hedged_` units.
+    """
+
+    def __init__(
+        self,
+        llm: LLMBase,
+        hedge: Optional[LLMBase] = None,
+        quantile: float = 0.95,
+        max_hedge_rate: float = 0.1,
+        window: int = 100,
+        min_samples: int = 20,
+        max_workers: int = 32,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            llm: the primary language model
+            hedge: the language model receiving duplicates, the primary one if None
+            quantile: latency quantile of recent requests after which a duplicate is sent
+            max_hedge_rate: maximum fraction of recent requests being hedged
+            window: number of recent requests considered for the latency quantile and the hedge rate
+            min_samples: number of latencies observed before hedging starts
+            max_workers: maximum number of threads running synchronous requests
+        """
+        if not 0.0 < quantile < 1.0:
+            raise ValueError("quantile must be between 0 and 1")
+        if not 0.0 <= max_hedge_rate <= 1.0:
+            raise ValueError("max_hedge_rate must be between 0 and 1")
+
+        hedge = hedge if hedge is not None else llm
+        config = LLMHedgingConfiguration(llm_config=llm.configuration, llm_hedge_config=hedge.configuration)
+        super().__init__(configuration=config)
+
+        self._llm = self.new_monitor("primary", llm)
+        self._hedge = self.new_monitor("hedge", hedge)
+        self._quantile = quantile
+        self._max_hedge_rate = max_hedge_rate
+        self._min_samples = max(1, min_samples)
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._hedged: Deque[bool] = deque(maxlen=window)
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="council_hedging")
+
+    @property
+    def llm(self) -> LLMBase:
+        return self._llm.inner
+
+    @property
+    def hedge(self) -> LLMBase:
+        return self._hedge.inner
+
+    @property
+    def hedge_delay(self) -> Optional[float]:
+        """
+        The latency after which a request is hedged, None until enough requests have been observed.
+        """
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, math.ceil(self._quantile * len(latencies)) - 1)]
+
+    @property
+    def hedge_rate(self) -> float:
+        """
+        The fraction of recent requests that were hedged.
+        """
+        with self._lock:
+            return sum(self._hedged) / len(self._hedged) if len(self._hedged) > 0 else 0.0
+
+    def close(self) -> None:
+        """
+        Release the threads of synchronous requests.
+        """
+        self._executor.shutdown(wait=False)
+
+    def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        started = _Started()
+        primary = self._executor.submit(
+            self._run_primary, started, self._new_leg_context(context, self._llm), messages, **kwargs
+        )
+        # time spent waiting for a thread is not latency of the language model
+        timeout = max(0.0, context.budget.remaining_duration)
+        if not started.event.wait(timeout):
+            if primary.cancel():
+                raise LLMCallTimeoutException(timeout, self._name)
+            started.event.wait()
+
+        delay = self.hedge_delay
+        if delay is not None:
+            delay = max(0.0, started.at + delay - time.monotonic())
+        done, _ = wait([primary], timeout=delay)
+        if len(done) > 0 or not self._can_hedge():
+            self._record(hedged=False)
+            return primary.result()
+
+        secondary = self._executor.submit(
+            self.hedge.post_chat_request, self._new_leg_context(context, self._hedge), messages, **kwargs
+        )
+        self._record(hedged=True)
+        pending = {primary, secondary}
+        while len(pending) > 0:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in done if f.exception() is None), None)
+            if winner is not None:
+                loser = secondary if winner is primary else primary
+                loser.cancel()
+                if loser.done():
+                    return self._with_hedge_consumptions(winner.result(), loser)
+                # the losing request cannot be interrupted, its consumptions are reported once it completes
+                loser.add_done_callback(partial(self._add_late_hedge_consumptions, context))
+                return self._with_hedge_consumptions(winner.result(), None)
+
+        return primary.result()
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        primary = asyncio.ensure_future(
+            self._arun_primary(self._new_leg_context(context, self._llm), messages, **kwargs)
+        )
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if len(done) > 0 or not self._can_hedge():
+                await asyncio.wait(pending)
+                self._record(hedged=False)
+                return primary.result()
+
+            secondary = asyncio.ensure_future(
+                self.hedge.apost_chat_request(self._new_leg_context(context, self._hedge), messages, **kwargs)
+            )
+            self._record(hedged=True)
+            pending.add(secondary)
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    loser = secondary if winner is primary else primary
+                    return self._with_hedge_consumptions(winner.result(), loser if loser.done() else None)
+
+            return primary.result()
+        finally:
+            # cancel the losing request, or both when the caller is cancelled
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _new_leg_context(context: LLMContext, monitored: Monitored[LLMBase]) -> LLMContext:
+        """
+        Each request runs with a private budget: only the consumptions of the result are added to the budget
+        of the caller, those of the losing request with `hedged_` units.
+        """
+        return LLMContext.from_context(context, monitored, Budget(context.budget.remaining_duration))
+
+    def _run_primary(
+        self, started: _Started, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        started.at = time.monotonic()
+        started.event.set()
+        result = self.llm.post_chat_request(context, messages, **kwargs)
+        self._record_latency(time.monotonic() - started.at)
+        return result
+
+    async def _arun_primary(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        started = time.monotonic()
+        result = await self.llm.apost_chat_request(context, messages, **kwargs)
+        self._record_latency(time.monotonic() - started)
+        return result
+
+    def _can_hedge(self) -> bool:
+        with self._lock:
+            hedged = sum(self._hedged) + 1
+            return hedged <= self._max_hedge_rate * (len(self._hedged) + 1)
+
+    def _record(self, hedged: bool) -> None:
+        """
+        Record whether a request was hedged.
+        """
+        with self._lock:
+            self._hedged.append(hedged)
+
+    def _record_latency(self, latency: float) -> None:
+        """
+        Learn the latency of a successful primary request.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _with_hedge_consumptions(self, result: LLMResult, loser: Optional[Union[Future, asyncio.Future]]) -> LLMResult:
+        consumptions: List[Consumption] = list(result.consumptions)
+        consumptions.append(Consumption(1, "hedged_call", self.hedge.model_name))
+        if loser is not None:
+            consumptions.extend(self._hedged_consumptions(loser))
+        return LLMResult(result.choices, consumptions, result.raw_response)
+
+    def _add_late_hedge_consumptions(self, context: LLMContext, loser: Future) -> None:
+        context.budget.add_consumptions(self._hedged_consumptions(loser))
+
+    @staticmethod
+    def _hedged_consumptions(loser: Union[Future, asyncio.Future]) -> List[Consumption]:
+        if loser.cancelled() or loser.exception() is not None:
+            return []
+        return [Consumption(c.value, f"hedged_{c.unit}", c.kind) for c in loser.result().consumptions]
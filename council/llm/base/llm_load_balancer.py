@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import random
+import time
+from enum import Enum
+from threading import Lock
+from typing import Any, AsyncIterator, Iterator, List, Optional, Sequence
+
+from council.contexts import LLMContext, Monitored
+
+from .llm_base import LLMBase, LLMConfigurationBase, LLMResult, LLMStreamChunk
+from .llm_config_object import LLMConfigSpec
+from .llm_exception import LLMCallException, LLMCallTimeoutException, is_retryable_status
+from .llm_message import LLMMessage
+
+
+class LoadBalancingStrategy(str, Enum):
+    """
+    How :class:`LLMLoadBalancer` picks the member serving a request.
+    """
+
+    Weighted = "weighted"
+    """Smooth weighted round-robin: members receive requests in proportion to their weight."""
+
+    LeastOutstanding = "leastOutstanding"
+    """The member with the fewest in-flight requests relative to its weight."""
+
+    EWMALatency = "ewmaLatency"
+    """
+    The member with the lowest moving average latency, scaled by its in-flight requests.
+    Failed requests count as at least `failure_penalty` seconds, and a member without a latency yet gets the
+    average latency of the members that succeeded.
+    """
+
+
+class LLMLoadBalancerConfiguration(LLMConfigurationBase):
+    """
+    A configuration class for the LLMLoadBalancer class.
+    """
+
+    def __init__(self, *, llm_configs: Sequence[LLMConfigurationBase]) -> None:
+        super().__init__()
+        self._llm_configs = list(llm_configs)
+
+    def model_name(self) -> str:
+        return " | ".join(config.model_name() for config in self._llm_configs)
+
+    @classmethod
+    def from_env(cls, *args: Any, **kwargs: Any) -> LLMLoadBalancerConfiguration:
+        raise NotImplementedError("LLMLoadBalancerConfiguration doesn't support from_env() initialization.")
+
+    @classmethod
+    def from_spec(cls, spec: LLMConfigSpec) -> LLMLoadBalancerConfiguration:
+        raise NotImplementedError(
+            "LLMLoadBalancerConfiguration doesn't support direct from_spec() initialization. "
+            "Use council.llm.get_llm_from_config() instead."
+        )
+
+
+class _Member:
+    def __init__(self, monitored: Monitored[LLMBase], weight: float) -> None:
+        self.monitored = monitored
+        self.weight = weight
+        self.current_weight = 0.0
+        self.outstanding = 0
+        self.latency: Optional[float] = None
+        self.succeeded = False
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    @property
+    def llm(self) -> LLMBase:
+        return self.monitored.inner
+
+
+class LLMLoadBalancer(LLMBase[LLMLoadBalancerConfiguration]):
+    """
+    A class that spreads requests across several deployments of a language model.
+
+    Members failing `max_failures` times in a row, with a timeout or a server side error, are ejected for
+    `ejection_duration` seconds. When every member is ejected, the one ejected first serves the request.
+    Each request runs in the context of the member serving it, so that consumptions are reported per member
+    through the monitor tree. Failed requests are not retried, combine with :class:`LLMFallback` for that.
+    """
+
+    def __init__(
+        self,
+        llms: Sequence[LLMBase],
+        strategy: LoadBalancingStrategy = LoadBalancingStrategy.LeastOutstanding,
+        weights: Optional[Sequence[float]] = None,
+        max_failures: int = 3,
+        ejection_duration: float = 30.0,
+        failure_penalty: float = 10.0,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            llms: the members of the pool
+            strategy: how members are picked
+            weights: relative capacity of each member, all equal if None
+            max_failures: consecutive failures of a member before it is ejected
+            ejection_duration: seconds an unhealthy member is ejected for
+            failure_penalty: latency, in seconds, recorded for a failed request with the EWMALatency strategy
+        """
+        if len(llms) == 0:
+            raise ValueError("LLMLoadBalancer requires at least one llm")
+        weights = weights if weights is not None else [1.0] * len(llms)
+        if len(weights) != len(llms) or any(weight <= 0 for weight in weights):
+            raise ValueError("expected one positive weight per llm")
+
+        super().__init__(configuration=LLMLoadBalancerConfiguration(llm_configs=[llm.configuration for llm in llms]))
+        self._members = [
+            _Member(monitored, weight) for monitored, weight in zip(self.new_monitors("members", llms), weights)
+        ]
+        self._strategy = strategy
+        self._max_failures = max_failures
+        self._ejection_duration = ejection_duration
+        self._failure_penalty = failure_penalty
+        self._lock = Lock()
+
+    @property
+    def llms(self) -> Sequence[LLMBase]:
+        return [member.llm for member in self._members]
+
+    @property
+    def strategy(self) -> LoadBalancingStrategy:
+        return self._strategy
+
+    @property
+    def healthy_llms(self) -> Sequence[LLMBase]:
+        """
+        The members currently not ejected.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [member.llm for member in self._members if member.ejected_until <= now]
+
+    def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
+        member = self._acquire()
+        started = time.monotonic()
+        try:
+            result = member.llm.post_chat_request(context.new_for(member.monitored), messages, **kwargs)
+        except BaseException as e:
+            self._release(member, started, e)
+            raise
+        self._release(member, started, None)
+        return result
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        member = self._acquire()
+        started = time.monotonic()
+        try:
+            result = await member.llm.apost_chat_request(context.new_for(member.monitored), messages, **kwargs)
+        except BaseException as e:
+            self._release(member, started, e)
+            raise
+        self._release(member, started, None)
+        return result
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        member = self._acquire()
+        started = time.monotonic()
+        try:
+            yield from member.llm.stream_chat_request(context.new_for(member.monitored), messages, **kwargs)
+        except BaseException as e:
+            self._release(member, started, e)
+            raise
+        self._release(member, started, None)
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        member = self._acquire()
+        started = time.monotonic()
+        try:
+            async for chunk in member.llm.astream_chat_request(context.new_for(member.monitored), messages, **kwargs):
+                yield chunk
+        except BaseException as e:
+            self._release(member, started, e)
+            raise
+        self._release(member, started, None)
+
+    def _acquire(self) -> _Member:
+        now = time.monotonic()
+        with self._lock:
+            candidates = [member for member in self._members if member.ejected_until <= now]
+            if len(candidates) == 0:
+                candidates = [min(self._members, key=lambda m: m.ejected_until)]
+            member = self._pick(candidates)
+            member.outstanding += 1
+            return member
+
+    def _pick(self, candidates: List[_Member]) -> _Member:
+        if len(candidates) == 1:
+            return candidates[0]
+
+        if self._strategy == LoadBalancingStrategy.Weighted:
+            # smooth weighted round-robin, spreading the picks of heavier members
+            total = 0.0
+            for candidate in candidates:
+                candidate.current_weight += candidate.weight
+                total += candidate.weight
+            member = max(candidates, key=lambda m: m.current_weight)
+            member.current_weight -= total
+            return member
+
+        if self._strategy == LoadBalancingStrategy.EWMALatency:
+            scores = [(self._latency_of(m) * (m.outstanding + 1)) / m.weight for m in candidates]
+        else:
+            scores = [(m.outstanding + 1) / m.weight for m in candidates]
+        best = min(scores)
+        members = [m for m, score in zip(candidates, scores) if score == best]
+        # explore the members without a latency yet before those scored with the latency they observed
+        untried = [m for m in members if m.latency is None]
+        return random.choice(untried if len(untried) > 0 else members)
+
+    def _release(self, member: _Member, started: float, exception: Optional[BaseException]) -> None:
+        with self._lock:
+            member.outstanding -= 1
+            latency = time.monotonic() - started
+            if exception is None:
+                member.latency = (
+                    latency if member.latency is None else member.latency + 0.3 * (latency - member.latency)
+                )
+                member.failures = 0
+                member.succeeded = True
+                return
+
+            if isinstance(exception, Exception):
+                # a member failing fast, e.g. with an invalid key, must not look like the fastest one
+                current = self._latency_of(member)
+                member.latency = current + 0.3 * (max(latency, self._failure_penalty) - current)
+            if self._is_unhealthy(exception):
+                member.failures += 1
+                if member.failures >= self._max_failures:
+                    member.failures = 0
+                    member.ejected_until = time.monotonic() + self._ejection_duration
+
+    def _latency_of(self, member: _Member) -> float:
+        """
+        The moving average latency of a member, or the average of the members that succeeded for a member without
+        one yet.
+        """
+        if member.latency is not None:
+            return member.latency
+        latencies = [m.latency for m in self._members if m.succeeded and m.latency is not None]
+        return sum(latencies) / len(latencies) if len(latencies) > 0 else 0.0
+
+    @staticmethod
+    def _is_unhealthy(exception: BaseException) -> bool:
+        if isinstance(exception, LLMCallTimeoutException):
+            return True
+        return isinstance(exception, LLMCallException) and (
+            exception.code >= 500 or is_retryable_status(exception.code)
+        )
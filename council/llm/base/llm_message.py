@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import abc
 import base64
+import hashlib
 import mimetypes
 from enum import Enum
 from typing import Dict, Iterable, List, Optional, Sequence
 
 from council.contexts import ChatMessage, ChatMessageKind
 
+from .llm_exception import LLMTokenLimitException
+
 
 class LLMMessageRole(str, Enum):
     """
@@ -118,6 +121,7 @@ class LLMMessage:
         self._content = content
         self._name = name
         self._data: List[LLMMessageData] = [] if data is None else list(data)
+        self._fingerprint: Optional[str] = None
 
     @staticmethod
     def system_message(
@@ -170,6 +174,7 @@ class LLMMessage:
         Add data to the message.
         """
         self._data.append(data)
+        self._fingerprint = None
 
     def add_content(self, *, path: Optional[str] = None, url: Optional[str] = None) -> None:
         """
@@ -183,6 +188,7 @@ class LLMMessage:
 
         if data is not None:
             self._data.append(data)
+            self._fingerprint = None
 
     @property
     def content(self) -> str:
@@ -248,6 +254,16 @@ class LLMMessage:
 
         return normalized_content
 
+    @property
+    def fingerprint(self) -> str:
+        """
+        SHA-256 hex digest of the :meth:`normalize` representation of the message.
+        Computed once and memoized on the instance; adding data resets it.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256(self.normalize().encode()).hexdigest()
+        return self._fingerprint
+
     @classmethod
     def from_dict(cls, values: Dict[str, str]) -> LLMMessage:
         """Create an instance from OpenAI-compatible dict with role and content (name and data not supported)."""
@@ -280,3 +296,25 @@ class LLMMessageTokenCounterBase(abc.ABC):
 
         """
         pass
+
+    def count_each_message_token(self, messages: Sequence[LLMMessage]) -> List[int]:
+        """
+        Counts the tokens of each message of a list of LLM messages, excluding assistant tokens.
+
+        The default implementation counts each message alone, without checking the token limit.
+        Token counters able to count many messages at once should override it.
+
+        Args:
+            messages (Sequence[LLMMessage]): A list of LLMMessage objects representing the messages.
+
+        Returns:
+            List[int]: The number of tokens of each message.
+        """
+        empty = self._count_unchecked([])
+        return [self._count_unchecked([message]) - empty for message in messages]
+
+    def _count_unchecked(self, messages: Sequence[LLMMessage]) -> int:
+        try:
+            return self.count_messages_token(messages)
+        except LLMTokenLimitException as e:
+            return e.token_count
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from threading import Lock
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+from council.contexts import Consumption
+
+from .llm_exception import LLMRateLimitException
+from .llm_message import LLMMessage
+
+
+class TokenBucket:
+    """
+    A token bucket refilled continuously up to its capacity.
+    Reservations may overdraw the bucket, so that concurrent callers are served in order.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive")
+        self._capacity = capacity
+        self._refill_per_second = refill_per_second
+        self._level = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Take `amount` from the bucket, returning the seconds to wait until it is actually available.
+        Amounts larger than the capacity are capped, to go through once the bucket is full.
+        """
+        self._refill(now)
+        self._level -= min(amount, self._capacity)
+        return 0.0 if self._level >= 0 else -self._level / self._refill_per_second
+
+    def release(self, amount: float) -> None:
+        """
+        Give back a reservation, or adjust one with a negative `amount`.
+        """
+        self._level = min(self._capacity, self._level + min(amount, self._capacity))
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._level = min(self._capacity, self._level + elapsed * self._refill_per_second)
+        self._updated = now
+
+
+class LLMRateLimiter:
+    """
+    Client-side rate limiter for requests per minute and tokens per minute of an LLM.
+
+    Callers reserve capacity before sending a request and wait until it is available,
+    or fail fast with :class:`LLMRateLimitException` when the wait would exceed their deadline.
+    Limiters are shared between LLM instances through :meth:`shared`, keyed by provider and model.
+    """
+
+    _shared: Dict[str, LLMRateLimiter] = {}
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        fail_fast: bool = False,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            requests_per_minute: maximum number of requests per minute, unlimited if None
+            tokens_per_minute: maximum number of estimated tokens per minute, unlimited if None
+            fail_fast: raise instead of waiting when there is no capacity left
+        """
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0) if tokens_per_minute else None
+        self._fail_fast = fail_fast
+        self._lock = Lock()
+
+    @property
+    def requests_per_minute(self) -> Optional[float]:
+        return self._requests.capacity if self._requests is not None else None
+
+    @property
+    def tokens_per_minute(self) -> Optional[float]:
+        return self._tokens.capacity if self._tokens is not None else None
+
+    @property
+    def fail_fast(self) -> bool:
+        return self._fail_fast
+
+    def acquire(self, tokens: int = 0, timeout: Optional[float] = None, llm_name: Optional[str] = None) -> None:
+        """
+        Wait until one request of `tokens` estimated tokens can be sent.
+
+        Args:
+            tokens: estimated number of tokens of the request
+            timeout: maximum number of seconds to wait, e.g. the remaining duration of the caller's budget
+            llm_name: name of the LLM, for error reporting
+
+        Raises:
+            LLMRateLimitException: if the request would have to wait longer than allowed
+        """
+        wait = self._reserve(tokens, timeout, llm_name)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0, timeout: Optional[float] = None, llm_name: Optional[str] = None) -> None:
+        """
+        Asynchronous version of :meth:`acquire`.
+        """
+        wait = self._reserve(tokens, timeout, llm_name)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def adjust(self, tokens: int) -> None:
+        """
+        Correct a previous token estimate once the actual usage is known.
+        A positive value consumes more tokens, a negative one gives tokens back.
+        """
+        if self._tokens is None or tokens == 0:
+            return
+        with self._lock:
+            if tokens > 0:
+                self._tokens.reserve(tokens, time.monotonic())
+            else:
+                self._tokens.release(-tokens)
+
+    def reconcile(self, estimated_tokens: int, consumptions: Sequence[Consumption]) -> None:
+        """
+        Replace the token estimate of a request by its actual total tokens, if reported in its consumptions.
+        """
+        for consumption in consumptions:
+            if consumption.unit == "token" and consumption.kind.endswith(":total_tokens"):
+                self.adjust(int(consumption.value) - estimated_tokens)
+                return
+
+    @staticmethod
+    def estimate_tokens(messages: Sequence[LLMMessage]) -> int:
+        """
+        Rough token estimate of messages, for LLMs without a token counter: about 4 characters per token.
+        """
+        return sum(len(message.content) for message in messages) // 4 + 1
+
+    def _reserve(self, tokens: int, timeout: Optional[float], llm_name: Optional[str]) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+
+            if wait > 0 and (self._fail_fast or (timeout is not None and wait > timeout)):
+                if self._requests is not None:
+                    self._requests.release(1)
+                if self._tokens is not None:
+                    self._tokens.release(tokens)
+                raise LLMRateLimitException(wait, llm_name)
+            return wait
+
+    @classmethod
+    def shared(
+        cls,
+        key: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        fail_fast: bool = False,
+    ) -> LLMRateLimiter:
+        """
+        Get the limiter shared by every LLM with the given key, e.g. `provider:model`.
+        The limiter is created with the given limits on first use.
+
+        Raises:
+            ValueError: if the limiter of the key was created with different limits
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls._shared[key] = LLMRateLimiter(requests_per_minute, tokens_per_minute, fail_fast)
+            elif (limiter.requests_per_minute, limiter.tokens_per_minute, limiter.fail_fast) != (
+                requests_per_minute or None,
+                tokens_per_minute or None,
+                fail_fast,
+            ):
+                raise ValueError(f"rate limiter `{key}` is already configured with different limits")
+            return limiter
+
+    @staticmethod
+    def from_dict(key: str, values: Mapping[str, Any]) -> LLMRateLimiter:
+        """
+        Get the shared limiter from a `rateLimit` section of an LLMConfig YAML file, with keys
+        `requestsPerMinute`, `tokensPerMinute` and `failFast`.
+        """
+        return LLMRateLimiter.shared(
+            key,
+            requests_per_minute=values.get("requestsPerMinute"),
+            tokens_per_minute=values.get("tokensPerMinute"),
+            fail_fast=bool(values.get("failFast", False)),
+        )
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from council.contexts import Budget
+
+from .llm_exception import LLMCallException
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class LLMRetryPolicy:
+    """
+    Exponential backoff with decorrelated jitter between attempts of a failed LLM request.
+
+    Each delay is drawn uniformly between `base_delay` and `multiplier` times the previous delay, capped at
+    `max_delay`, so that parallel workers failing together spread their retries instead of retrying in sync.
+    A wait requested by the provider through :attr:`LLMCallException.retry_after` takes precedence, up to
+    `max_delay`.
+    Retrying stops when the delay would not fit in the remaining duration of the caller's budget.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 3.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            base_delay: delay before the first retry, and minimum delay of the next ones
+            max_delay: maximum delay between two attempts, including the waits requested by the provider
+            multiplier: growth factor of the delay between attempts
+            jitter: randomize the delays, otherwise they grow exponentially
+            respect_retry_after: wait as long as requested by the provider when it says so
+        """
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError("expected 0 <= base_delay <= max_delay")
+        if multiplier < 1.0:
+            raise ValueError("multiplier must be at least 1")
+
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._multiplier = multiplier
+        self._jitter = jitter
+        self._respect_retry_after = respect_retry_after
+
+    def next_delay(self, previous_delay: Optional[float], exception: Optional[Exception] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            previous_delay: the delay before the previous attempt, None before the first retry
+            exception: the exception of the failed attempt
+        """
+        if self._respect_retry_after and isinstance(exception, LLMCallException) and exception.retry_after:
+            # the provider knows best, a little jitter still spreads the waiting workers
+            spread = random.uniform(0.0, 0.1 * exception.retry_after) if self._jitter else 0.0
+            return min(self._max_delay, exception.retry_after + spread)
+
+        if previous_delay is None or previous_delay <= 0:
+            return self._base_delay
+        upper = min(self._max_delay, previous_delay * self._multiplier)
+        if self._jitter:
+            return random.uniform(self._base_delay, max(self._base_delay, upper))
+        return upper
+
+    def can_wait(self, delay: float, budget: Optional[Budget]) -> bool:
+        """
+        Whether an attempt after `delay` seconds would still start before the deadline of the budget.
+        """
+        return budget is None or (not budget.is_expired() and delay < budget.remaining_duration)
+
+    @staticmethod
+    def retry_after_from_headers(headers: Mapping[str, str], status_code: Optional[int] = None) -> Optional[float]:
+        """
+        Parse the wait requested by a provider from its response headers, in seconds.
+
+        Supports `retry-after-ms` and `retry-after` (seconds or HTTP date). For a rate limited (429) response
+        without them, falls back to the OpenAI `x-ratelimit-reset-requests` / `x-ratelimit-reset-tokens`
+        durations (e.g. `6m0s`) of the limit that was hit, as reported by `x-ratelimit-remaining-*`.
+
+        Args:
+            headers: the headers of the response
+            status_code: the status code of the response
+        """
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            try:
+                return max(0.0, float(value) / 1000.0)
+            except ValueError:
+                pass
+
+        value = headers.get("retry-after")
+        if value is not None:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+        if status_code != 429:
+            # the reset durations are sent with every response, only a rate limited one asks to wait for them
+            return None
+
+        resets: Dict[str, float] = {}
+        for limit in ("requests", "tokens"):
+            reset = LLMRetryPolicy._parse_duration(headers.get(f"x-ratelimit-reset-{limit}"))
+            if reset is not None:
+                resets[limit] = reset
+        hit = [reset for limit, reset in resets.items() if headers.get(f"x-ratelimit-remaining-{limit}") == "0"]
+        if len(hit) > 0:
+            return max(hit)
+        # unknown limit hit, the earliest reset lets the next attempt find out
+        return min(resets.values()) if len(resets) > 0 else None
+
+    @staticmethod
+    def _parse_duration(value: Optional[str]) -> Optional[float]:
+        if value is None:
+            return None
+        parts = _DURATION_PATTERN.findall(value)
+        if len(parts) == 0:
+            return None
+        return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
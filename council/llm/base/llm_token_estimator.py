@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import math
+from threading import Lock
+from typing import List, Optional, Sequence
+
+from council.contexts import Consumption
+
+from .llm_exception import LLMTokenLimitException
+from .llm_message import LLMMessage, LLMMessageTokenCounterBase
+
+
+class LLMTokenEstimator(LLMMessageTokenCounterBase):
+    """
+    Offline token counter for models without a local tokenizer, estimating the tokens of a message from its
+    number of characters.
+
+    The estimate is calibrated with the prompt tokens reported by the provider after each request,
+    see :meth:`calibrate`, so that it converges towards the actual tokenizer of the model.
+    Being an estimate, a request is only rejected when exceeding the limit by more than a safety margin,
+    both with and without calibration.
+    """
+
+    MIN_SCALE = 0.5
+    MAX_SCALE = 2.0
+    MAX_OVERHEAD = 4096
+
+    def __init__(
+        self,
+        model: str,
+        limit: int = -1,
+        chars_per_token: float = 4.0,
+        tokens_per_message: int = 4,
+        reply_tokens: int = 3,
+        smoothing: float = 0.1,
+        margin: float = 0.1,
+        min_calibration_tokens: int = 256,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            model: the name of the model
+            limit: the maximum number of tokens of a request, unlimited if not positive
+            chars_per_token: the average number of characters of a token
+            tokens_per_message: the number of tokens formatting each message
+            reply_tokens: the number of tokens priming the reply
+            smoothing: the weight of the latest request when calibrating the estimate, between 0 and 1
+            margin: the fraction of the limit an estimate may exceed before the request is rejected
+            min_calibration_tokens: the minimum estimated content tokens of a request to calibrate the number of
+                characters of a token. Shorter requests calibrate the fixed overhead of a request instead.
+        """
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        if not 0.0 <= smoothing <= 1.0:
+            raise ValueError("smoothing must be between 0 and 1")
+        if margin < 0:
+            raise ValueError("margin must not be negative")
+
+        self._model = model
+        self._limit = limit
+        self._chars_per_token = chars_per_token
+        self._tokens_per_message = tokens_per_message
+        self._reply_tokens = reply_tokens
+        self._smoothing = smoothing
+        self._margin = margin
+        self._min_calibration_tokens = min_calibration_tokens
+        self._scale = 1.0
+        self._overhead = 0.0
+        self._lock = Lock()
+
+    @property
+    def token_limit(self) -> int:
+        return self._limit
+
+    @property
+    def scale(self) -> float:
+        """
+        The calibration factor applied to the tokens estimated from the content of the messages.
+        """
+        return self._scale
+
+    @property
+    def overhead(self) -> float:
+        """
+        The calibrated number of tokens the provider adds to each request, such as its chat template.
+        """
+        return self._overhead
+
+    def count_each_message_token(self, messages: Sequence[LLMMessage]) -> List[int]:
+        scale = self._scale
+        return [math.ceil(self._tokens_per_message + self._content_tokens([message]) * scale) for message in messages]
+
+    def count_messages_token(self, messages: Sequence[LLMMessage]) -> int:
+        result = sum(self.count_each_message_token(messages)) + self._reply_tokens + math.ceil(self._overhead)
+
+        if 0 < self._limit:
+            # a calibration thrown off by unusual requests never rejects a request the plain estimate accepts
+            uncalibrated = math.ceil(self._fixed_tokens(messages) + self._content_tokens(messages))
+            token_count = min(result, uncalibrated)
+            if self._limit * (1.0 + self._margin) < token_count:
+                raise LLMTokenLimitException(
+                    token_count=token_count, limit=self._limit, model=self._model, llm_name=None
+                )
+
+        return result
+
+    def calibrate(self, messages: Sequence[LLMMessage], consumptions: Sequence[Consumption]) -> None:
+        """
+        Move the estimates towards the actual prompt tokens of a request, if reported in its consumptions.
+
+        Requests with enough content calibrate the number of characters of a token, shorter requests calibrate
+        the fixed overhead of a request. Requests with data, such as images or files, are ignored:
+        their tokens are not estimated from the content.
+
+        Args:
+            messages: the messages of the request
+            consumptions: the consumptions of the request
+        """
+        if any(message.has_data for message in messages):
+            return
+
+        actual_tokens = self._prompt_tokens(consumptions)
+        if actual_tokens is None or actual_tokens <= 0:
+            return
+
+        content_tokens = self._content_tokens(messages)
+        fixed_tokens = self._fixed_tokens(messages)
+        with self._lock:
+            if content_tokens * self._scale >= self._min_calibration_tokens:
+                target = (actual_tokens - fixed_tokens - self._overhead) / content_tokens
+                target = min(self.MAX_SCALE, max(self.MIN_SCALE, target))
+                self._scale += self._smoothing * (target - self._scale)
+            else:
+                target = actual_tokens - fixed_tokens - content_tokens * self._scale
+                target = min(self.MAX_OVERHEAD, max(0.0, target))
+                self._overhead += self._smoothing * (target - self._overhead)
+
+    def _content_tokens(self, messages: Sequence[LLMMessage]) -> float:
+        return sum(len(message.content) for message in messages) / self._chars_per_token
+
+    def _fixed_tokens(self, messages: Sequence[LLMMessage]) -> int:
+        return len(messages) * self._tokens_per_message + self._reply_tokens
+
+    @staticmethod
+    def _prompt_tokens(consumptions: Sequence[Consumption]) -> Optional[int]:
+        # includes the cached prompt tokens, reported separately by some providers
+        tokens = [
+            int(consumption.value)
+            for consumption in consumptions
+            if consumption.unit == "token" and consumption.kind.endswith("prompt_tokens")
+        ]
+        return sum(tokens) if len(tokens) > 0 else None
@@ -1,8 +1,8 @@
-from typing import Any, Optional, Sequence
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
 
 from council.contexts import Budget, ContextBase, LLMContext, Monitored
 
-from .llm_base import LLMBase, LLMResult
+from .llm_base import LLMBase, LLMResult, LLMStreamChunk
 from .llm_message import LLMMessage
 
 
@@ -32,3 +32,33 @@ class MonitoredLLM(Monitored[LLMBase]):
         """
         llm_context = LLMContext.from_context(context, self, budget)
         return self._inner.post_chat_request(llm_context, messages, **kwargs)
+
+    async def apost_chat_request(
+        self, context: ContextBase, messages: Sequence[LLMMessage], budget: Optional[Budget] = None, **kwargs: Any
+    ) -> LLMResult:
+        """
+        make an asynchronous call to the wrapped llm, managing the creation of the context.
+        See :meth:`LLMBase.apost_chat_request`
+        """
+        llm_context = LLMContext.from_context(context, self, budget)
+        return await self._inner.apost_chat_request(llm_context, messages, **kwargs)
+
+    def stream_chat_request(
+        self, context: ContextBase, messages: Sequence[LLMMessage], budget: Optional[Budget] = None, **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        """
+        make a streamed call to the wrapped llm, managing the creation of the context.
+        See :meth:`LLMBase.stream_chat_request`
+        """
+        llm_context = LLMContext.from_context(context, self, budget)
+        return self._inner.stream_chat_request(llm_context, messages, **kwargs)
+
+    def astream_chat_request(
+        self, context: ContextBase, messages: Sequence[LLMMessage], budget: Optional[Budget] = None, **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        make an asynchronous streamed call to the wrapped llm, managing the creation of the context.
+        See :meth:`LLMBase.astream_chat_request`
+        """
+        llm_context = LLMContext.from_context(context, self, budget)
+        return self._inner.astream_chat_request(llm_context, messages, **kwargs)
@@ -1,30 +1,98 @@
-from typing import Mapping, Type, Optional
+"""
+Provider packages are imported on first use, so that only the SDKs actually needed by the process are loaded.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, Optional, Type
 
-from .anthropic import AnthropicLLM, AnthropicLLMConfiguration
-from .gemini import GeminiLLM, GeminiLLMConfiguration
-from .groq import GroqLLM, GroqLLMConfiguration
-from .ollama import OllamaLLM, OllamaLLMConfiguration
-from .openai import AzureLLM, AzureChatGPTConfiguration, OpenAILLM, OpenAIChatGPTConfiguration
 from .. import LLMConfigObject, LLMBase, LLMProviders
+from ..llm_rate_limiter import LLMRateLimiter
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicLLM, AnthropicLLMConfiguration
+    from .gemini import GeminiLLM, GeminiLLMConfiguration
+    from .groq import GroqLLM, GroqLLMConfiguration
+    from .ollama import OllamaLLM, OllamaLLMConfiguration
+    from .openai import (
+        AzureLLM,
+        AzureChatGPTConfiguration,
+        FileBatchClient,
+        OpenAIBatchClient,
+        OpenAILLM,
+        OpenAIChatGPTConfiguration,
+    )
 
-_PROVIDER_TO_LLM: Mapping[LLMProviders, Type[LLMBase]] = {
-    LLMProviders.Azure: AzureLLM,
-    LLMProviders.OpenAI: OpenAILLM,
-    LLMProviders.Anthropic: AnthropicLLM,
-    LLMProviders.Gemini: GeminiLLM,
-    LLMProviders.Ollama: OllamaLLM,
-    LLMProviders.Groq: GroqLLM,
+_LAZY_ATTRIBUTES: Mapping[str, str] = {
+    "AnthropicLLM": ".anthropic",
+    "AnthropicLLMConfiguration": ".anthropic",
+    "GeminiLLM": ".gemini",
+    "GeminiLLMConfiguration": ".gemini",
+    "GroqLLM": ".groq",
+    "GroqLLMConfiguration": ".groq",
+    "OllamaLLM": ".ollama",
+    "OllamaLLMConfiguration": ".ollama",
+    "AzureLLM": ".openai",
+    "AzureChatGPTConfiguration": ".openai",
+    "OpenAILLM": ".openai",
+    "OpenAIChatGPTConfiguration": ".openai",
+    "OpenAIBatchClient": ".openai",
+    "FileBatchClient": ".openai",
 }
 
 
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
+
+
+class _LazyProviderMapping(Mapping[LLMProviders, Type[LLMBase]]):
+    """Maps a provider to its LLM class, importing the provider package only when the class is looked up."""
+
+    def __init__(self, names: Mapping[LLMProviders, str]) -> None:
+        self._names = names
+
+    def __getitem__(self, provider: LLMProviders) -> Type[LLMBase]:
+        return __getattr__(self._names[provider])
+
+    def __iter__(self) -> Iterator[LLMProviders]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+_PROVIDER_TO_LLM: Mapping[LLMProviders, Type[LLMBase]] = _LazyProviderMapping(
+    {
+        LLMProviders.Azure: "AzureLLM",
+        LLMProviders.OpenAI: "OpenAILLM",
+        LLMProviders.Anthropic: "AnthropicLLM",
+        LLMProviders.Gemini: "GeminiLLM",
+        LLMProviders.Ollama: "OllamaLLM",
+        LLMProviders.Groq: "GroqLLM",
+    }
+)
+
+
 def _build_llm(llm_config: LLMConfigObject) -> LLMBase:
     provider = llm_config.spec.provider
 
-    llm_class: Optional[Type[LLMBase]] = next(
-        (llm_class for provider_enum, llm_class in _PROVIDER_TO_LLM.items() if provider.is_of_kind(provider_enum)), None
+    provider_enum: Optional[LLMProviders] = next(
+        (provider_enum for provider_enum in _PROVIDER_TO_LLM if provider.is_of_kind(provider_enum)), None
     )
 
-    if llm_class is None:
+    if provider_enum is None:
         raise ValueError(f"Provider `{provider.kind}` not supported by Council")
 
-    return llm_class.from_config(llm_config)
+    llm = _PROVIDER_TO_LLM[provider_enum].from_config(llm_config)
+    if provider.rate_limit is not None:
+        llm.set_rate_limiter(LLMRateLimiter.from_dict(f"{provider.kind.value}:{llm.model_name}", provider.rate_limit))
+    return llm
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import abc
 from abc import ABC
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Union
 
 from anthropic.types import Completion
 
@@ -67,3 +67,22 @@ class AnthropicAPIClientWrapper(ABC):
     @abc.abstractmethod
     def post_chat_request(self, messages: Sequence[LLMMessage]) -> AnthropicAPIClientResult:
         pass
+
+    @abc.abstractmethod
+    async def apost_chat_request(self, messages: Sequence[LLMMessage]) -> AnthropicAPIClientResult:
+        pass
+
+    def stream_chat_request(self, messages: Sequence[LLMMessage]) -> Iterator[Union[str, AnthropicAPIClientResult]]:
+        """
+        Yields the generated text as it arrives, followed by the complete result.
+        Defaults to the complete result only.
+        """
+        yield self.post_chat_request(messages)
+
+    async def astream_chat_request(
+        self, messages: Sequence[LLMMessage]
+    ) -> AsyncIterator[Union[str, AnthropicAPIClientResult]]:
+        """
+        Asynchronous version of :meth:`stream_chat_request`.
+        """
+        yield await self.apost_chat_request(messages)
@@ -1,6 +1,6 @@
-from typing import Sequence
+from typing import Any, Dict, Sequence
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from anthropic._types import NOT_GIVEN
 
 from ...llm_message import LLMMessage, LLMMessageRole
@@ -21,14 +21,22 @@ class AnthropicCompletionLLM(AnthropicAPIClientWrapper):
         and https://docs.anthropic.com/claude/reference/complete_post
     """
 
-    def __init__(self, config: AnthropicLLMConfiguration, client: Anthropic) -> None:
+    def __init__(self, config: AnthropicLLMConfiguration, client: Anthropic, async_client: AsyncAnthropic) -> None:
         self._config = config
         self._client = client
+        self._async_client = async_client
 
     def post_chat_request(self, messages: Sequence[LLMMessage]) -> AnthropicAPIClientResult:
-        prompt = self._to_anthropic_messages(messages)
-        result = self._client.completions.create(
-            prompt=prompt,
+        result = self._client.completions.create(**self._create_args(messages))
+        return AnthropicAPIClientResult.from_completion(result)
+
+    async def apost_chat_request(self, messages: Sequence[LLMMessage]) -> AnthropicAPIClientResult:
+        result = await self._async_client.completions.create(**self._create_args(messages))
+        return AnthropicAPIClientResult.from_completion(result)
+
+    def _create_args(self, messages: Sequence[LLMMessage]) -> Dict[str, Any]:
+        return dict(
+            prompt=self._to_anthropic_messages(messages),
             model=self._config.model.unwrap(),
             max_tokens_to_sample=self._config.max_tokens.unwrap(),
             timeout=self._config.timeout.value,
@@ -36,7 +44,6 @@ class AnthropicCompletionLLM(AnthropicAPIClientWrapper):
             top_k=self._config.top_k.unwrap_or(NOT_GIVEN),
             top_p=self._config.top_p.unwrap_or(NOT_GIVEN),
         )
-        return AnthropicAPIClientResult.from_completion(result)
 
     @staticmethod
     def _to_anthropic_messages(messages: Sequence[LLMMessage]) -> str:
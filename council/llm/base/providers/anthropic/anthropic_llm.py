@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Sequence
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
 
-from anthropic import Anthropic, APIStatusError, APITimeoutError
+from anthropic import Anthropic, APIStatusError, APITimeoutError, AsyncAnthropic
 from council.contexts import Consumption, LLMContext
 from council.utils.utils import DurationManager
 
-from ...llm_base import LLMBase, LLMResult
+from ...llm_base import LLMBase, LLMResult, LLMStreamChunk
 from ...llm_exception import LLMCallException, LLMCallTimeoutException
 from ...llm_message import LLMMessage
-from .anthropic import AnthropicAPIClientWrapper, Usage
+from ...llm_retry_policy import LLMRetryPolicy
+from ...llm_token_estimator import LLMTokenEstimator
+from .anthropic import AnthropicAPIClientResult, AnthropicAPIClientWrapper, Usage
 from .anthropic_completion_llm import AnthropicCompletionLLM
 from .anthropic_llm_configuration import AnthropicLLMConfiguration
 from .anthropic_llm_cost import AnthropicConsumptionCalculator
@@ -24,23 +26,88 @@ class AnthropicLLM(LLMBase[AnthropicLLMConfiguration]):
         Args:
             config(AnthropicLLMConfiguration): configuration for the instance
         """
-        super().__init__(name=name or f"{self.__class__.__name__}", configuration=config)
+        model = config.model_name()
+        super().__init__(
+            name=name or f"{self.__class__.__name__}",
+            configuration=config,
+            token_counter=LLMTokenEstimator(
+                model,
+                limit=AnthropicConsumptionCalculator(model).find_context_window() or -1,
+                chars_per_token=3.5,
+            ),
+        )
         self._client = Anthropic(api_key=config.api_key.value, max_retries=0)
+        self._async_client = AsyncAnthropic(api_key=config.api_key.value, max_retries=0)
         self._api = self._get_api_wrapper()
 
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
         try:
             with DurationManager() as timer:
                 response = self._api.post_chat_request(messages=messages)
-            return LLMResult(
-                choices=response.choices,
-                consumptions=self.to_consumptions(timer.duration, response.usage),
-                raw_response=response.raw_response,
-            )
+            return self._to_llm_result(timer.duration, response)
+        except APITimeoutError as e:
+            raise LLMCallTimeoutException(self._configuration.timeout.value, self._name) from e
+        except APIStatusError as e:
+            raise self._to_exception(e) from e
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        try:
+            with DurationManager() as timer:
+                response = await self._api.apost_chat_request(messages=messages)
+            return self._to_llm_result(timer.duration, response)
+        except APITimeoutError as e:
+            raise LLMCallTimeoutException(self._configuration.timeout.value, self._name) from e
+        except APIStatusError as e:
+            raise self._to_exception(e) from e
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        try:
+            with DurationManager() as timer:
+                for item in self._api.stream_chat_request(messages=messages):
+                    if isinstance(item, str):
+                        yield LLMStreamChunk(item)
+                    else:
+                        response = item
+            yield LLMStreamChunk("", self._to_llm_result(timer.duration, response))
         except APITimeoutError as e:
             raise LLMCallTimeoutException(self._configuration.timeout.value, self._name) from e
         except APIStatusError as e:
-            raise LLMCallException(code=e.status_code, error=e.message, llm_name=self._name) from e
+            raise self._to_exception(e) from e
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        try:
+            with DurationManager() as timer:
+                async for item in self._api.astream_chat_request(messages=messages):
+                    if isinstance(item, str):
+                        yield LLMStreamChunk(item)
+                    else:
+                        response = item
+            yield LLMStreamChunk("", self._to_llm_result(timer.duration, response))
+        except APITimeoutError as e:
+            raise LLMCallTimeoutException(self._configuration.timeout.value, self._name) from e
+        except APIStatusError as e:
+            raise self._to_exception(e) from e
+
+    def _to_exception(self, e: APIStatusError) -> LLMCallException:
+        return LLMCallException(
+            code=e.status_code,
+            error=e.message,
+            llm_name=self._name,
+            retry_after=LLMRetryPolicy.retry_after_from_headers(e.response.headers, e.status_code),
+        )
+
+    def _to_llm_result(self, duration: float, response: AnthropicAPIClientResult) -> LLMResult:
+        return LLMResult(
+            choices=response.choices,
+            consumptions=self.to_consumptions(duration, response.usage),
+            raw_response=response.raw_response,
+        )
 
     def to_consumptions(self, duration: float, usage: Usage) -> Sequence[Consumption]:
         model = self._configuration.model_name()
@@ -49,5 +116,7 @@ class AnthropicLLM(LLMBase[AnthropicLLMConfiguration]):
 
     def _get_api_wrapper(self) -> AnthropicAPIClientWrapper:
         if self._configuration is not None and self._configuration.model_name() == "claude-2":
-            return AnthropicCompletionLLM(client=self._client, config=self.configuration)
-        return AnthropicMessagesLLM(client=self._client, config=self.configuration)
+            return AnthropicCompletionLLM(
+                client=self._client, async_client=self._async_client, config=self.configuration
+            )
+        return AnthropicMessagesLLM(client=self._client, async_client=self._async_client, config=self.configuration)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Literal, Sequence
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Literal, Sequence, Union
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from anthropic._types import NOT_GIVEN
 from anthropic.types import MessageParam, TextBlock
 
@@ -21,21 +21,45 @@ class AnthropicMessagesLLM(AnthropicAPIClientWrapper):
         and https://docs.anthropic.com/claude/reference/messages_post
     """
 
-    def __init__(self, config: AnthropicLLMConfiguration, client: Anthropic) -> None:
+    def __init__(self, config: AnthropicLLMConfiguration, client: Anthropic, async_client: AsyncAnthropic) -> None:
         self._config = config
         self._client = client
+        self._async_client = async_client
 
     def post_chat_request(self, messages: Sequence[LLMMessage]) -> AnthropicAPIClientResult:
-        system_params = self._to_anthropic_system_messages(messages)
-        messages_formatted = self._to_anthropic_messages(messages)
-
-        endpoint = (
-            self._client.messages if not self._use_caching(messages) else self._client.beta.prompt_caching.messages
-        )
-
-        completion = endpoint.create(  # type: ignore
-            **system_params,
-            messages=messages_formatted,
+        client = self._client
+        endpoint = client.messages if not self._use_caching(messages) else client.beta.prompt_caching.messages
+        completion = endpoint.create(**self._create_args(messages))  # type: ignore
+        return self._to_result(completion)
+
+    async def apost_chat_request(self, messages: Sequence[LLMMessage]) -> AnthropicAPIClientResult:
+        client = self._async_client
+        endpoint = client.messages if not self._use_caching(messages) else client.beta.prompt_caching.messages
+        completion = await endpoint.create(**self._create_args(messages))  # type: ignore
+        return self._to_result(completion)
+
+    def stream_chat_request(self, messages: Sequence[LLMMessage]) -> Iterator[Union[str, AnthropicAPIClientResult]]:
+        client = self._client
+        endpoint = client.messages if not self._use_caching(messages) else client.beta.prompt_caching.messages
+        with endpoint.stream(**self._create_args(messages)) as stream:  # type: ignore
+            for text in stream.text_stream:
+                yield text
+            yield self._to_result(stream.get_final_message())
+
+    async def astream_chat_request(
+        self, messages: Sequence[LLMMessage]
+    ) -> AsyncIterator[Union[str, AnthropicAPIClientResult]]:
+        client = self._async_client
+        endpoint = client.messages if not self._use_caching(messages) else client.beta.prompt_caching.messages
+        async with endpoint.stream(**self._create_args(messages)) as stream:  # type: ignore
+            async for text in stream.text_stream:
+                yield text
+            yield self._to_result(await stream.get_final_message())
+
+    def _create_args(self, messages: Sequence[LLMMessage]) -> Dict[str, Any]:
+        return dict(
+            **self._to_anthropic_system_messages(messages),
+            messages=self._to_anthropic_messages(messages),
             model=self._config.model.unwrap(),
             max_tokens=self._config.max_tokens.unwrap(),
             timeout=self._config.timeout.value,
@@ -43,8 +67,10 @@ class AnthropicMessagesLLM(AnthropicAPIClientWrapper):
             top_k=self._config.top_k.unwrap_or(NOT_GIVEN),
             top_p=self._config.top_p.unwrap_or(NOT_GIVEN),
         )
-        choices = [content.text for content in completion.content if isinstance(content, TextBlock)]
 
+    @staticmethod
+    def _to_result(completion: Any) -> AnthropicAPIClientResult:
+        choices = [content.text for content in completion.content if isinstance(content, TextBlock)]
         return AnthropicAPIClientResult(
             choices=choices, usage=Usage.from_dict(completion.usage.to_dict()), raw_response=completion.to_dict()
         )
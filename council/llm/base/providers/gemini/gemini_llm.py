@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, List, Sequence, Tuple
+from typing import Any, List, Sequence, Tuple, Union
 
 import google.generativeai as genai  # type: ignore
 from council.contexts import Consumption, LLMContext
 from council.utils.utils import DurationManager
 from google.ai.generativelanguage import FileData
 from google.ai.generativelanguage_v1 import HarmCategory  # type: ignore
-from google.generativeai.types import GenerateContentResponse, HarmBlockThreshold  # type: ignore
+from google.generativeai.types import (  # type: ignore
+    AsyncGenerateContentResponse,
+    GenerateContentResponse,
+    HarmBlockThreshold,
+)
 
 from ...llm_base import LLMBase, LLMResult
 from ...llm_message import LLMMessage, LLMMessageRole
+from ...llm_token_estimator import LLMTokenEstimator
 from .gemini_llm_configuration import GeminiLLMConfiguration
 from .gemini_llm_cost import GeminiConsumptionCalculator
 
@@ -23,7 +28,14 @@ class GeminiLLM(LLMBase[GeminiLLMConfiguration]):
         Args:
             config(GeminiLLMConfiguration): configuration for the instance
         """
-        super().__init__(name=f"{self.__class__.__name__}", configuration=config)
+        model = config.model_name()
+        super().__init__(
+            name=f"{self.__class__.__name__}",
+            configuration=config,
+            token_counter=LLMTokenEstimator(
+                model, limit=GeminiConsumptionCalculator(model, 0).find_context_window() or -1
+            ),
+        )
         genai.configure(api_key=config.api_key.value)
         self._model = genai.GenerativeModel(
             config.model_name(),
@@ -39,7 +51,18 @@ class GeminiLLM(LLMBase[GeminiLLMConfiguration]):
             response = chat.send_message(last)
         return LLMResult(choices=[response.text], consumptions=self.to_consumptions(timer.duration, response))
 
-    def to_consumptions(self, duration: float, response: GenerateContentResponse) -> Sequence[Consumption]:
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        history, last = self._to_chat_history(messages=messages)
+        chat = self._model.start_chat(history=history)
+        with DurationManager() as timer:
+            response = await chat.send_message_async(last)
+        return LLMResult(choices=[response.text], consumptions=self.to_consumptions(timer.duration, response))
+
+    def to_consumptions(
+        self, duration: float, response: Union[GenerateContentResponse, AsyncGenerateContentResponse]
+    ) -> Sequence[Consumption]:
         model = self._configuration.model_name()
         prompt_tokens = response.usage_metadata.prompt_token_count
         completion_tokens = response.usage_metadata.candidates_token_count
@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-from typing import Any, List, Sequence
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
 
 from council.contexts import Consumption, LLMContext
 from council.utils.utils import DurationManager
-from groq import Groq
+from groq import AsyncGroq, Groq
+from groq.types import CompletionUsage
 from groq.types.chat import (
     ChatCompletionAssistantMessageParam,
+    ChatCompletionChunk,
     ChatCompletionMessageParam,
     ChatCompletionSystemMessageParam,
     ChatCompletionUserMessageParam,
 )
 from groq.types.chat.chat_completion import ChatCompletion, Choice
 
-from ...llm_base import LLMBase, LLMResult
+from ...llm_base import LLMBase, LLMResult, LLMStreamChunk
 from ...llm_message import LLMMessage, LLMMessageRole
+from ...llm_token_estimator import LLMTokenEstimator
 from .groq_llm_configuration import GroqLLMConfiguration
 from .groq_llm_cost import GroqConsumptionCalculator
 
@@ -27,8 +30,14 @@ class GroqLLM(LLMBase[GroqLLMConfiguration]):
         Args:
             config(GroqLLMConfiguration): configuration for the instance
         """
-        super().__init__(name=f"{self.__class__.__name__}", configuration=config)
+        model = config.model_name()
+        super().__init__(
+            name=f"{self.__class__.__name__}",
+            configuration=config,
+            token_counter=LLMTokenEstimator(model, limit=GroqConsumptionCalculator(model).find_context_window() or -1),
+        )
         self._client = Groq(api_key=config.api_key.value)
+        self._async_client = AsyncGroq(api_key=config.api_key.value)
 
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
         formatted_messages = self._build_messages_payload(messages)
@@ -41,9 +50,62 @@ class GroqLLM(LLMBase[GroqLLMConfiguration]):
                 **kwargs,
             )
 
+        return self._to_llm_result(timer.duration, response)
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        formatted_messages = self._build_messages_payload(messages)
+
+        with DurationManager() as timer:
+            response = await self._async_client.chat.completions.create(
+                messages=formatted_messages,
+                model=self._configuration.model_name(),
+                **self._configuration.params_to_args(),
+                **kwargs,
+            )
+
+        return self._to_llm_result(timer.duration, response)
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        stream = GroqChatCompletionStream()
+        with DurationManager() as timer:
+            for chunk in self._client.chat.completions.create(**self._stream_args(messages, **kwargs)):
+                content = stream.add(chunk)
+                if content:
+                    yield LLMStreamChunk(content)
+
+        yield LLMStreamChunk("", stream.to_llm_result(timer.duration))
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        stream = GroqChatCompletionStream()
+        with DurationManager() as timer:
+            async for chunk in await self._async_client.chat.completions.create(
+                **self._stream_args(messages, **kwargs)
+            ):
+                content = stream.add(chunk)
+                if content:
+                    yield LLMStreamChunk(content)
+
+        yield LLMStreamChunk("", stream.to_llm_result(timer.duration))
+
+    def _stream_args(self, messages: Sequence[LLMMessage], **kwargs: Any) -> Dict[str, Any]:
+        return dict(
+            messages=self._build_messages_payload(messages),
+            model=self._configuration.model_name(),
+            stream=True,
+            **self._configuration.params_to_args(),
+            **kwargs,
+        )
+
+    def _to_llm_result(self, duration: float, response: ChatCompletion) -> LLMResult:
         return LLMResult(
             choices=self._to_choices(response.choices),
-            consumptions=self._to_consumptions(timer.duration, response),
+            consumptions=self._to_consumptions(duration, response),
             raw_response=response.to_dict(),
         )
 
@@ -69,3 +131,41 @@ class GroqLLM(LLMBase[GroqLLMConfiguration]):
     def _to_consumptions(duration: float, response: ChatCompletion) -> Sequence[Consumption]:
         calculator = GroqConsumptionCalculator(response.model)
         return calculator.get_consumptions(duration, response.usage)
+
+
+class GroqChatCompletionStream:
+    """
+    Accumulates the chunks of a streamed Groq chat completion.
+    Usage statistics are sent by Groq with the last chunk.
+    """
+
+    def __init__(self) -> None:
+        self._model = ""
+        self._contents: Dict[int, List[str]] = {}
+        self._usage: Optional[CompletionUsage] = None
+        self._last_chunk: Optional[ChatCompletionChunk] = None
+
+    def add(self, chunk: ChatCompletionChunk) -> str:
+        """
+        Add a chunk, returning the content generated for the first choice.
+        """
+        self._model = self._model or chunk.model
+        self._last_chunk = chunk
+        if chunk.x_groq is not None and chunk.x_groq.usage is not None:
+            self._usage = chunk.x_groq.usage
+
+        content = ""
+        for choice in chunk.choices:
+            delta = choice.delta.content or ""
+            self._contents.setdefault(choice.index, []).append(delta)
+            if choice.index == 0:
+                content += delta
+        return content
+
+    def to_llm_result(self, duration: float) -> LLMResult:
+        calculator = GroqConsumptionCalculator(self._model)
+        return LLMResult(
+            choices=["".join(self._contents[index]) for index in sorted(self._contents)],
+            consumptions=calculator.get_consumptions(duration, self._usage),
+            raw_response=self._last_chunk.to_dict() if self._last_chunk is not None else None,
+        )
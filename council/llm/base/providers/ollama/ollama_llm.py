@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, List, Mapping, Optional, Sequence, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Sequence, Union
 
 from council.contexts import Consumption, LLMContext
 from council.utils.utils import DurationManager
-from ollama import Client
+from ollama import AsyncClient, Client
 from ollama._types import Message, Options
 
-from ...llm_base import LLMBase, LLMResult
+from ...llm_base import LLMBase, LLMResult, LLMStreamChunk
 from ...llm_message import LLMMessage
+from ...llm_token_estimator import LLMTokenEstimator
 from .ollama_llm_configuration import OllamaLLMConfiguration
 from .ollama_llm_cost import OllamaConsumptionCalculator
 
@@ -21,9 +22,15 @@ class OllamaLLM(LLMBase[OllamaLLMConfiguration]):
         Args:
             config (OllamaLLMConfiguration): configuration for the instance
         """
-        super().__init__(name=f"{self.__class__.__name__}", configuration=config)
+        # without num_ctx, ollama truncates the prompt to the context window of the model instead of failing
+        super().__init__(
+            name=f"{self.__class__.__name__}",
+            configuration=config,
+            token_counter=LLMTokenEstimator(config.model_name(), limit=config.num_ctx.unwrap_or(-1)),
+        )
 
         self._client = Client()
+        self._async_client = AsyncClient()
 
     @property
     def client(self) -> Client:
@@ -37,6 +44,14 @@ class OllamaLLM(LLMBase[OllamaLLMConfiguration]):
 
         return self._client
 
+    @property
+    def async_client(self) -> AsyncClient:
+        """
+        Asynchronous Ollama Client, see :attr:`client`.
+        """
+
+        return self._async_client
+
     def pull(self) -> Mapping[str, Any]:
         """Download the model from the ollama library."""
         return self.client.pull(model=self.model_name)
@@ -51,20 +66,67 @@ class OllamaLLM(LLMBase[OllamaLLMConfiguration]):
         return self.client.chat(model=self.model_name, messages=[], keep_alive=0)
 
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
-        messages_payload = self._build_messages_payload(messages)
         with DurationManager() as timer:
-            response = self.client.chat(
-                model=self.model_name,
-                messages=messages_payload,
-                stream=False,
-                keep_alive=self._configuration.keep_alive_value,
-                format=self._configuration.format,
-                options=Options(**self._configuration.params_to_options()),  # type: ignore
-            )
+            response = self.client.chat(**self._chat_args(messages))
+
+        return self._to_llm_result(timer.duration, response)
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        with DurationManager() as timer:
+            response = await self.async_client.chat(**self._chat_args(messages))
+
+        return self._to_llm_result(timer.duration, response)
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        contents: List[str] = []
+        response: Mapping[str, Any] = {}
+        with DurationManager() as timer:
+            for response in self.client.chat(**self._chat_args(messages, stream=True)):
+                content = response["message"]["content"]
+                if content:
+                    contents.append(content)
+                    yield LLMStreamChunk(content)
+
+        yield LLMStreamChunk("", self._to_streamed_llm_result(timer.duration, response, contents))
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        contents: List[str] = []
+        response: Mapping[str, Any] = {}
+        with DurationManager() as timer:
+            async for response in await self.async_client.chat(**self._chat_args(messages, stream=True)):
+                content = response["message"]["content"]
+                if content:
+                    contents.append(content)
+                    yield LLMStreamChunk(content)
+
+        yield LLMStreamChunk("", self._to_streamed_llm_result(timer.duration, response, contents))
+
+    def _to_streamed_llm_result(self, duration: float, last: Mapping[str, Any], contents: List[str]) -> LLMResult:
+        # the last streamed response is marked `done` and carries the statistics of the whole request
+        response = dict(last)
+        response["message"] = {**last["message"], "content": "".join(contents)}
+        return self._to_llm_result(duration, response)
+
+    def _chat_args(self, messages: Sequence[LLMMessage], stream: bool = False) -> Dict[str, Any]:
+        return dict(
+            model=self.model_name,
+            messages=self._build_messages_payload(messages),
+            stream=stream,
+            keep_alive=self._configuration.keep_alive_value,
+            format=self._configuration.format,
+            options=Options(**self._configuration.params_to_options()),  # type: ignore
+        )
 
+    def _to_llm_result(self, duration: float, response: Mapping[str, Any]) -> LLMResult:
         return LLMResult(
             choices=self._to_choices(response),
-            consumptions=self._to_consumptions(timer.duration, response),
+            consumptions=self._to_consumptions(duration, response),
             raw_response=dict(response),
         )
 
@@ -2,3 +2,4 @@ from .azure_chat_gpt_configuration import AzureChatGPTConfiguration
 from .azure_llm import AzureLLM
 from .openai_chat_gpt_configuration import OpenAIChatGPTConfiguration
 from .openai_llm import OpenAILLM
+from .openai_batch import FileBatchClient, OpenAIBatchClient
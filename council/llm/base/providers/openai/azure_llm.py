@@ -1,40 +1,44 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 import httpx
-from httpx import HTTPStatusError, TimeoutException
+from typing_extensions import Self
 
 from ...llm_config_object import LLMConfigObject
-from ...llm_exception import LLMCallException, LLMCallTimeoutException
 from .azure_chat_gpt_configuration import AzureChatGPTConfiguration
-from .openai_chat_completions_llm import OpenAIChatCompletionsModel
+from .openai_chat_completions_llm import ChatCompletionsModelProviderBase, OpenAIChatCompletionsModel
 
 
-class AzureOpenAIChatCompletionsModelProvider:
+class AzureOpenAIChatCompletionsModelProvider(ChatCompletionsModelProviderBase):
     """
     Represents an OpenAI language model hosted on Azure.
     """
 
     def __init__(self, config: AzureChatGPTConfiguration, name: Optional[str]) -> None:
+        super().__init__(config, config.timeout.unwrap(), name)
         self.config = config
         self._uri = (
             f"{self.config.api_base.value}/openai/deployments/{self.config.deployment_name.value}/chat/completions"
         )
-        self._name = name
 
     def post_request(self, payload: dict[str, Any]) -> httpx.Response:
-        headers = {"api-key": self.config.api_key.unwrap(), "Content-Type": "application/json"}
-        params = {"api-version": self.config.api_version.value}
+        return self._post(self._uri, self._headers(), payload, params=self._params())
 
-        timeout = self.config.timeout.value
-        try:
-            with httpx.Client(timeout=timeout) as client:
-                return client.post(url=self._uri, headers=headers, params=params, json=payload)
-        except TimeoutException as e:
-            raise LLMCallTimeoutException(timeout, self._name) from e
-        except HTTPStatusError as e:
-            raise LLMCallException(code=e.response.status_code, error=e.response.text, llm_name=self._name) from e
+    async def apost_request(self, payload: dict[str, Any]) -> httpx.Response:
+        return await self._apost(self._uri, self._headers(), payload, params=self._params())
+
+    def stream_request(self, payload: dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        return self._stream(self._uri, self._headers(), payload, params=self._params())
+
+    def astream_request(self, payload: dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        return self._astream(self._uri, self._headers(), payload, params=self._params())
+
+    def _headers(self) -> Dict[str, str]:
+        return {"api-key": self.config.api_key.unwrap(), "Content-Type": "application/json"}
+
+    def _params(self) -> Dict[str, Any]:
+        return {"api-version": self.config.api_version.value}
 
 
 class AzureLLM(OpenAIChatCompletionsModel):
@@ -44,7 +48,34 @@ class AzureLLM(OpenAIChatCompletionsModel):
 
     def __init__(self, config: AzureChatGPTConfiguration, name: Optional[str] = None) -> None:
         name = name or f"{self.__class__.__name__}"
-        super().__init__(config, AzureOpenAIChatCompletionsModelProvider(config, name).post_request, None, name)
+        self._client_provider = AzureOpenAIChatCompletionsModelProvider(config, name)
+        super().__init__(
+            config,
+            self._client_provider.post_request,
+            None,
+            name,
+            async_provider=self._client_provider.apost_request,
+            stream_provider=self._client_provider.stream_request,
+            async_stream_provider=self._client_provider.astream_request,
+        )
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP connections of this LLM.
+        """
+        self._client_provider.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP connections of this LLM, including the asynchronous ones.
+        """
+        await self._client_provider.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
 
     @staticmethod
     def from_env(deployment_name: Optional[str] = None) -> AzureLLM:
@@ -1,9 +1,18 @@
 from abc import ABC
 from typing import Any, Dict, Optional
 
-from council.utils import Parameter, penalty_validator, positive_validator, zero_to_one_validator, zero_to_two_validator
+import httpx
+from council.utils import (
+    Parameter,
+    greater_than_validator,
+    penalty_validator,
+    positive_validator,
+    zero_to_one_validator,
+    zero_to_two_validator,
+)
 
 from ...llm_base import LLMConfigurationBase
+from ...llm_config_object import LLMProvider
 
 
 class ChatGPTConfigurationBase(LLMConfigurationBase, ABC):
@@ -20,6 +29,16 @@ class ChatGPTConfigurationBase(LLMConfigurationBase, ABC):
         self._n = Parameter.int(name="n", required=False, default=1, validator=positive_validator)
         self._presence_penalty = Parameter.float(name="presence_penalty", required=False, validator=penalty_validator)
         self._frequency_penalty = Parameter.float(name="frequency_penalty", required=False, validator=penalty_validator)
+        self._max_connections = Parameter.int(
+            name="max_connections", required=False, default=100, validator=positive_validator
+        )
+        self._max_keepalive_connections = Parameter.int(
+            name="max_keepalive_connections", required=False, default=20, validator=greater_than_validator(-1)
+        )
+        self._keepalive_expiry = Parameter.float(
+            name="keepalive_expiry", required=False, default=5.0, validator=positive_validator
+        )
+        self._http2 = Parameter.bool(name="http2", required=False, default=False)
 
     @property
     def temperature(self) -> Parameter[float]:
@@ -74,6 +93,44 @@ class ChatGPTConfigurationBase(LLMConfigurationBase, ABC):
         """
         return self._frequency_penalty
 
+    @property
+    def max_connections(self) -> Parameter[int]:
+        """
+        Maximum number of concurrent connections in the HTTP connection pool.
+        """
+        return self._max_connections
+
+    @property
+    def max_keepalive_connections(self) -> Parameter[int]:
+        """
+        Maximum number of idle connections kept alive in the HTTP connection pool.
+        """
+        return self._max_keepalive_connections
+
+    @property
+    def keepalive_expiry(self) -> Parameter[float]:
+        """
+        Seconds an idle connection is kept alive before being closed.
+        """
+        return self._keepalive_expiry
+
+    @property
+    def http2(self) -> Parameter[bool]:
+        """
+        Enable HTTP/2 on the HTTP connection pool. Requires the `h2` package.
+        """
+        return self._http2
+
+    def http_limits(self) -> httpx.Limits:
+        """
+        Connection pool limits built from this configuration.
+        """
+        return httpx.Limits(
+            max_connections=self._max_connections.unwrap(),
+            max_keepalive_connections=self._max_keepalive_connections.unwrap(),
+            keepalive_expiry=self._keepalive_expiry.unwrap(),
+        )
+
     def read_env(self, env_var_prefix: str):
         self.temperature.from_env(env_var_prefix + "LLM_TEMPERATURE")
         self.max_tokens.from_env(env_var_prefix + "LLM_MAX_TOKENS")
@@ -81,6 +138,27 @@ class ChatGPTConfigurationBase(LLMConfigurationBase, ABC):
         self.n.from_env(env_var_prefix + "LLM_N")
         self.presence_penalty.from_env(env_var_prefix + "LLM_PRESENCE_PENALTY")
         self.frequency_penalty.from_env(env_var_prefix + "LLM_FREQUENCY_PENALTY")
+        self.max_connections.from_env(env_var_prefix + "LLM_MAX_CONNECTIONS")
+        self.max_keepalive_connections.from_env(env_var_prefix + "LLM_MAX_KEEPALIVE_CONNECTIONS")
+        self.keepalive_expiry.from_env(env_var_prefix + "LLM_KEEPALIVE_EXPIRY")
+        self.http2.from_env(env_var_prefix + "LLM_HTTP2")
+
+    def read_connection_spec(self, provider: LLMProvider) -> None:
+        value: Optional[Any] = provider.get_value("maxConnections")
+        if value is not None:
+            self.max_connections.set(int(value))
+
+        value = provider.get_value("maxKeepaliveConnections")
+        if value is not None:
+            self.max_keepalive_connections.set(int(value))
+
+        value = provider.get_value("keepaliveExpiry")
+        if value is not None:
+            self.keepalive_expiry.set(float(value))
+
+        value = provider.get_value("http2")
+        if value is not None:
+            self.http2.set(str(value).lower() in ["true", "1", "t"])
 
     def build_default_payload(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {}
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import abc
+import json
+import os
+import uuid
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+import httpx
+from httpx import TimeoutException
+
+from ...llm_base import LLMResult
+from ...llm_batch import LLMBatchClientBase, LLMBatchStatus
+from ...llm_exception import LLMCallException, LLMCallTimeoutException, LLMException
+from ...llm_message import LLMMessage
+from ...llm_retry_policy import LLMRetryPolicy
+from .openai_chat_completions_llm import OpenAIChatCompletionsModel, OpenAIChatCompletionsResult
+from .openai_chat_gpt_configuration import OpenAIChatGPTConfiguration
+from .openai_llm import OpenAILLM
+
+ChatCompletionsHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class OpenAIBatchClientBase(LLMBatchClientBase, abc.ABC):
+    """
+    Base class for clients of the OpenAI batch format, joining the output lines back into :class:`LLMResult`
+    with consumptions at batch pricing.
+    See https://platform.openai.com/docs/guides/batch.
+    """
+
+    def __init__(self, llm: OpenAIChatCompletionsModel, url: str = "/v1/chat/completions") -> None:
+        self._llm = llm
+        self._url = url
+
+    def build_request(self, custom_id: str, messages: Sequence[LLMMessage], **kwargs: Any) -> Dict[str, Any]:
+        body = self._llm.build_request_payload(messages, **kwargs)
+        return {"custom_id": custom_id, "method": "POST", "url": self._url, "body": body}
+
+    def results(self, batch_id: str) -> Mapping[str, Union[LLMResult, LLMException]]:
+        return {line["custom_id"]: self._to_result(line) for line in self._read_output(batch_id)}
+
+    @abc.abstractmethod
+    def _read_output(self, batch_id: str) -> List[Dict[str, Any]]:
+        """
+        Read the output and error lines of a completed batch.
+        """
+
+    def _to_result(self, line: Dict[str, Any]) -> Union[LLMResult, LLMException]:
+        response = line.get("response") or {}
+        status_code = int(response.get("status_code", 500))
+        error = line.get("error")
+        if error is not None or status_code != httpx.codes.OK:
+            message = json.dumps(error if error is not None else response.get("body"))
+            return LLMCallException(status_code, message, self._llm.model_name)
+
+        r = OpenAIChatCompletionsResult.from_response(response["body"])
+        return LLMResult(
+            choices=[c.message.content for c in r.choices],
+            consumptions=r.to_consumptions(0.0, batch=True),
+            raw_response=r.raw_response,
+        )
+
+    @staticmethod
+    def _to_jsonl(lines: Sequence[Dict[str, Any]]) -> str:
+        return "".join(json.dumps(line) + "\n" for line in lines)
+
+    @staticmethod
+    def _from_jsonl(content: str) -> List[Dict[str, Any]]:
+        return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+class OpenAIBatchClient(OpenAIBatchClientBase):
+    """
+    Client of the OpenAI batch API, executing requests asynchronously within 24 hours at half the price,
+    outside of the rate limits of the chat completions endpoint.
+    """
+
+    def __init__(self, llm: OpenAILLM, completion_window: str = "24h") -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            llm: the LLM whose configuration (model, api key and host) is used for the requests
+            completion_window: the time frame within which the batch should be processed
+        """
+        super().__init__(llm)
+        config = llm.configuration
+        if not isinstance(config, OpenAIChatGPTConfiguration):
+            raise ValueError(f"OpenAIBatchClient requires an {OpenAIChatGPTConfiguration.__name__}")
+        self._host = config.api_host.unwrap()
+        self._timeout = config.timeout.unwrap()
+        self._headers = {"Authorization": f"Bearer {config.api_key.unwrap()}"}
+        self._completion_window = completion_window
+        self._client = httpx.Client(timeout=self._timeout)
+
+    def submit(self, requests: Sequence[Dict[str, Any]]) -> str:
+        content = self._to_jsonl(requests).encode("utf-8")
+        file = self._request(
+            "POST", "/v1/files", data={"purpose": "batch"}, files={"file": ("batch.jsonl", content)}
+        ).json()
+        batch = self._request(
+            "POST",
+            "/v1/batches",
+            json={"input_file_id": file["id"], "endpoint": self._url, "completion_window": self._completion_window},
+        ).json()
+        return batch["id"]
+
+    def status(self, batch_id: str) -> LLMBatchStatus:
+        return LLMBatchStatus(self._request("GET", f"/v1/batches/{batch_id}").json()["status"])
+
+    def cancel(self, batch_id: str) -> None:
+        self._request("POST", f"/v1/batches/{batch_id}/cancel")
+
+    def close(self) -> None:
+        """
+        Close the HTTP client of this batch client.
+        """
+        self._client.close()
+
+    def _read_output(self, batch_id: str) -> List[Dict[str, Any]]:
+        batch = self._request("GET", f"/v1/batches/{batch_id}").json()
+        lines: List[Dict[str, Any]] = []
+        for file_id in [batch.get("output_file_id"), batch.get("error_file_id")]:
+            if file_id is not None:
+                lines.extend(self._from_jsonl(self._request("GET", f"/v1/files/{file_id}/content").text))
+        return lines
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        try:
+            response = self._client.request(method, self._host + path, headers=self._headers, **kwargs)
+        except TimeoutException as e:
+            raise LLMCallTimeoutException(timeout=self._timeout, llm_name=self._llm.model_name) from e
+        if response.status_code != httpx.codes.OK:
+            raise LLMCallException(
+                response.status_code,
+                response.text,
+                self._llm.model_name,
+                retry_after=LLMRetryPolicy.retry_after_from_headers(response.headers, response.status_code),
+            )
+        return response
+
+
+class FileBatchClient(OpenAIBatchClientBase):
+    """
+    Local stand-in of the OpenAI batch API, e.g. for tests.
+
+    Each batch is a `<batch_id>.input.jsonl` file in `directory`, completed once its `<batch_id>.output.jsonl`
+    file exists. The output is written by :meth:`complete`, automatically on the first status check
+    when a `handler` is given.
+    """
+
+    def __init__(
+        self, llm: OpenAIChatCompletionsModel, directory: str, handler: Optional[ChatCompletionsHandler] = None
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            llm: the LLM whose configuration is used to build the requests
+            directory: the directory of the batch files
+            handler: maps the body of a chat completions request to the body of its response
+        """
+        super().__init__(llm)
+        self._directory = directory
+        self._handler = handler
+        os.makedirs(directory, exist_ok=True)
+
+    def submit(self, requests: Sequence[Dict[str, Any]]) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        with open(self._path(batch_id, "input"), "w", encoding="utf-8") as f:
+            f.write(self._to_jsonl(requests))
+        return batch_id
+
+    def status(self, batch_id: str) -> LLMBatchStatus:
+        if not os.path.exists(self._path(batch_id, "input")):
+            raise LLMCallException(404, f"batch {batch_id} not found", self._llm.model_name)
+        if os.path.exists(self._path(batch_id, "output")):
+            return LLMBatchStatus.Completed
+        if self._handler is not None:
+            self.complete(batch_id, self._handler)
+            return LLMBatchStatus.Completed
+        return LLMBatchStatus.InProgress
+
+    def complete(self, batch_id: str, handler: ChatCompletionsHandler) -> None:
+        """
+        Write the output of a batch, answering each request with `handler`.
+        A request for which the handler raises an :class:`LLMCallException` is written as failed.
+        """
+        with open(self._path(batch_id, "input"), "r", encoding="utf-8") as f:
+            requests = self._from_jsonl(f.read())
+
+        lines = []
+        for request in requests:
+            try:
+                response = {"status_code": 200, "body": handler(request["body"])}
+            except LLMCallException as e:
+                response = {"status_code": e.code, "body": {"error": {"message": e.error}}}
+            line_id = f"batch_req_{uuid.uuid4().hex}"
+            lines.append({"id": line_id, "custom_id": request["custom_id"], "response": response})
+
+        with open(self._path(batch_id, "output"), "w", encoding="utf-8") as f:
+            f.write(self._to_jsonl(lines))
+
+    def _read_output(self, batch_id: str) -> List[Dict[str, Any]]:
+        with open(self._path(batch_id, "output"), "r", encoding="utf-8") as f:
+            return self._from_jsonl(f.read())
+
+    def _path(self, batch_id: str, kind: str) -> str:
+        return os.path.join(self._directory, f"{batch_id}.{kind}.jsonl")
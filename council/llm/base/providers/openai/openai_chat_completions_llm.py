@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Protocol, Sequence
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Protocol, Sequence
+from weakref import WeakKeyDictionary
 
 import httpx
 from council.contexts import Consumption, LLMContext
+from council.utils import on_loop_close
 from council.utils.utils import DurationManager, truncate_dict_values_to_str
+from httpx import HTTPStatusError, TimeoutException
 
-from ...llm_base import LLMBase, LLMResult
-from ...llm_exception import LLMCallException
+from ...llm_base import LLMBase, LLMResult, LLMStreamChunk
+from ...llm_exception import LLMCallException, LLMCallTimeoutException
 from ...llm_message import LLMMessage, LLMMessageTokenCounterBase
+from ...llm_retry_policy import LLMRetryPolicy
 from .chat_gpt_configuration import ChatGPTConfigurationBase
 from .openai_llm_cost import OpenAIConsumptionCalculator, Usage
 
@@ -17,6 +24,156 @@ class Provider(Protocol):
     def __call__(self, payload: dict[str, Any]) -> httpx.Response: ...
 
 
+class AsyncProvider(Protocol):
+    async def __call__(self, payload: dict[str, Any]) -> httpx.Response: ...
+
+
+class StreamProvider(Protocol):
+    def __call__(self, payload: dict[str, Any]) -> Iterator[Dict[str, Any]]: ...
+
+
+class AsyncStreamProvider(Protocol):
+    def __call__(self, payload: dict[str, Any]) -> AsyncIterator[Dict[str, Any]]: ...
+
+
+def _parse_server_sent_event(line: str) -> Optional[Dict[str, Any]]:
+    """Parse a `data:` line of a chat completions event stream, ignoring other lines and the `[DONE]` marker."""
+    if not line.startswith("data:"):
+        return None
+    data = line[len("data:") :].strip()
+    if data == "" or data == "[DONE]":
+        return None
+    return json.loads(data)
+
+
+class ChatCompletionsModelProviderBase:
+    """
+    Base class for chat completions providers sharing a pooled, keep-alive HTTP client.
+    The client is created on first use and reused for every request until :meth:`close` is called.
+    Each running event loop gets its own async client, as its connections are bound to the loop.
+    Close it with :meth:`aclose` before the loop ends, or run the loop with :func:`council.utils.run_async`
+    to close it when the loop ends. The clients of loops closed otherwise are forgotten, not closed.
+    """
+
+    def __init__(self, config: ChatGPTConfigurationBase, timeout: int, name: Optional[str]) -> None:
+        self._config = config
+        self._timeout = timeout
+        self._name = name
+        self._client: Optional[httpx.Client] = None
+        self._async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        The shared HTTP client of this provider.
+        """
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self._timeout, limits=self._config.http_limits(), http2=self._config.http2.unwrap()
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        The shared asynchronous HTTP client of this provider, for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    timeout=self._timeout, limits=self._config.http_limits(), http2=self._config.http2.unwrap()
+                )
+                # forget the clients of loops closed without closing them, their connections can't be closed anymore
+                for closed in [other for other in self._async_clients.keys() if other.is_closed()]:
+                    del self._async_clients[closed]
+                self._async_clients[loop] = client
+                on_loop_close(self._aclose_async_client)
+            return client
+
+    def _post(self, url: str, headers: Dict[str, str], payload: Dict[str, Any], **kwargs: Any) -> httpx.Response:
+        try:
+            return self.client.post(url=url, headers=headers, json=payload, **kwargs)
+        except TimeoutException as e:
+            raise LLMCallTimeoutException(timeout=self._timeout, llm_name=self._name) from e
+        except HTTPStatusError as e:
+            raise self._to_exception(e.response) from e
+
+    async def _apost(self, url: str, headers: Dict[str, str], payload: Dict[str, Any], **kwargs: Any) -> httpx.Response:
+        try:
+            return await self.async_client.post(url=url, headers=headers, json=payload, **kwargs)
+        except TimeoutException as e:
+            raise LLMCallTimeoutException(timeout=self._timeout, llm_name=self._name) from e
+        except HTTPStatusError as e:
+            raise self._to_exception(e.response) from e
+
+    def _stream(
+        self, url: str, headers: Dict[str, str], payload: Dict[str, Any], **kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        try:
+            with self.client.stream("POST", url=url, headers=headers, json=payload, **kwargs) as response:
+                if response.status_code != httpx.codes.OK:
+                    response.read()
+                    raise self._to_exception(response)
+                for line in response.iter_lines():
+                    event = _parse_server_sent_event(line)
+                    if event is not None:
+                        yield event
+        except TimeoutException as e:
+            raise LLMCallTimeoutException(timeout=self._timeout, llm_name=self._name) from e
+
+    async def _astream(
+        self, url: str, headers: Dict[str, str], payload: Dict[str, Any], **kwargs: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            async with self.async_client.stream("POST", url=url, headers=headers, json=payload, **kwargs) as response:
+                if response.status_code != httpx.codes.OK:
+                    await response.aread()
+                    raise self._to_exception(response)
+                async for line in response.aiter_lines():
+                    event = _parse_server_sent_event(line)
+                    if event is not None:
+                        yield event
+        except TimeoutException as e:
+            raise LLMCallTimeoutException(timeout=self._timeout, llm_name=self._name) from e
+
+    def _to_exception(self, response: httpx.Response) -> LLMCallException:
+        return LLMCallException(
+            code=response.status_code,
+            error=response.text,
+            llm_name=self._name,
+            retry_after=LLMRetryPolicy.retry_after_from_headers(response.headers, response.status_code),
+        )
+
+    def close(self) -> None:
+        """
+        Close the shared HTTP client and release its pooled connections.
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client and the async client of the running event loop,
+        releasing their pooled connections.
+        """
+        self.close()
+        await self._aclose_async_client()
+
+    async def _aclose_async_client(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            async_client = self._async_clients.pop(loop, None)
+        if async_client is not None:
+            await async_client.aclose()
+
+
 class Message:
     def __init__(self, role: str, content: str) -> None:
         self._content = content
@@ -91,8 +248,8 @@ class OpenAIChatCompletionsResult:
     def raw_response(self) -> Dict[str, Any]:
         return self._raw_response
 
-    def to_consumptions(self, duration: float) -> Sequence[Consumption]:
-        consumption_calculator = OpenAIConsumptionCalculator(self.model)
+    def to_consumptions(self, duration: float, batch: bool = False) -> Sequence[Consumption]:
+        consumption_calculator = OpenAIConsumptionCalculator(self.model, batch=batch)
         return consumption_calculator.get_consumptions(duration, self.usage)
 
     @staticmethod
@@ -106,6 +263,52 @@ class OpenAIChatCompletionsResult:
         return OpenAIChatCompletionsResult(_id, _object, _created, _model, _choices, _usage, response)
 
 
+class OpenAIChatCompletionsStream:
+    """
+    Accumulates the events of a streamed chat completions response into a complete response.
+    """
+
+    def __init__(self) -> None:
+        self._response: Dict[str, Any] = {}
+        self._contents: Dict[int, List[str]] = {}
+        self._finish_reasons: Dict[int, Any] = {}
+
+    def add(self, event: Dict[str, Any]) -> str:
+        """
+        Add an event to the response, returning the content generated for the first choice.
+        """
+        for key in ["id", "object", "created", "model"]:
+            if key in event:
+                self._response.setdefault(key, event[key])
+        if event.get("usage") is not None:
+            self._response["usage"] = event["usage"]
+
+        content = ""
+        for choice in event.get("choices", []):
+            index = int(choice.get("index", 0))
+            delta = (choice.get("delta") or {}).get("content") or ""
+            self._contents.setdefault(index, []).append(delta)
+            if choice.get("finish_reason") is not None:
+                self._finish_reasons[index] = choice["finish_reason"]
+            if index == 0:
+                content += delta
+        return content
+
+    def to_result(self) -> OpenAIChatCompletionsResult:
+        response = dict(self._response)
+        response["object"] = "chat.completion"
+        response["choices"] = [
+            {
+                "index": index,
+                "finish_reason": self._finish_reasons.get(index),
+                "message": {"role": "assistant", "content": "".join(self._contents[index])},
+            }
+            for index in sorted(self._contents)
+        ]
+        response.setdefault("usage", {"completion_tokens": 0, "prompt_tokens": 0, "total_tokens": 0})
+        return OpenAIChatCompletionsResult.from_response(response)
+
+
 class OpenAIChatCompletionsModel(LLMBase[ChatGPTConfigurationBase]):
     """
     Represents an OpenAI language model hosted on Azure.
@@ -117,15 +320,19 @@ class OpenAIChatCompletionsModel(LLMBase[ChatGPTConfigurationBase]):
         provider: Provider,
         token_counter: Optional[LLMMessageTokenCounterBase],
         name: Optional[str] = None,
+        async_provider: Optional[AsyncProvider] = None,
+        stream_provider: Optional[StreamProvider] = None,
+        async_stream_provider: Optional[AsyncStreamProvider] = None,
     ) -> None:
         super().__init__(configuration=config, token_counter=token_counter, name=name)
         self._provider = provider
+        self._async_provider = async_provider
+        self._stream_provider = stream_provider
+        self._async_stream_provider = async_stream_provider
 
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
 
-        payload = self._build_payload(messages)
-        for key, value in kwargs.items():
-            payload[key] = value
+        payload = self.build_request_payload(messages, **kwargs)
 
         context.logger.debug(
             f'message="Sending chat GPT completions request to {self._name}" payload="{truncate_dict_values_to_str(payload, 100)}"'
@@ -135,16 +342,107 @@ class OpenAIChatCompletionsModel(LLMBase[ChatGPTConfigurationBase]):
         context.logger.debug(
             f'message="Got chat GPT completions result from {self._name}" id="{r.id}" model="{r.model}" {r.usage}'
         )
+        return self._to_llm_result(r, timer.duration)
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        if self._async_provider is None:
+            return await super()._apost_chat_request(context, messages, **kwargs)
+
+        payload = self.build_request_payload(messages, **kwargs)
+
+        context.logger.debug(
+            f'message="Sending async chat GPT completions request to {self._name}" payload="{truncate_dict_values_to_str(payload, 100)}"'
+        )
+        with DurationManager() as timer:
+            r = self._to_result(await self._async_provider.__call__(payload))
+        context.logger.debug(
+            f'message="Got chat GPT completions result from {self._name}" id="{r.id}" model="{r.model}" {r.usage}'
+        )
+        return self._to_llm_result(r, timer.duration)
+
+    def _stream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> Iterator[LLMStreamChunk]:
+        if self._stream_provider is None:
+            yield from super()._stream_chat_request(context, messages, **kwargs)
+            return
+
+        payload = self._build_stream_payload(messages, **kwargs)
+        context.logger.debug(
+            f'message="Sending streamed chat GPT completions request to {self._name}" payload="{truncate_dict_values_to_str(payload, 100)}"'
+        )
+        stream = OpenAIChatCompletionsStream()
+        with DurationManager() as timer:
+            for event in self._stream_provider.__call__(payload):
+                content = stream.add(event)
+                if content:
+                    yield LLMStreamChunk(content)
+        r = stream.to_result()
+        context.logger.debug(
+            f'message="Got streamed chat GPT completions result from {self._name}" id="{r.id}" model="{r.model}" {r.usage}'
+        )
+        yield LLMStreamChunk("", self._to_llm_result(r, timer.duration))
+
+    async def _astream_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[LLMStreamChunk]:
+        if self._async_stream_provider is None:
+            async for chunk in super()._astream_chat_request(context, messages, **kwargs):
+                yield chunk
+            return
+
+        payload = self._build_stream_payload(messages, **kwargs)
+        context.logger.debug(
+            f'message="Sending async streamed chat GPT completions request to {self._name}" payload="{truncate_dict_values_to_str(payload, 100)}"'
+        )
+        stream = OpenAIChatCompletionsStream()
+        with DurationManager() as timer:
+            async for event in self._async_stream_provider.__call__(payload):
+                content = stream.add(event)
+                if content:
+                    yield LLMStreamChunk(content)
+        r = stream.to_result()
+        context.logger.debug(
+            f'message="Got streamed chat GPT completions result from {self._name}" id="{r.id}" model="{r.model}" {r.usage}'
+        )
+        yield LLMStreamChunk("", self._to_llm_result(r, timer.duration))
+
+    def build_request_payload(self, messages: Sequence[LLMMessage], **kwargs: Any) -> Dict[str, Any]:
+        """
+        Build the body of a chat completions request, e.g. for a batch input file.
+        """
+        payload = self._build_payload(messages)
+        for key, value in kwargs.items():
+            payload[key] = value
+        return payload
+
+    def _build_stream_payload(self, messages: Sequence[LLMMessage], **kwargs: Any) -> Dict[str, Any]:
+        payload = self.build_request_payload(messages, **kwargs)
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    @staticmethod
+    def _to_llm_result(r: OpenAIChatCompletionsResult, duration: float) -> LLMResult:
         return LLMResult(
             choices=[c.message.content for c in r.choices],
-            consumptions=r.to_consumptions(timer.duration),
+            consumptions=r.to_consumptions(duration),
             raw_response=r.raw_response,
         )
 
     def _post_request(self, payload) -> OpenAIChatCompletionsResult:
-        response = self._provider.__call__(payload)
+        return self._to_result(self._provider.__call__(payload))
+
+    def _to_result(self, response: httpx.Response) -> OpenAIChatCompletionsResult:
         if response.status_code != httpx.codes.OK:
-            raise LLMCallException(response.status_code, response.text, self._name)
+            raise LLMCallException(
+                response.status_code,
+                response.text,
+                self._name,
+                retry_after=LLMRetryPolicy.retry_after_from_headers(response.headers, response.status_code),
+            )
 
         return OpenAIChatCompletionsResult.from_response(response.json())
 
@@ -122,4 +122,5 @@ class OpenAIChatGPTConfiguration(ChatGPTConfigurationBase):
         timeout = spec.provider.get_value("timeout")
         if timeout is not None:
             config.timeout.set(int(timeout))
+        config.read_connection_spec(spec.provider)
         return config
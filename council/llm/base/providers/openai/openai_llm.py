@@ -1,42 +1,51 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 import httpx
-from httpx import HTTPStatusError, TimeoutException
+from typing_extensions import Self
 
 from ...llm_config_object import LLMConfigObject
-from ...llm_exception import LLMCallException, LLMCallTimeoutException
-from .openai_chat_completions_llm import OpenAIChatCompletionsModel
+from .openai_chat_completions_llm import ChatCompletionsModelProviderBase, OpenAIChatCompletionsModel
 from .openai_chat_gpt_configuration import OpenAIChatGPTConfiguration
 from .openai_token_counter import OpenAITokenCounter
 
 
-class OpenAIChatCompletionsModelProvider:
+class OpenAIChatCompletionsModelProvider(ChatCompletionsModelProviderBase):
     """
-    Represents an OpenAI language model hosted on Azure.
+    Represents an OpenAI language model hosted on OpenAI.
     """
 
     def __init__(self, config: OpenAIChatGPTConfiguration, name: Optional[str] = None) -> None:
+        super().__init__(config, config.timeout.unwrap(), name)
         self.config = config
         bearer = f"Bearer {config.api_key.unwrap()}"
         self._headers = {"Authorization": bearer, "Content-Type": "application/json"}
-        self._name = name
+        self._uri = config.api_host.unwrap() + "/v1/chat/completions"
 
     def post_request(self, payload: dict[str, Any]) -> httpx.Response:
         """
         Posts a request to the OpenAI chat completions endpoint.
         """
-        uri = self.config.api_host.unwrap() + "/v1/chat/completions"
+        return self._post(self._uri, self._headers, payload)
 
-        timeout = self.config.timeout.unwrap()
-        try:
-            with httpx.Client(timeout=timeout) as client:
-                return client.post(url=uri, headers=self._headers, json=payload)
-        except TimeoutException as e:
-            raise LLMCallTimeoutException(timeout=timeout, llm_name=self._name) from e
-        except HTTPStatusError as e:
-            raise LLMCallException(code=e.response.status_code, error=e.response.text, llm_name=self._name) from e
+    async def apost_request(self, payload: dict[str, Any]) -> httpx.Response:
+        """
+        Posts an asynchronous request to the OpenAI chat completions endpoint.
+        """
+        return await self._apost(self._uri, self._headers, payload)
+
+    def stream_request(self, payload: dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Posts a streamed request to the OpenAI chat completions endpoint, yielding each server-sent event.
+        """
+        return self._stream(self._uri, self._headers, payload)
+
+    def astream_request(self, payload: dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Posts an asynchronous streamed request to the OpenAI chat completions endpoint.
+        """
+        return self._astream(self._uri, self._headers, payload)
 
 
 class OpenAILLM(OpenAIChatCompletionsModel):
@@ -46,13 +55,35 @@ class OpenAILLM(OpenAIChatCompletionsModel):
 
     def __init__(self, config: OpenAIChatGPTConfiguration, name: Optional[str] = None) -> None:
         name = name or f"{self.__class__.__name__}"
+        self._client_provider = OpenAIChatCompletionsModelProvider(config, name)
         super().__init__(
             config,
-            OpenAIChatCompletionsModelProvider(config, name).post_request,
+            self._client_provider.post_request,
             token_counter=OpenAITokenCounter.from_model(config.model.unwrap_or("")),
             name=name,
+            async_provider=self._client_provider.apost_request,
+            stream_provider=self._client_provider.stream_request,
+            async_stream_provider=self._client_provider.astream_request,
         )
 
+    def close(self) -> None:
+        """
+        Close the pooled HTTP connections of this LLM.
+        """
+        self._client_provider.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP connections of this LLM, including the asynchronous ones.
+        """
+        await self._client_provider.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
     @staticmethod
     def from_env(model: Optional[str] = None, api_host: Optional[str] = None) -> OpenAILLM:
         config: OpenAIChatGPTConfiguration = OpenAIChatGPTConfiguration.from_env(model=model, api_host=api_host)
@@ -85,6 +85,13 @@ class OpenAIConsumptionCalculator(LLMConsumptionCalculatorBase):
     COSTS_gpt_4o_FAMILY: Mapping[str, LLMCostCard] = _cost_manager.get_cost_map("gpt_4o_family")
     COSTS_o1_FAMILY: Mapping[str, LLMCostCard] = _cost_manager.get_cost_map("o1_family")
 
+    BATCH_DISCOUNT: Final[float] = 0.5
+    """Cost ratio of requests executed through the batch API"""
+
+    def __init__(self, model: str, batch: bool = False) -> None:
+        super().__init__(model)
+        self.batch = batch
+
     def find_model_costs(self) -> Optional[LLMCostCard]:
         if self.model.startswith("o1"):
             return self.COSTS_o1_FAMILY.get(self.model)
@@ -103,7 +110,7 @@ class OpenAIConsumptionCalculator(LLMConsumptionCalculatorBase):
             - 1 call
             - specified duration
             - cache_read_prompt, prompt, reasoning, completion and total tokens
-            - corresponding costs if LLMCostCard can be found
+            - corresponding costs if LLMCostCard can be found, discounted for batch requests
         """
         consumptions = self.get_base_consumptions(duration, usage) + self.get_cost_consumptions(usage)
         return self.filter_zeros(consumptions)  # could occur for cache/reasoning tokens
@@ -128,6 +135,11 @@ class OpenAIConsumptionCalculator(LLMConsumptionCalculatorBase):
         prompt_tokens_cost = cost_card.input_cost(usage.prompt_tokens)
         reasoning_tokens_cost = cost_card.output_cost(usage.reasoning_tokens)
         completion_tokens_cost = cost_card.output_cost(usage.completion_tokens)
+        if self.batch:
+            cached_tokens_cost *= self.BATCH_DISCOUNT
+            prompt_tokens_cost *= self.BATCH_DISCOUNT
+            reasoning_tokens_cost *= self.BATCH_DISCOUNT
+            completion_tokens_cost *= self.BATCH_DISCOUNT
         total_cost = sum([cached_tokens_cost, prompt_tokens_cost, reasoning_tokens_cost, completion_tokens_cost])
 
         return [
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Mapping, Optional, Sequence
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 import tiktoken
 from tiktoken import Encoding
 
+from ...llm_context_window import LLMContextWindow
 from ...llm_exception import LLMTokenLimitException
 from ...llm_message import LLMMessage, LLMMessageTokenCounterBase
 
 logger = logging.getLogger(__name__)
 
+# encode_batch starts a pool of 8 threads on each call, costing as much as encoding a few thousand characters
+# inline, and only pays off on multiple cores once the texts take milliseconds to encode (~10ms per 100k chars)
+_BATCH_ENCODE_MIN_CHARS = 100_000
+
 
 class TokenInfo:
     def __init__(self, *, tokens_limit: int, tokens_per_message: int, tokens_per_name: int) -> None:
@@ -55,6 +62,9 @@ class OpenAITokenCounter(LLMMessageTokenCounterBase):
     See https://github.com/openai/openai-python/blob/main/chatml.md for information on
         how messages are converted to tokens.
         https://platform.openai.com/docs/models/overview for tokens
+
+    The token count of recent messages is kept in a bounded LRU cache keyed by role, name and content,
+    so that only new messages are encoded when a conversation grows or a request is retried.
     """
 
     LATEST_ALIASES: Mapping[str, str] = {
@@ -69,27 +79,72 @@ class OpenAITokenCounter(LLMMessageTokenCounterBase):
     }
 
     def __init__(
-        self, encoding: Encoding, model: str, limit: int = -1, tokens_per_message: int = 0, tokens_per_name: int = 0
+        self,
+        encoding: Encoding,
+        model: str,
+        limit: int = -1,
+        tokens_per_message: int = 0,
+        tokens_per_name: int = 0,
+        cache_size: int = 4096,
     ) -> None:
         self._encoding = encoding
         self._model = model
         self._limit = limit
         self._tokens_per_message = tokens_per_message
         self._tokens_per_name = tokens_per_name
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Tuple[str, Optional[str], str], int] = OrderedDict()
+        self._lock = Lock()
 
     def count_message_token(self, message: LLMMessage) -> int:
-        num_tokens = self._tokens_per_message
-        num_tokens += len(self._encoding.encode(message.content))
-        num_tokens += len(self._encoding.encode(message.role.name))
-        if message.name is not None:
-            num_tokens += len(self._encoding.encode(message.name))
-            num_tokens += self._tokens_per_name
-        return num_tokens
+        return self.count_each_message_token([message])[0]
+
+    def count_each_message_token(self, messages: Sequence[LLMMessage]) -> List[int]:
+        """
+        Counts the tokens of each message, encoding only the messages missing from the cache.
+        """
+        keys = [(message.role.name, message.name, message.content) for message in messages]
+        counts: Dict[Tuple[str, Optional[str], str], int] = {}
+        with self._lock:
+            for key in keys:
+                count = self._cache.get(key)
+                if count is not None:
+                    self._cache.move_to_end(key)
+                    counts[key] = count
+
+        missing = [key for key in dict.fromkeys(keys) if key not in counts]
+        if len(missing) > 0:
+            counts.update(zip(missing, self._encode_count(missing)))
+            with self._lock:
+                for key in missing:
+                    self._cache[key] = counts[key]
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        return [counts[key] for key in keys]
+
+    def _encode_count(self, keys: Sequence[Tuple[str, Optional[str], str]]) -> List[int]:
+        texts: List[str] = []
+        for role, name, content in keys:
+            texts.extend([content, role] if name is None else [content, role, name])
+        if sum(len(text) for text in texts) >= _BATCH_ENCODE_MIN_CHARS:
+            encoded = self._encoding.encode_batch(texts)
+        else:
+            encoded = [self._encoding.encode(text) for text in texts]
+
+        result = []
+        index = 0
+        for _, name, _ in keys:
+            size = 2 if name is None else 3
+            num_tokens = self._tokens_per_message + sum(len(tokens) for tokens in encoded[index : index + size])
+            if name is not None:
+                num_tokens += self._tokens_per_name
+            result.append(num_tokens)
+            index += size
+        return result
 
     def count_messages_token(self, messages: Sequence[LLMMessage]) -> int:
-        result = 0
-        for message in messages:
-            result += self.count_message_token(message)
+        result = sum(self.count_each_message_token(messages))
         result += 3  # every reply is primed with <|start|>assistant<|message|>
 
         if 0 < self._limit < result:
@@ -110,20 +165,11 @@ class OpenAITokenCounter(LLMMessageTokenCounterBase):
             List[LLMMessage]: A filtered list of LLMMessage objects representing the first messages.
 
         """
-        count = 0
         limit = self._limit + 3 - margin
         if limit <= 0:
             return []
-
-        result: List[LLMMessage] = []
-        for message in reversed(messages):
-            token = self.count_message_token(message)
-            if count + token < limit:
-                count += token
-                result.insert(0, message)
-            else:
-                break
-        return result
+        # the window counts the 3 tokens priming the reply, and keeps messages up to max_tokens included
+        return LLMContextWindow(self, messages, pin_system=False).last_messages(limit + 2)
 
     def filter_last_messages(self, messages: Sequence[LLMMessage], margin: int) -> List[LLMMessage]:
         """
@@ -138,20 +184,11 @@ class OpenAITokenCounter(LLMMessageTokenCounterBase):
             List[LLMMessage]: A filtered list of LLMMessage objects representing the first messages.
 
         """
-        count = 0
         limit = self._limit + 3 - margin
         if limit <= 0:
             return []
-
-        result: List[LLMMessage] = []
-        for message in messages:
-            token = self.count_message_token(message)
-            if count + token < limit:
-                count += token
-                result.append(message)
-            else:
-                break
-        return result
+        # the window counts the 3 tokens priming the reply, and keeps messages up to max_tokens included
+        return LLMContextWindow(self, messages, pin_system=False).first_messages(limit + 2)
 
     @property
     def token_limit(self) -> int:
@@ -1,7 +1,9 @@
+from .llm_cache_store import LLMCacheStoreBase, InMemoryLLMCacheStore, SQLiteLLMCacheStore
 from .llm_middleware import (
     LLMRequest,
     LLMResponse,
     LLMMiddleware,
+    LLMAsyncMiddleware,
     LLMMiddlewareChain,
     LLMRetryMiddleware,
     LLMLoggingStrategy,
@@ -10,6 +12,7 @@ from .llm_middleware import (
     LLMTimestampFileLoggingMiddleware,
     LLMCachingMiddleware,
     ExecuteLLMRequest,
+    AsyncExecuteLLMRequest,
 )
 from .llm_response_parser import (
     LLMResponseParser,
@@ -22,6 +25,7 @@ from .llm_response_parser import (
     YAMLBlockResponseParser,
     YAMLResponseParser,
 )
+from .llm_batch import LLMBatchExecutor
 from .llm_function import LLMFunction, LLMFunctionResponse, LLMFunctionError, FunctionOutOfRetryError
 from .llm_function_with_prompt import LLMFunctionWithPrompt
 from .llm_pipeline import (
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+
+from council.llm.base import (
+    LLMBatchClientBase,
+    LLMBatchException,
+    LLMBatchStatus,
+    LLMException,
+    LLMMessage,
+    LLMResult,
+    LLMRetryPolicy,
+)
+
+from .llm_middleware import LLMRequest, LLMResponse
+
+if TYPE_CHECKING:
+    from council.prompt import LLMDatasetObject
+
+
+class LLMBatchExecutor:
+    """
+    Executes many requests through the batch endpoint of a provider, e.g. for offline jobs that can wait
+    for their results at a lower price and outside of the per-request rate limits.
+
+    The batch is polled with a growing delay until it is done, and its results are joined back to the requests
+    by `custom_id`. Failed requests get an :class:`LLMResponse` without result.
+    """
+
+    def __init__(
+        self,
+        client: LLMBatchClientBase,
+        poll_policy: Optional[LLMRetryPolicy] = None,
+        timeout: float = 24 * 3600.0,
+    ) -> None:
+        """
+        Initialize a new instance.
+
+        Args:
+            client: the client of the batch endpoint
+            poll_policy: the delays between two status checks
+            timeout: seconds to wait for a batch before giving up
+        """
+        self._client = client
+        self._poll_policy = (
+            poll_policy if poll_policy is not None else LLMRetryPolicy(base_delay=5.0, max_delay=300.0, multiplier=1.5)
+        )
+        self._timeout = timeout
+        self._submitted: Dict[str, float] = {}
+
+    @property
+    def client(self) -> LLMBatchClientBase:
+        return self._client
+
+    def submit(self, requests: Sequence[LLMRequest]) -> str:
+        """
+        Submit a batch of requests without waiting for it, returning the id of the batch.
+        """
+        custom_ids = self._client.custom_ids(len(requests))
+        lines = [
+            self._client.build_request(custom_id, request.messages, **request.kwargs)
+            for custom_id, request in zip(custom_ids, requests)
+        ]
+        batch_id = self._client.submit(lines)
+        self._submitted[batch_id] = time.monotonic()
+        return batch_id
+
+    def wait(self, batch_id: str, requests: Sequence[LLMRequest]) -> List[LLMResponse]:
+        """
+        Wait for a batch submitted with :meth:`submit`, returning the responses in the order of `requests`.
+
+        Raises:
+            LLMBatchException: if the batch failed, expired, was cancelled or did not complete within the timeout
+        """
+        started = self._submitted.pop(batch_id, time.monotonic())
+        deadline = time.monotonic() + self._timeout
+        delay: Optional[float] = None
+        status = self._client.status(batch_id)
+        while not status.is_done:
+            delay = self._poll_policy.next_delay(delay)
+            if time.monotonic() + delay > deadline:
+                raise LLMBatchException(batch_id, status.value, None)
+            time.sleep(delay)
+            status = self._client.status(batch_id)
+
+        if status == LLMBatchStatus.Failed:
+            raise LLMBatchException(batch_id, status.value, None)
+
+        # an expired or cancelled batch still returns the results of the requests it completed
+        results = self._client.results(batch_id)
+        duration = time.monotonic() - started
+        responses = []
+        for custom_id, request in zip(self._client.custom_ids(len(requests)), requests):
+            result = results.get(custom_id)
+            responses.append(self._to_response(request, result, duration))
+        return responses
+
+    def execute(self, requests: Sequence[LLMRequest]) -> List[LLMResponse]:
+        """
+        Submit a batch of requests and wait for it, see :meth:`wait`.
+        """
+        if len(requests) == 0:
+            return []
+        return self.wait(self.submit(requests), requests)
+
+    def execute_dataset(self, dataset: LLMDatasetObject, **kwargs: Any) -> List[LLMResponse]:
+        """
+        Execute each conversation of a dataset, prefixed with its system prompt if any.
+        """
+        system = [LLMMessage.system_message(dataset.system_prompt)] if dataset.system_prompt is not None else []
+        requests = [
+            LLMRequest.default(system + conversation.messages, **kwargs) for conversation in dataset.conversations
+        ]
+        return self.execute(requests)
+
+    @staticmethod
+    def _to_response(
+        request: LLMRequest, result: Optional[Union[LLMResult, LLMException]], duration: float
+    ) -> LLMResponse:
+        if isinstance(result, LLMResult):
+            request.context.budget.add_consumptions(result.consumptions)
+            return LLMResponse(request, result, duration)
+
+        reason = result if result is not None else "not executed"
+        request.context.logger.warning(f'message="batch request failed" exception="{reason}"')
+        return LLMResponse(request, None, duration)
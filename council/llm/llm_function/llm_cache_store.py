@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from council.contexts import Consumption
+from council.llm.base import LLMResult
+
+
+class LLMCacheStoreBase(abc.ABC):
+    """
+    Abstract base class for a store of cached LLM results, used by :class:`LLMCachingMiddleware`.
+
+    Entries are keyed by :meth:`LLMCachingMiddleware.get_hash` and expire after a sliding time-to-live.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[LLMResult]:
+        """
+        Return the cached result for the given key if any, renewing its lifetime.
+        """
+        pass
+
+    @abc.abstractmethod
+    def put(self, key: str, result: LLMResult) -> None:
+        """
+        Store a result for the given key, evicting the least recently used entries if the store is full.
+        """
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all cached entries.
+        """
+        pass
+
+    async def aget(self, key: str) -> Optional[LLMResult]:
+        """
+        Asynchronous :meth:`get`, used by the asynchronous requests of :class:`LLMCachingMiddleware`.
+        Defaults to running :meth:`get` in a worker thread, not to block the event loop.
+        """
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, result: LLMResult) -> None:
+        """
+        Asynchronous :meth:`put`, used by the asynchronous requests of :class:`LLMCachingMiddleware`.
+        Defaults to running :meth:`put` in a worker thread, not to block the event loop.
+        """
+        await asyncio.to_thread(self.put, key, result)
+
+    @staticmethod
+    def serialize(result: LLMResult) -> str:
+        """
+        Serialize an LLMResult as a JSON string.
+        """
+        return json.dumps(
+            {
+                "choices": list(result.choices),
+                "consumptions": [consumption.to_dict() for consumption in result.consumptions],
+                "raw_response": result.raw_response,
+            },
+            default=str,
+        )
+
+    @staticmethod
+    def deserialize(value: str) -> LLMResult:
+        """
+        Deserialize an LLMResult from a JSON string created with :meth:`serialize`.
+        """
+        values: Dict[str, Any] = json.loads(value)
+        consumptions = [Consumption(item["value"], item["unit"], item["kind"]) for item in values["consumptions"]]
+        return LLMResult(values["choices"], consumptions, values.get("raw_response"))
+
+
+class CacheEntry:
+    """Represents a cached LLM result."""
+
+    def __init__(self, result: LLMResult, ttl: float) -> None:
+        self.result = result
+        self.timestamp = time.time()
+        self.ttl = ttl
+
+    @property
+    def is_expired(self) -> bool:
+        return time.time() - self.timestamp >= self.ttl
+
+    def renew_lifetime(self) -> None:
+        """Update the timestamp to extend the lifetime."""
+        self.timestamp = time.time()
+
+
+class InMemoryLLMCacheStore(LLMCacheStoreBase):
+    """
+    In-process LLM cache store, lost when the process exits. Safe for concurrent use.
+
+    Entries are kept in access order. Since every entry shares the same sliding ttl, access order is also
+    expiry order: expired entries are popped from the front, only touching entries that actually expired.
+    """
+
+    def __init__(self, ttl: float = 300.0, cache_limit_size: int = 10) -> None:
+        """
+        Initialize the in-memory store.
+
+        Args:
+            ttl: Sliding window time-to-live in seconds for cache entries (default: 5 mins)
+            cache_limit_size: Cache limit size in cached entries (default: 10)
+        """
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._ttl = ttl
+        self._cache_limit_size = cache_limit_size
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[LLMResult]:
+        with self._lock:
+            self._remove_expired()
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            entry.renew_lifetime()  # renew on hit
+            self._cache.move_to_end(key)  # move to most recent
+            return entry.result
+
+    def put(self, key: str, result: LLMResult) -> None:
+        with self._lock:
+            self._remove_expired()
+            self._cache[key] = CacheEntry(result=result, ttl=self._ttl)
+            self._cache.move_to_end(key)
+            self._enforce_cache_limit()
+
+    async def aget(self, key: str) -> Optional[LLMResult]:
+        # in-memory lookups don't block, a worker thread would only add latency
+        return self.get(key)
+
+    async def aput(self, key: str, result: LLMResult) -> None:
+        self.put(key, result)
+
+    def _remove_expired(self) -> None:
+        """Remove expired cache entries, oldest first, stopping at the first live entry."""
+        while len(self._cache) > 0:
+            key, entry = next(iter(self._cache.items()))
+            if not entry.is_expired:
+                break
+            del self._cache[key]
+
+    def _enforce_cache_limit(self) -> None:
+        """Remove oldest entries if cache size exceeds limit."""
+        while len(self._cache) > self._cache_limit_size:
+            self._cache.popitem(last=False)  # remove the first (oldest) item
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+class SQLiteLLMCacheStore(LLMCacheStoreBase):
+    """
+    On-disk LLM cache store backed by SQLite, persistent across restarts
+    and safe to share between processes on the same host.
+
+    Notes:
+        * the database runs in WAL mode, so that writes are not blocked by readers of other connections
+        * `get` renews the time-to-live of the entry it reads: lookups are write transactions, serialized with
+          each other and with `put`
+        * a positive `mmap_size` enables SQLite memory-mapped I/O, serving hot entries straight from the page cache
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 24 * 60 * 60.0,
+        cache_limit_size: int = 10_000,
+        mmap_size: int = 0,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the SQLite store, creating the database file if needed.
+
+        Args:
+            path: path of the SQLite database file
+            ttl: Sliding window time-to-live in seconds for cache entries (default: 1 day)
+            cache_limit_size: Cache limit size in cached entries (default: 10000)
+            mmap_size: Maximum number of bytes of the database file to memory-map (default: 0, disabled)
+            busy_timeout: Seconds to wait for a lock held by another process or thread (default: 30)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._path = path
+        self._ttl = ttl
+        self._cache_limit_size = cache_limit_size
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        if mmap_size > 0:
+            self._connection.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        with self._transaction() as cursor:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS llm_cache_expires_at ON llm_cache(expires_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache(accessed_at)")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get(self, key: str) -> Optional[LLMResult]:
+        now = time.time()
+        with self._transaction() as cursor:
+            row = cursor.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                cursor.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            cursor.execute(
+                "UPDATE llm_cache SET expires_at = ?, accessed_at = ? WHERE key = ?", (now + self._ttl, now, key)
+            )
+        return self.deserialize(row[0])
+
+    def put(self, key: str, result: LLMResult) -> None:
+        now = time.time()
+        value = self.serialize(result)
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + self._ttl, now),
+            )
+            cursor.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            cursor.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._cache_limit_size,),
+            )
+
+    def clear(self) -> None:
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM llm_cache")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def _transaction(self) -> _Transaction:
+        return _Transaction(self._connection, self._lock)
+
+
+class _Transaction:
+    """Serializes access to a connection within the process and wraps statements in an immediate transaction."""
+
+    def __init__(self, connection: sqlite3.Connection, lock: Lock) -> None:
+        self._connection = connection
+        self._lock = lock
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self._lock.acquire()
+        try:
+            self._cursor = self._connection.cursor()
+            self._cursor.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._lock.release()
+            raise
+        return self._cursor
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self._connection.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        finally:
+            self._cursor.close()
+            self._lock.release()
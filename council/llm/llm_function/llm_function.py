@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Generic, Iterable, List, Optional, Sequence, Union
+from typing import Any, AsyncIterator, Generic, Iterable, Iterator, List, Optional, Sequence, Union
 
 from council.contexts import Consumption, LLMContext
-from council.llm.base import LLMBase, LLMMessage, LLMMessageRole, LLMParsingException
+from council.llm.base import LLMBase, LLMMessage, LLMMessageRole, LLMParsingException, LLMStreamChunk
 
-from .llm_middleware import LLMMiddleware, LLMMiddlewareChain, LLMRequest, LLMResponse
+from .llm_batch import LLMBatchExecutor
+from .llm_middleware import AnyLLMMiddleware, LLMMiddlewareChain, LLMRequest, LLMResponse
 from .llm_response_parser import LLMResponseParser, T_Response
 
 
@@ -176,7 +177,7 @@ class LLMFunction(Generic[T_Response]):
     def _build_llm_message(message: Union[str, LLMMessage], role: LLMMessageRole) -> LLMMessage:
         return message if isinstance(message, LLMMessage) else LLMMessage(role=role, content=message)
 
-    def add_middleware(self, middleware: LLMMiddleware) -> None:
+    def add_middleware(self, middleware: AnyLLMMiddleware) -> None:
         self._llm_middleware.add_middleware(middleware)
 
     def execute_with_llm_response(
@@ -212,23 +213,45 @@ class LLMFunction(Generic[T_Response]):
         while retry <= self._max_retries:
             llm_messages = llm_messages + new_messages
             request = LLMRequest(context=self._context, messages=llm_messages, **kwargs)
+            llm_response: Optional[LLMResponse] = None
             try:
                 llm_response = self._llm_middleware.execute(request)
                 return LLMFunctionResponse.from_llm_response(llm_response, self._response_parser, previous_responses)
-            except LLMParsingException as e:
-                exceptions.append(e)
-                previous_responses.append(llm_response)
-                new_messages = self._handle_error(e, llm_response, e.message)
-            except LLMFunctionError as e:
-                if not e.retryable:
-                    raise e
-                exceptions.append(e)
-                previous_responses.append(llm_response)
-                new_messages = self._handle_error(e, llm_response, e.message)
             except Exception as e:
-                exceptions.append(e)
-                previous_responses.append(llm_response)
-                new_messages = self._handle_error(e, llm_response, f"Fix the following exception: `{e}`")
+                new_messages = self._handle_attempt_error(e, request, llm_response, exceptions, previous_responses)
+
+            retry += 1
+
+        raise FunctionOutOfRetryError(self._max_retries, exceptions)
+
+    async def aexecute_with_llm_response(
+        self,
+        user_message: Optional[Union[str, LLMMessage]] = None,
+        messages: Optional[Iterable[LLMMessage]] = None,
+        **kwargs: Any,
+    ) -> LLMFunctionResponse[T_Response]:
+        """
+        Asynchronous version of :meth:`execute_with_llm_response`, running the middleware chain without blocking
+        the event loop.
+        """
+
+        llm_messages: List[LLMMessage] = self._messages + self._validate_messages(
+            user_message, messages, LLMMessageRole.User, allow_empty_input=True
+        )
+        new_messages: List[LLMMessage] = []
+        exceptions: List[Exception] = []
+        previous_responses: List[LLMResponse] = []
+
+        retry = 0
+        while retry <= self._max_retries:
+            llm_messages = llm_messages + new_messages
+            request = LLMRequest(context=self._context, messages=llm_messages, **kwargs)
+            llm_response: Optional[LLMResponse] = None
+            try:
+                llm_response = await self._llm_middleware.aexecute(request)
+                return LLMFunctionResponse.from_llm_response(llm_response, self._response_parser, previous_responses)
+            except Exception as e:
+                new_messages = self._handle_attempt_error(e, request, llm_response, exceptions, previous_responses)
 
             retry += 1
 
@@ -257,6 +280,128 @@ class LLMFunction(Generic[T_Response]):
         """
         return self.execute_with_llm_response(user_message, messages, **kwargs).response
 
+    async def aexecute(
+        self,
+        user_message: Optional[Union[str, LLMMessage]] = None,
+        messages: Optional[Iterable[LLMMessage]] = None,
+        **kwargs: Any,
+    ) -> T_Response:
+        """
+        Asynchronous version of :meth:`execute`.
+        """
+        return (await self.aexecute_with_llm_response(user_message, messages, **kwargs)).response
+
+    def execute_batch(
+        self,
+        executor: LLMBatchExecutor,
+        user_messages: Sequence[Union[str, LLMMessage]],
+        **kwargs: Any,
+    ) -> List[LLMFunctionResponse[T_Response]]:
+        """
+        Executes one request per user message through the batch endpoint of a provider.
+        Middlewares are not applied. Responses failing to parse are self-corrected, and failed requests retried,
+        through the regular endpoint as in :meth:`execute_with_llm_response`.
+
+        Args:
+            executor (LLMBatchExecutor): The executor of the batch.
+            user_messages (Sequence[Union[str, LLMMessage]]): The primary message of each request.
+            **kwargs: Additional keyword arguments to be passed to each LLMRequest.
+
+        Returns:
+            List[LLMFunctionResponse[T_Response]]: The responses, in the order of `user_messages`.
+
+        Raises:
+            FunctionOutOfRetryError: If all retry attempts of a request fail.
+        """
+        requests = [
+            LLMRequest(
+                context=self._context,
+                messages=self._messages + self._validate_messages(user_message, None, LLMMessageRole.User),
+                **kwargs,
+            )
+            for user_message in user_messages
+        ]
+        llm_responses = executor.execute(requests)
+
+        responses: List[LLMFunctionResponse[T_Response]] = []
+        for user_message, llm_response in zip(user_messages, llm_responses):
+            if not llm_response.has_result:
+                responses.append(self.execute_with_llm_response(user_message, **kwargs))
+                continue
+            try:
+                responses.append(LLMFunctionResponse.from_llm_response(llm_response, self._response_parser, []))
+            except Exception as e:
+                if isinstance(e, LLMFunctionError) and not e.retryable:
+                    raise e
+                message = e.message if isinstance(e, (LLMParsingException, LLMFunctionError)) else None
+                new_messages = self._handle_error(e, llm_response, message or f"Fix the following exception: `{e}`")
+                response = self.execute_with_llm_response(user_message, new_messages, **kwargs)
+                previous_responses = [llm_response] + response._previous_responses
+                responses.append(LLMFunctionResponse(response.llm_response, response.response, previous_responses))
+        return responses
+
+    def stream(
+        self,
+        user_message: Optional[Union[str, LLMMessage]] = None,
+        messages: Optional[Iterable[LLMMessage]] = None,
+        **kwargs: Any,
+    ) -> Iterator[LLMStreamChunk]:
+        """
+        Streams the raw LLM output for the provided user message and additional messages, as it is generated.
+        Middlewares, response parsing and retries are not applied; the final chunk carries the complete
+        :class:`LLMResult` that can be parsed once the stream is over.
+
+        Args:
+            user_message (Union[str, LLMMessage], optional): The primary message from the user or an LLMMessage object.
+            messages (Iterable[LLMMessage], optional): Additional messages to include in the request.
+            **kwargs: Additional keyword arguments to be passed to the LLM.
+
+        Returns:
+            Iterator[LLMStreamChunk]: chunks of the LLM output.
+        """
+        llm_messages = self._messages + self._validate_messages(
+            user_message, messages, LLMMessageRole.User, allow_empty_input=True
+        )
+        return self._llm_middleware.llm.stream_chat_request(self._context, llm_messages, **kwargs)
+
+    def astream(
+        self,
+        user_message: Optional[Union[str, LLMMessage]] = None,
+        messages: Optional[Iterable[LLMMessage]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Asynchronous version of :meth:`stream`.
+        """
+        llm_messages = self._messages + self._validate_messages(
+            user_message, messages, LLMMessageRole.User, allow_empty_input=True
+        )
+        return self._llm_middleware.llm.astream_chat_request(self._context, llm_messages, **kwargs)
+
+    def _handle_attempt_error(
+        self,
+        e: Exception,
+        request: LLMRequest,
+        response: Optional[LLMResponse],
+        exceptions: List[Exception],
+        previous_responses: List[LLMResponse],
+    ) -> List[LLMMessage]:
+        """
+        Record the failure of an attempt and return the messages asking the LLM to self-correct.
+        `response` is None when the LLM call itself failed, before any response was received.
+        """
+        if isinstance(e, LLMFunctionError) and not e.retryable:
+            raise e
+
+        exceptions.append(e)
+        if response is None:
+            return self._handle_error(e, LLMResponse.empty(request), "Please retry.")
+
+        previous_responses.append(response)
+        if isinstance(e, (LLMParsingException, LLMFunctionError)):
+            return self._handle_error(e, response, e.message)
+        return self._handle_error(e, response, f"Fix the following exception: `{e}`")
+
     def _handle_error(self, e: Exception, response: LLMResponse, user_message: str) -> List[LLMMessage]:
         error = f"{e.__class__.__name__}: `{e}`"
         if not response.has_result:
@@ -61,13 +61,7 @@ class LLMFunctionWithPrompt(LLMFunction[T_Response]):
         Execute LLMFunctionWithPrompt with an ability to format user prompt.
         """
 
-        if user_message is not None or messages is not None:
-            raise ValueError(
-                "Both `user_message` and `messages` are expected to be None for LLMFunctionWithPrompt.execute "
-                "since they are ignored"
-            )
-
-        prompt = self.user_prompt.format(**user_prompt_params) if user_prompt_params is not None else self.user_prompt
+        prompt = self._build_user_prompt(user_message, messages, user_prompt_params)
         return super().execute_with_llm_response(user_message=prompt, **kwargs)
 
     def execute(
@@ -83,6 +77,47 @@ class LLMFunctionWithPrompt(LLMFunction[T_Response]):
 
         return self.execute_with_llm_response(user_message, messages, user_prompt_params, **kwargs).response
 
+    async def aexecute_with_llm_response(
+        self,
+        user_message: Optional[Union[str, LLMMessage]] = None,
+        messages: Optional[Iterable[LLMMessage]] = None,
+        user_prompt_params: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> LLMFunctionResponse[T_Response]:
+        """
+        Asynchronously execute LLMFunctionWithPrompt with an ability to format user prompt.
+        """
+
+        prompt = self._build_user_prompt(user_message, messages, user_prompt_params)
+        return await super().aexecute_with_llm_response(user_message=prompt, **kwargs)
+
+    async def aexecute(
+        self,
+        user_message: Optional[Union[str, LLMMessage]] = None,
+        messages: Optional[Iterable[LLMMessage]] = None,
+        user_prompt_params: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> T_Response:
+        """
+        Asynchronously execute LLMFunctionWithPrompt with an ability to format user prompt.
+        """
+
+        return (await self.aexecute_with_llm_response(user_message, messages, user_prompt_params, **kwargs)).response
+
+    def _build_user_prompt(
+        self,
+        user_message: Optional[Union[str, LLMMessage]],
+        messages: Optional[Iterable[LLMMessage]],
+        user_prompt_params: Optional[Mapping[str, str]],
+    ) -> str:
+        if user_message is not None or messages is not None:
+            raise ValueError(
+                "Both `user_message` and `messages` are expected to be None for LLMFunctionWithPrompt.execute "
+                "since they are ignored"
+            )
+
+        return self.user_prompt.format(**user_prompt_params) if user_prompt_params is not None else self.user_prompt
+
     @classmethod
     def from_configs(
         cls,
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
 import time
-from collections import OrderedDict
+from contextvars import ContextVar
 from enum import Enum
-from threading import Lock
-from typing import Any, Callable, List, Optional, Protocol, Sequence
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Sequence, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from council.contexts import Consumption, ContextLogger, LLMContext
-from council.llm.base import LLMBase, LLMMessage, LLMOutOfRetriesException, LLMResult, T_Configuration
+from council.llm.base import (
+    LLMBase,
+    LLMCallTimeoutException,
+    LLMConfigurationBase,
+    LLMMessage,
+    LLMOutOfRetriesException,
+    LLMResult,
+    LLMRetryPolicy,
+    T_Configuration,
+)
+
+from .llm_cache_store import InMemoryLLMCacheStore, LLMCacheStoreBase
 
 
 class LLMRequest:
@@ -84,6 +97,7 @@ class LLMResponse:
 
 
 ExecuteLLMRequest = Callable[[LLMRequest], LLMResponse]
+AsyncExecuteLLMRequest = Callable[[LLMRequest], Awaitable[LLMResponse]]
 
 
 class LLMMiddleware(Protocol):
@@ -96,14 +110,28 @@ class LLMMiddleware(Protocol):
     def __call__(self, llm: LLMBase, execute: ExecuteLLMRequest, request: LLMRequest) -> LLMResponse: ...
 
 
+class LLMAsyncMiddleware(Protocol):
+    """
+    Protocol for defining asynchronous LLM middleware, used by :meth:`LLMMiddlewareChain.aexecute`.
+
+    A middleware may implement both :class:`LLMMiddleware` and this protocol.
+    Middlewares implementing only :class:`LLMMiddleware` are run in a worker thread when executed asynchronously.
+    """
+
+    async def acall(self, llm: LLMBase, execute: AsyncExecuteLLMRequest, request: LLMRequest) -> LLMResponse: ...
+
+
+AnyLLMMiddleware = Union[LLMMiddleware, LLMAsyncMiddleware]
+
+
 class LLMMiddlewareChain:
     """Manages a chain of LLM middlewares and executes requests through them."""
 
-    def __init__(self, llm: LLMBase, middlewares: Optional[Sequence[LLMMiddleware]] = None) -> None:
+    def __init__(self, llm: LLMBase, middlewares: Optional[Sequence[AnyLLMMiddleware]] = None) -> None:
         self._llm = llm
-        self._middlewares: list[LLMMiddleware] = list(middlewares) if middlewares else []
+        self._middlewares: list[AnyLLMMiddleware] = list(middlewares) if middlewares else []
 
-    def add_middleware(self, middleware: LLMMiddleware) -> None:
+    def add_middleware(self, middleware: AnyLLMMiddleware) -> None:
         """Add middleware to a chain."""
         self._middlewares.append(middleware)
 
@@ -120,16 +148,57 @@ class LLMMiddlewareChain:
             handler = self._wrap_middleware(middleware, handler)
         return handler(request)
 
+    async def aexecute(self, request: LLMRequest) -> LLMResponse:
+        """Execute middleware chain asynchronously."""
+
+        async def execute_request(r: LLMRequest) -> LLMResponse:
+            start = time.time()
+            result = await self._llm.apost_chat_request(r.context, request.messages, **r.kwargs)
+            return LLMResponse(request, result, time.time() - start)
+
+        handler: AsyncExecuteLLMRequest = execute_request
+        for middleware in reversed(self._middlewares):
+            handler = self._wrap_async_middleware(middleware, handler)
+        return await handler(request)
+
     @property
     def llm(self) -> LLMBase:
         return self._llm
 
-    def _wrap_middleware(self, middleware: LLMMiddleware, handler: ExecuteLLMRequest) -> ExecuteLLMRequest:
+    def _wrap_middleware(self, middleware: AnyLLMMiddleware, handler: ExecuteLLMRequest) -> ExecuteLLMRequest:
+        if not callable(middleware):
+            raise TypeError(f"{middleware.__class__.__name__} only supports asynchronous execution, use aexecute()")
+
         def wrapped(request: LLMRequest) -> LLMResponse:
             return middleware(self._llm, handler, request)
 
         return wrapped
 
+    def _wrap_async_middleware(
+        self, middleware: AnyLLMMiddleware, handler: AsyncExecuteLLMRequest
+    ) -> AsyncExecuteLLMRequest:
+        acall = getattr(middleware, "acall", None)
+        if acall is not None:
+
+            async def wrapped(request: LLMRequest) -> LLMResponse:
+                return await acall(self._llm, handler, request)
+
+            return wrapped
+
+        if not callable(middleware):
+            raise TypeError(f"{middleware.__class__.__name__} is neither a synchronous nor an asynchronous middleware")
+
+        async def adapted(request: LLMRequest) -> LLMResponse:
+            # run the synchronous middleware in a worker thread, calling back into the event loop for the next handler
+            loop = asyncio.get_running_loop()
+
+            def execute(r: LLMRequest) -> LLMResponse:
+                return asyncio.run_coroutine_threadsafe(handler(r), loop).result()
+
+            return await asyncio.to_thread(middleware, self._llm, execute, request)
+
+        return adapted
+
 
 class LLMLoggingStrategy(str, Enum):
     """Defines logging strategies for LLM middleware."""
@@ -179,6 +248,16 @@ class LLMLoggingMiddlewareBase:
 
         return response
 
+    async def acall(self, llm: LLMBase, execute: AsyncExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
+        name = self.component_name if self.component_name is not None else llm.configuration.model_name()
+
+        self._log_llm_request(request, name)
+        response = await execute(request)
+        self._log_llm_response(response, name)
+        self._log_consumptions(response, name)
+
+        return response
+
     def _log_llm_request(self, request: LLMRequest, name: str) -> None:
         self._log(self._format_llm_request(request, name))
 
@@ -231,13 +310,26 @@ class LLMLoggingMiddleware(LLMLoggingMiddlewareBase):
         self, strategy: LLMLoggingStrategy = LLMLoggingStrategy.Verbose, component_name: Optional[str] = None
     ) -> None:
         super().__init__(strategy, component_name)
-        self.context_logger: Optional[ContextLogger] = None
+        # context variable so that concurrent requests (threads or tasks) each log into their own context
+        self._context_logger: ContextVar[Optional[ContextLogger]] = ContextVar("context_logger", default=None)
+
+    @property
+    def context_logger(self) -> Optional[ContextLogger]:
+        return self._context_logger.get()
 
     def __call__(self, llm: LLMBase, execute: ExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
-        self.context_logger = request.context.logger
-        response = super().__call__(llm, execute, request)
-        self.context_logger = None
-        return response
+        token = self._context_logger.set(request.context.logger)
+        try:
+            return super().__call__(llm, execute, request)
+        finally:
+            self._context_logger.reset(token)
+
+    async def acall(self, llm: LLMBase, execute: AsyncExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
+        token = self._context_logger.set(request.context.logger)
+        try:
+            return await super().acall(llm, execute, request)
+        finally:
+            self._context_logger.reset(token)
 
     def _log(self, content: str) -> None:
         if self.context_logger is None:
@@ -280,39 +372,70 @@ class LLMTimestampFileLoggingMiddleware(LLMLoggingMiddlewareBase):
         self.prefix = f"{filename_prefix}_" if filename_prefix is not None else ""
         self.path = path
         self._lock = Lock()
-        self._current_filename: Optional[str] = None
+        self._current_filename: ContextVar[Optional[str]] = ContextVar("current_filename", default=None)
 
     def __call__(self, llm: LLMBase, execute: ExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
+        token = self._current_filename.set(self._new_filename())
+        try:
+            return super().__call__(llm, execute, request)
+        finally:
+            self._current_filename.reset(token)
+
+    async def acall(self, llm: LLMBase, execute: AsyncExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
+        token = self._current_filename.set(self._new_filename())
+        try:
+            return await super().acall(llm, execute, request)
+        finally:
+            self._current_filename.reset(token)
+
+    def _new_filename(self) -> str:
         timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-        self._current_filename = os.path.join(self.path, f"{self.prefix}{timestamp}.log")
-        response = super().__call__(llm, execute, request)
-        self._current_filename = None
-        return response
+        return os.path.join(self.path, f"{self.prefix}{timestamp}.log")
 
     def _log(self, content: str) -> None:
         """Write content to the current log file"""
-        if self._current_filename is None:
+        current_filename = self._current_filename.get()
+        if current_filename is None:
             raise RuntimeError(
                 "Current log filename not set - calling LLMTimestampFileLoggingMiddleware._log() outside of __call__()"
             )
 
-        self.append_to_file(self._lock, file_path=self._current_filename, content=content)
+        self.append_to_file(self._lock, file_path=current_filename, content=content)
 
 
 class LLMRetryMiddleware:
     """
     Middleware for implementing retry logic for LLM requests.
 
-    Attempts to retry failed requests a specified number of times with a delay between attempts.
+    Attempts to retry failed requests a specified number of times, waiting between attempts as decided by
+    an :class:`LLMRetryPolicy`: exponential backoff with jitter, honouring the provider's `Retry-After`.
+    Gives up early when the next attempt would not start before the deadline of the request budget.
     """
 
-    def __init__(self, retries: int, delay: float, exception_to_check: Optional[type[Exception]] = None) -> None:
+    def __init__(
+        self,
+        retries: int,
+        delay: float,
+        exception_to_check: Optional[type[Exception]] = None,
+        policy: Optional[LLMRetryPolicy] = None,
+    ) -> None:
+        """
+        Initialize the retry middleware.
+
+        Args:
+            retries: maximum number of attempts
+            delay: delay before the first retry, when no policy is given
+            exception_to_check: type of exceptions to retry, any exception if None
+            policy: policy deciding the delays between attempts (default: backoff with jitter from `delay`)
+        """
         self._retries = retries
         self._delay = delay
         self._exception_to_check = exception_to_check if exception_to_check else Exception
+        self._policy = policy if policy is not None else LLMRetryPolicy(base_delay=delay, max_delay=max(delay, 30.0))
 
     def __call__(self, llm: LLMBase, execute: ExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
         attempt = 0
+        delay: Optional[float] = None
         exceptions: List[Exception] = []
         while attempt < self._retries:
             try:
@@ -322,104 +445,228 @@ class LLMRetryMiddleware:
                     raise
                 exceptions.append(e)
                 attempt += 1
-                if attempt >= self._retries:
+                delay = self._next_delay(request, delay, e, attempt)
+                if delay is None:
                     break
-                time.sleep(self._delay)
+                time.sleep(delay)
 
         raise LLMOutOfRetriesException(llm_name=llm.model_name, retry_count=attempt, exceptions=exceptions)
 
+    async def acall(self, llm: LLMBase, execute: AsyncExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
+        attempt = 0
+        delay: Optional[float] = None
+        exceptions: List[Exception] = []
+        while attempt < self._retries:
+            try:
+                return await execute(request)
+            except Exception as e:
+                if not isinstance(e, self._exception_to_check):
+                    raise
+                exceptions.append(e)
+                attempt += 1
+                delay = self._next_delay(request, delay, e, attempt)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
 
-class CacheEntry:
-    """Represents a cached LLM response."""
+        raise LLMOutOfRetriesException(llm_name=llm.model_name, retry_count=attempt, exceptions=exceptions)
 
-    def __init__(self, response: LLMResponse, ttl: float) -> None:
-        self.response = self._rebuild_response(response)
-        self.timestamp = time.time()
-        self.ttl = ttl
+    def _next_delay(
+        self, request: LLMRequest, previous_delay: Optional[float], e: Exception, attempt: int
+    ) -> Optional[float]:
+        """Returns the delay before the next attempt, or None to give up."""
+        if attempt >= self._retries:
+            return None
+        delay = self._policy.next_delay(previous_delay, e)
+        return delay if self._policy.can_wait(delay, request.context.budget) else None
 
-    @staticmethod
-    def _rebuild_response(response: LLMResponse) -> LLMResponse:
-        """Modify the response so it has zero duration and consumptions in 'cached_' units"""
-        if response.has_result:
-            cached_consumptions: List[Consumption] = [
-                Consumption(value=consumption.value, unit=f"cached_{consumption.unit}", kind=consumption.kind)
-                for consumption in response.result.consumptions
-            ]
-            cached_result = LLMResult(response.result.choices, cached_consumptions, response.result.raw_response)
-        else:
-            cached_result = None
-        cached_response = LLMResponse(response.request, cached_result, 0)
-
-        return cached_response
 
-    @property
-    def is_expired(self) -> bool:
-        return time.time() - self.timestamp >= self.ttl
+class _InFlightRequest:
+    """A request being executed on behalf of every caller asking for the same cache key."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Optional[LLMResult] = None
+
+
+class _AsyncInFlightRequest:
+    """A request being executed on behalf of every task asking for the same cache key."""
 
-    def renew_lifetime(self) -> None:
-        """Update the timestamp to extend the lifetime."""
-        self.timestamp = time.time()
+    def __init__(self) -> None:
+        self.done = asyncio.Event()
+        self.result: Optional[LLMResult] = None
 
 
 class LLMCachingMiddleware:
-    """Middleware that caches LLM responses to avoid duplicate calls."""
+    """
+    Middleware that caches LLM responses to avoid duplicate calls.
+
+    Concurrent requests for the same key are coalesced: only the first one is sent to the LLM,
+    the others wait for its result and receive it with 'cached_' consumptions.
+    A waiting request raises :class:`LLMCallTimeoutException` if its budget expires first.
 
-    def __init__(self, ttl: float = 300.0, cache_limit_size: int = 10) -> None:
+    The fingerprint of an LLM configuration, part of the cache keys, is computed once per configuration instance.
+    Mutating a configuration after its first request through the middleware is not supported: its requests would
+    keep the keys of the original configuration. Use a new configuration instance instead.
+    """
+
+    def __init__(
+        self, ttl: float = 300.0, cache_limit_size: int = 10, store: Optional[LLMCacheStoreBase] = None
+    ) -> None:
         """
         Initialize the caching middleware.
 
         Args:
             ttl: Sliding window time-to-live in seconds for cache entries (default: 5 mins)
             cache_limit_size: Cache limit size in cached entries (default: 10)
+            store: Store for cached entries, e.g. a persistent :class:`SQLiteLLMCacheStore`.
+                Defaults to an in-memory store configured with `ttl` and `cache_limit_size`.
         """
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._ttl = ttl
-        self._cache_limit_size = cache_limit_size
+        self._store: LLMCacheStoreBase = store if store is not None else InMemoryLLMCacheStore(ttl, cache_limit_size)
+        self._lock = Lock()
+        self._in_flight: Dict[str, _InFlightRequest] = {}
+        self._async_in_flight: Dict[Tuple[int, str], _AsyncInFlightRequest] = {}
+        self._configuration_fingerprints: WeakKeyDictionary[LLMConfigurationBase, str] = WeakKeyDictionary()
+
+    @property
+    def store(self) -> LLMCacheStoreBase:
+        return self._store
 
     def __call__(self, llm: LLMBase, execute: ExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
-        self._remove_expired()
-        key = self.get_hash(request, llm.configuration)
+        key = self._get_key(request, llm.configuration)
+        while True:
+            cached = self._store.get(key)
+            if cached is not None:
+                return LLMResponse(request, cached, 0)
+
+            with self._lock:
+                flight = self._in_flight.get(key)
+                if flight is None:
+                    flight = self._in_flight[key] = _InFlightRequest()
+                    break
 
-        if key in self._cache:
-            entry = self._cache[key]
-            entry.renew_lifetime()  # renew on hit
-            self._cache.move_to_end(key)  # move to most recent
-            return entry.response
+            start = time.time()
+            timeout = request.context.budget.remaining_duration
+            if not flight.done.wait(timeout):
+                # the budget of this request ends before the leading request completes
+                raise LLMCallTimeoutException(timeout, llm.model_name)
+            if flight.result is not None:
+                return LLMResponse(request, flight.result, time.time() - start)
+            # the leading request failed, try again
+
+        try:
+            cached = self._store.get(key)  # may have been stored since the lookup above
+            if cached is not None:
+                flight.result = cached
+                return LLMResponse(request, cached, 0)
+
+            response = execute(request)
+            flight.result = self._put(key, response)
+            return response
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    async def acall(self, llm: LLMBase, execute: AsyncExecuteLLMRequest, request: LLMRequest) -> LLMResponse:
+        key = self._get_key(request, llm.configuration)
+        flight_key = (id(asyncio.get_running_loop()), key)
+        while True:
+            cached = await self._store.aget(key)
+            if cached is not None:
+                return LLMResponse(request, cached, 0)
+
+            with self._lock:
+                flight = self._async_in_flight.get(flight_key)
+                if flight is None:
+                    flight = self._async_in_flight[flight_key] = _AsyncInFlightRequest()
+                    break
 
-        response = execute(request)
+            start = time.time()
+            timeout = request.context.budget.remaining_duration
+            try:
+                await asyncio.wait_for(flight.done.wait(), timeout)
+            except asyncio.TimeoutError as e:
+                raise LLMCallTimeoutException(timeout, llm.model_name) from e
+            if flight.result is not None:
+                return LLMResponse(request, flight.result, time.time() - start)
+            # the leading request failed, try again
+
+        try:
+            cached = await self._store.aget(key)  # may have been stored since the lookup above
+            if cached is not None:
+                flight.result = cached
+                return LLMResponse(request, cached, 0)
+
+            response = await execute(request)
+            flight.result = await self._aput(key, response)
+            return response
+        finally:
+            with self._lock:
+                del self._async_in_flight[flight_key]
+            flight.done.set()
+
+    def _put(self, key: str, response: LLMResponse) -> Optional[LLMResult]:
+        if not response.has_result:
+            return None
+        result = self._to_cached_result(response.result)
+        self._store.put(key, result)
+        return result
 
-        # cache the new response
-        self._cache[key] = CacheEntry(response=response, ttl=self._ttl)
-        self._cache.move_to_end(key)
-        self._enforce_cache_limit()
+    async def _aput(self, key: str, response: LLMResponse) -> Optional[LLMResult]:
+        if not response.has_result:
+            return None
+        result = self._to_cached_result(response.result)
+        await self._store.aput(key, result)
+        return result
 
-        return response
+    @staticmethod
+    def _to_cached_result(result: LLMResult) -> LLMResult:
+        """Rebuild the result with consumptions in 'cached_' units"""
+        cached_consumptions: List[Consumption] = [
+            Consumption(value=consumption.value, unit=f"cached_{consumption.unit}", kind=consumption.kind)
+            for consumption in result.consumptions
+        ]
+        return LLMResult(result.choices, cached_consumptions, result.raw_response)
+
+    def _get_key(self, request: LLMRequest, configuration: LLMConfigurationBase) -> str:
+        """
+        Compute the cache key, reusing the fingerprint computed for the configuration instance on its first request.
+        """
+        fingerprint = self._configuration_fingerprints.get(configuration)
+        if fingerprint is None:
+            fingerprint = self.get_configuration_fingerprint(configuration)
+            with self._lock:
+                self._configuration_fingerprints[configuration] = fingerprint
+        return self.get_hash(request, configuration, fingerprint)
 
     @staticmethod
-    def get_hash(request: LLMRequest, configuration: T_Configuration) -> str:
-        """Convert the request and LLM configuration to a hash with hashlib.sha256."""
-        serialized = json.dumps(
-            {
-                "configuration": {key: str(value) for key, value in configuration.__dict__.items()},
-                # TODO: request.context is not serialized
-                "messages": [m.normalize() for m in request.messages],
-                "kwargs": request.kwargs,
-            },
-            sort_keys=True,
-        )
+    def get_configuration_fingerprint(configuration: LLMConfigurationBase) -> str:
+        """Convert the LLM configuration to a hash with hashlib.sha256."""
+        serialized = json.dumps({key: str(value) for key, value in configuration.__dict__.items()}, sort_keys=True)
         return hashlib.sha256(serialized.encode()).hexdigest()
 
-    def _remove_expired(self) -> None:
-        """Remove all expired cache entries."""
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired]
-        for key in expired_keys:
-            del self._cache[key]
+    @staticmethod
+    def get_hash(
+        request: LLMRequest, configuration: T_Configuration, configuration_fingerprint: Optional[str] = None
+    ) -> str:
+        """
+        Convert the request and LLM configuration to a hash with hashlib.sha256.
+
+        The hash is fed incrementally with the configuration fingerprint and each message
+        :attr:`~LLMMessage.fingerprint`, which are memoized, so the cost of a lookup does not depend
+        on the size of messages that were already hashed.
+        """
+        if configuration_fingerprint is None:
+            configuration_fingerprint = LLMCachingMiddleware.get_configuration_fingerprint(configuration)
 
-    def _enforce_cache_limit(self) -> None:
-        """Remove oldest entries if cache size exceeds limit."""
-        while len(self._cache) > self._cache_limit_size:
-            self._cache.popitem(last=False)  # remove the first (oldest) item
+        hasher = hashlib.sha256(configuration_fingerprint.encode())
+        # TODO: request.context is not serialized
+        hasher.update(json.dumps(request.kwargs, sort_keys=True).encode())
+        for message in request.messages:
+            hasher.update(message.fingerprint.encode())
+        return hasher.hexdigest()
 
     def clear_cache(self) -> None:
         """Clear all cached entries."""
-        self._cache.clear()
+        self._store.clear()
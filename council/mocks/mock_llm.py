@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any, Iterable, List, Optional, Protocol, Sequence
 
@@ -63,6 +64,16 @@ class MockLLM(LLMBase[MockLLMConfiguration]):
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
         if self._delay > 0:
             time.sleep(self._delay)
+        return self._to_result(messages)
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        if self._delay > 0:
+            await asyncio.sleep(self._delay)
+        return self._to_result(messages)
+
+    def _to_result(self, messages: Sequence[LLMMessage]) -> LLMResult:
         choices = self._action(messages) if self._action is not None else [f"{self.__class__.__name__}"]
         return LLMResult(choices=choices, consumptions=[Consumption.call(1, "mock_llm")])
 
@@ -87,3 +98,8 @@ class MockErrorLLM(LLMBase):
 
     def _post_chat_request(self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any) -> LLMResult:
         raise self.exception
+
+    async def _apost_chat_request(
+        self, context: LLMContext, messages: Sequence[LLMMessage], **kwargs: Any
+    ) -> LLMResult:
+        raise self.exception
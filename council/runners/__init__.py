@@ -1,7 +1,7 @@
 from .errors import RunnerError, RunnerTimeoutError, RunnerSkillError, RunnerPredicateError, RunnerGeneratorError
 
-from .types import RunnerPredicate, RunnerGenerator
-from .runner_executor import RunnerExecutor, new_runner_executor
+from .types import RunnerPredicate, RunnerGenerator, RunnerIterationCallback
+from .runner_executor import RunnerExecutor, new_runner_executor, shared_runner_executor
 from .runner_base import RunnerBase
 from .skill_runner_base import SkillRunnerBase
 from .sequential import Sequential
@@ -25,6 +25,13 @@ class DoWhile(RunnerBase):
             if not self.check_predicate(context):
                 return
 
+    async def _arun(self, context: ChainContext) -> None:
+        while True:
+            await self._body.inner.arun(context)
+
+            if not self.check_predicate(context):
+                return
+
     def check_predicate(self, context: ChainContext) -> bool:
         try:
             return self._predicate(context)
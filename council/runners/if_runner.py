@@ -26,13 +26,20 @@ class If(RunnerBase):
         self._maybe_else = self.new_monitor("else", else_runner) if else_runner is not None else None
 
     def _run(self, context: ChainContext, executor: RunnerExecutor) -> None:
+        if self.check_predicate(context):
+            self._then.inner.run(context, executor)
+        elif self._maybe_else is not None:
+            self._maybe_else.inner.run(context, executor)
+
+    async def _arun(self, context: ChainContext) -> None:
+        if self.check_predicate(context):
+            await self._then.inner.arun(context)
+        elif self._maybe_else is not None:
+            await self._maybe_else.inner.arun(context)
+
+    def check_predicate(self, context: ChainContext) -> bool:
         try:
-            result = self._predicate(context)
+            return self._predicate(context)
         except Exception as e:
             context.append(ChatMessage.skill("IfRunner", f"predicate raised exception: {e}", is_error=True))
             raise RunnerPredicateError from e
-
-        if result:
-            self._then.inner.run(context, executor)
-        elif self._maybe_else is not None:
-            self._maybe_else.inner.run(context, executor)
@@ -1,3 +1,4 @@
+import asyncio
 from concurrent import futures
 
 from council.contexts import ChainContext
@@ -27,3 +28,16 @@ class Parallel(RunnerBase):
         finally:
             context.merge([context for (_, context) in contexts])
             [f.cancel() for f in fs]
+
+    async def _arun(self, context: ChainContext) -> None:
+        contexts = [(runner.inner, context.fork_for(runner)) for runner in self._runners]
+        tasks = [asyncio.ensure_future(runner.arun(inner)) for (runner, inner) in contexts]
+        try:
+            if len(tasks) > 0:
+                dones, _ = await asyncio.wait(
+                    tasks, timeout=context.budget.remaining_duration, return_when=asyncio.FIRST_EXCEPTION
+                )
+                self.arethrow_if_exception(dones)
+        finally:
+            context.merge([context for (_, context) in contexts])
+            [task.cancel() for task in tasks]
@@ -1,15 +1,15 @@
+import asyncio
 from concurrent import futures
-from typing import Iterable
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from council.contexts import ChainContext, IterationContext
+from council.contexts import ChainContext, ChatMessage, IterationContext
 from council.utils import Option
-from more_itertools import batched
 
 from .errors import RunnerGeneratorError
 from .loop_runner_base import LoopRunnerBase
 from .runner_executor import RunnerExecutor
 from .skill_runner_base import SkillRunnerBase
-from .types import RunnerGenerator
+from .types import RunnerGenerator, RunnerIterationCallback
 
 
 class ParallelFor(LoopRunnerBase):
@@ -24,39 +24,125 @@ class ParallelFor(LoopRunnerBase):
     :meth:`.IterationContext.index` provides the index of the iteration
 
     Notes:
-        Skill iteration are scheduled in the order given by the generator function.
+        Skill iteration are scheduled in the order given by the generator function, with up to `parallelism`
+        iterations running at any time: the next one starts as soon as any of them is done.
         However, because multiple iterations can execute in parallel, no assumptions should be made on
         the order of results.
     """
 
-    def __init__(self, generator: RunnerGenerator, skill: SkillRunnerBase, parallelism: int = 5) -> None:
+    def __init__(
+        self,
+        generator: RunnerGenerator,
+        skill: SkillRunnerBase,
+        parallelism: int = 5,
+        streaming: bool = False,
+        on_result: Optional[RunnerIterationCallback] = None,
+    ) -> None:
         """
         Initialize a new instance
 
         Parameters:
             generator(RunnerGenerator): a generator function that yields results
-
+            skill(SkillRunnerBase): the skill invoked for each value
+            parallelism(int): the maximum number of iterations running at any time
+            streaming(bool): collect the messages of each iteration as soon as it is done, in completion order,
+                instead of merging all iterations at the end, in generation order.
+                The contexts of the iterations then stay proportional to `parallelism` rather than to the number
+                of values. In both modes, an iteration never sees the messages of the other iterations.
+            on_result(Optional[RunnerIterationCallback]): called with each successful iteration and its messages,
+                as soon as it is done
         """
         super().__init__("parallelForRunner")
         self._generator = generator
         self._skill = self.new_monitor("skill", skill)
         self._parallelism = parallelism
+        self._streaming = streaming
+        self._on_result = on_result
 
     def _run(self, context: ChainContext, executor: RunnerExecutor) -> None:
-        inner_contexts = []
-        all_fs = []
+        inner_contexts: List[ChainContext] = []
+        merged: List[ChatMessage] = []
+        fs: Dict[futures.Future, Tuple[IterationContext, ChainContext]] = {}
+        iterations = iter(self._generate(context))
+        exhausted = False
+        try:
+            while True:
+                # values are pulled from the generator only when an iteration can start
+                while not exhausted and len(fs) < self._parallelism:
+                    iteration = next(iterations, None)
+                    if iteration is None:
+                        exhausted = True
+                        break
+                    inner = context.fork_for(self._skill)
+                    if not self._streaming:
+                        inner_contexts.append(inner)
+                    fs[executor.submit(self._run_skill, inner, iteration)] = (iteration, inner)
+
+                if len(fs) == 0:
+                    break
+                dones, _ = futures.wait(fs, context.budget.remaining_duration, futures.FIRST_COMPLETED)
+                if len(dones) == 0:
+                    return
+                self._complete(merged, dones, fs)
+        finally:
+            [f.cancel() for f in fs]
+            if self._streaming:
+                context.merge_messages(merged)
+                inner_contexts = [inner for (_, inner) in fs.values()]
+            context.merge(inner_contexts)
+
+    async def _arun(self, context: ChainContext) -> None:
+        inner_contexts: List[ChainContext] = []
+        merged: List[ChatMessage] = []
+        tasks: Dict[asyncio.Future, Tuple[IterationContext, ChainContext]] = {}
+        iterations = iter(self._generate(context))
+        exhausted = False
         try:
-            for batch in batched(self._generate(context), self._parallelism):
-                inner = [context.fork_for(self._skill) for _ in batch]
-                inner_contexts.extend(inner)
-                fs = [executor.submit(self._run_skill, inner, iteration) for (inner, iteration) in zip(inner, batch)]
-                all_fs.extend(fs)
-                dones, not_dones = futures.wait(fs, context.budget.remaining_duration, futures.FIRST_EXCEPTION)
-                self.rethrow_if_exception(dones)
+            while True:
+                while not exhausted and len(tasks) < self._parallelism:
+                    iteration = next(iterations, None)
+                    if iteration is None:
+                        exhausted = True
+                        break
+                    inner = context.fork_for(self._skill)
+                    if not self._streaming:
+                        inner_contexts.append(inner)
+                    tasks[asyncio.ensure_future(self._arun_skill(inner, iteration))] = (iteration, inner)
+
+                if len(tasks) == 0:
+                    break
+                dones, _ = await asyncio.wait(
+                    tasks, timeout=context.budget.remaining_duration, return_when=asyncio.FIRST_COMPLETED
+                )
+                if len(dones) == 0:
+                    return
+                self._complete(merged, dones, tasks)
         finally:
-            [f.cancel() for f in all_fs]
+            [task.cancel() for task in tasks]
+            if self._streaming:
+                context.merge_messages(merged)
+                inner_contexts = [inner for (_, inner) in tasks.values()]
             context.merge(inner_contexts)
 
+    def _complete(
+        self,
+        merged: List[ChatMessage],
+        dones: Iterable[Any],
+        fs: Dict[Any, Tuple[IterationContext, ChainContext]],
+    ) -> None:
+        """
+        Handle the iterations done, given as :class:`concurrent.futures.Future` or :class:`asyncio.Future`.
+        When streaming, their messages are collected into `merged`, merged into the context once all iterations
+        are done so that the iterations still running or starting later do not see them.
+        """
+        for future in dones:
+            iteration, inner = fs.pop(future)
+            if self._streaming:
+                merged.extend(inner.new_messages)
+            if self._on_result is not None and future.exception() is None:
+                self._on_result(iteration, inner.new_messages)
+        [future.result() for future in dones]
+
     def _run_skill(self, context: ChainContext, iteration: IterationContext) -> None:
         index = iteration.index
         context.logger.debug(f'message="start iteration" index="{index}"')
@@ -65,6 +151,14 @@ class ParallelFor(LoopRunnerBase):
         finally:
             context.logger.debug(f'message="end iteration" index="{index}"')
 
+    async def _arun_skill(self, context: ChainContext, iteration: IterationContext) -> None:
+        index = iteration.index
+        context.logger.debug(f'message="start iteration" index="{index}"')
+        try:
+            await self._skill.inner.arun_in_current_task(context, Option.some(iteration))
+        finally:
+            context.logger.debug(f'message="end iteration" index="{index}"')
+
     def _generate(self, context: ChainContext) -> Iterable[IterationContext]:
         try:
             for index, item in enumerate(self._generator(context)):
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 from collections.abc import Set
 from concurrent import futures
+from typing import Iterable
 
 from council.contexts import ChainContext, Monitorable, Monitored
 
 from .errors import RunnerError, RunnerTimeoutError
-from .runner_executor import RunnerExecutor
+from .runner_executor import RunnerExecutor, shared_runner_executor
 
 
 class RunnerBase(Monitorable, abc.ABC):
@@ -25,6 +27,13 @@ class RunnerBase(Monitorable, abc.ABC):
         finally:
             context.merge([inner])
 
+    async def afork_run_merge(self, runner: Monitored[RunnerBase], context: ChainContext) -> None:
+        inner = context.fork_for(runner)
+        try:
+            await runner.inner.arun(inner)
+        finally:
+            context.merge([inner])
+
     def run(self, context: ChainContext, executor: RunnerExecutor) -> None:
         if context.should_stop():
             return
@@ -48,10 +57,47 @@ class RunnerBase(Monitorable, abc.ABC):
         finally:
             context.logger.debug("done running %s", self.__class__.__name__)
 
+    async def arun(self, context: ChainContext) -> None:
+        """
+        Run asynchronously, in the event loop of the caller.
+        """
+        if context.should_stop():
+            return
+
+        context.logger.debug("start running %s", self.__class__.__name__)
+        try:
+            with context:
+                await self._arun(context)
+        except (futures.TimeoutError, asyncio.TimeoutError) as e:
+            context.logger.debug("timeout running %s", self.__class__.__name__)
+            context.cancellation_token.cancel()
+            raise RunnerTimeoutError(self.__class__.__name__) from e
+        except RunnerError:
+            context.logger.debug("runner error running %s", self.__class__.__name__)
+            context.cancellation_token.cancel()
+            raise
+        except Exception as e:
+            context.logger.exception("an unexpected error occurred running %s", self.__class__.__name__)
+            context.cancellation_token.cancel()
+            raise RunnerError(f"an unexpected error occurred in {self.__class__.__name__}") from e
+        finally:
+            context.logger.debug("done running %s", self.__class__.__name__)
+
     @staticmethod
     def rethrow_if_exception(fs: Set[futures.Future]) -> None:
         [f.result(timeout=0) for f in fs]
 
+    @staticmethod
+    def arethrow_if_exception(tasks: Iterable[asyncio.Future]) -> None:
+        [task.result() for task in tasks]
+
     @abc.abstractmethod
     def _run(self, context: ChainContext, executor: RunnerExecutor) -> None:
         pass
+
+    async def _arun(self, context: ChainContext) -> None:
+        """
+        Asynchronous implementation of the runner.
+        Defaults to :meth:`_run` in a worker thread; the runners of council override it.
+        """
+        await asyncio.to_thread(self._run, context, shared_runner_executor())
@@ -1,7 +1,156 @@
+from __future__ import annotations
+
 from concurrent import futures
+from threading import Lock, local
+from typing import Any, Callable, Optional
+
+from council.utils import read_env_int
+
+
+class RunnerExecutor(futures.ThreadPoolExecutor):
+    """
+    Thread pool running the runners and skills of chains.
+
+    Runners running on the pool submit their inner runners and skills into the same pool. Such a nested submission
+    goes to a separate overflow lane, with as many workers as the pool, when every worker of the pool is busy:
+    a runner never waits for a worker that can only be freed by itself, and the pool cannot deadlock under load.
+    Only when the overflow lane is saturated too does a nested submission run inline, in the submitting thread.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_name_prefix: str = "", **kwargs: Any) -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix, **kwargs)
+        self._lock = Lock()
+        self._local = local()
+        self._active = 0
+        self._running = 0
+        self._overflow_active = 0
+        self._overflow: Optional[futures.ThreadPoolExecutor] = None
+        self._overflow_prefix = f"{thread_name_prefix or 'runner'}_overflow"
+        self._is_shutdown = False
+
+    @property
+    def max_workers(self) -> int:
+        """
+        The number of workers of the pool.
+        """
+        return self._max_workers
+
+    @property
+    def running(self) -> int:
+        """
+        The number of tasks running on a worker of the pool.
+        """
+        with self._lock:
+            return self._running
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of submitted tasks waiting for a worker.
+        """
+        with self._lock:
+            return self._active - self._running
+
+    @property
+    def is_shutdown(self) -> bool:
+        return self._is_shutdown
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> futures.Future:
+        with self._lock:
+            lane = "pool"
+            if getattr(self._local, "is_worker", False) and self._active >= self._max_workers:
+                lane = "overflow" if self._overflow_active < self._max_workers else "inline"
+            if lane == "pool":
+                self._active += 1
+            elif lane == "overflow":
+                self._overflow_active += 1
+
+        if lane == "inline":
+            return self._run_inline(fn, *args, **kwargs)
+
+        if lane == "overflow":
+            try:
+                future = self._overflow_executor().submit(self._run_overflow_task, fn, *args, **kwargs)
+            except BaseException:
+                self._overflow_done()
+                raise
+            future.add_done_callback(lambda _: self._overflow_done())
+            return future
 
-RunnerExecutor = futures.ThreadPoolExecutor
+        try:
+            future = super().submit(self._run_task, fn, *args, **kwargs)
+        except BaseException:
+            self._done()
+            raise
+        future.add_done_callback(lambda _: self._done())
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._is_shutdown = True
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+        with self._lock:
+            overflow = self._overflow
+        if overflow is not None:
+            overflow.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _run_task(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self._local.is_worker = True
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _overflow_executor(self) -> futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._overflow is None:
+                self._overflow = futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix=self._overflow_prefix
+                )
+            return self._overflow
+
+    def _run_overflow_task(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self._local.is_worker = True
+        return fn(*args, **kwargs)
+
+    def _done(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    def _overflow_done(self) -> None:
+        with self._lock:
+            self._overflow_active -= 1
+
+    @staticmethod
+    def _run_inline(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> futures.Future:
+        future: futures.Future = futures.Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+_shared_lock = Lock()
+_shared_executor: Optional[RunnerExecutor] = None
 
 
 def new_runner_executor(name: str = "skill_runner") -> RunnerExecutor:
     return RunnerExecutor(thread_name_prefix=name, max_workers=10)
+
+
+def shared_runner_executor() -> RunnerExecutor:
+    """
+    Returns the executor shared by the agents and chains executed without an executor of their own.
+
+    It is created on first use, or after being shut down, with `COUNCIL_RUNNER_MAX_WORKERS` workers (default 32).
+    """
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None or _shared_executor.is_shutdown:
+            max_workers = read_env_int("COUNCIL_RUNNER_MAX_WORKERS", required=False, default=32).unwrap()
+            _shared_executor = RunnerExecutor(max_workers=max_workers, thread_name_prefix="council_runner")
+        return _shared_executor
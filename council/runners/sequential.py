@@ -22,6 +22,13 @@ class Sequential(RunnerBase):
 
             self.fork_run_merge(runner, context, executor)
 
+    async def _arun(self, context: ChainContext) -> None:
+        for runner in self._runners:
+            if context.should_stop():
+                return
+
+            await self.afork_run_merge(runner, context)
+
     @staticmethod
     def from_list(runners: Sequence[RunnerBase]) -> RunnerBase:
         if len(runners) == 1:
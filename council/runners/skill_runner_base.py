@@ -1,4 +1,6 @@
 import abc
+import asyncio
+from concurrent import futures
 
 from council.contexts import ChainContext, ChatMessage, IterationContext, SkillContext
 
@@ -27,13 +29,27 @@ class SkillRunnerBase(RunnerBase):
 
     def run_skill(self, context: ChainContext, executor: RunnerExecutor) -> None:
         """
-        Run the skill in a different thread, and await for completion
+        Run the skill in a different thread, and await for completion within the budget
         """
         future = executor.submit(self.run_in_current_thread, context, IterationContext.empty())
+        ran_inline = future.done()
         try:
             future.result(timeout=context.budget.remaining_duration)
         finally:
             future.cancel()
+        if ran_inline and context.budget.is_expired():
+            raise futures.TimeoutError()
+
+    async def _arun(self, context: ChainContext) -> None:
+        await self.arun_skill(context)
+
+    async def arun_skill(self, context: ChainContext) -> None:
+        """
+        Run the skill in the event loop of the caller, and await for completion within the budget
+        """
+        await asyncio.wait_for(
+            self.arun_in_current_task(context, IterationContext.empty()), context.budget.remaining_duration
+        )
 
     def run_in_current_thread(self, context: ChainContext, iteration_context: Option[IterationContext]) -> None:
         """
@@ -48,6 +64,19 @@ class SkillRunnerBase(RunnerBase):
             context.append(self.from_exception(e))
             raise RunnerSkillError(f"an unexpected error occurred in skill {self._name}") from e
 
+    async def arun_in_current_task(self, context: ChainContext, iteration_context: Option[IterationContext]) -> None:
+        """
+        Run the skill in the current asyncio task
+        """
+        try:
+            with SkillContext.from_chain_context(context, iteration_context) as skill_context:
+                message = await self.aexecute_skill(skill_context)
+                context.append(message)
+        except Exception as e:
+            context.logger.exception("unexpected error during execution of skill %s", self._name)
+            context.append(self.from_exception(e))
+            raise RunnerSkillError(f"an unexpected error occurred in skill {self._name}") from e
+
     @abc.abstractmethod
     def execute_skill(self, context: SkillContext) -> ChatMessage:
         """
@@ -55,6 +84,12 @@ class SkillRunnerBase(RunnerBase):
         """
         pass
 
+    async def aexecute_skill(self, context: SkillContext) -> ChatMessage:
+        """
+        Asynchronous skill execution. Defaults to :meth:`execute_skill` in a worker thread.
+        """
+        return await asyncio.to_thread(self.execute_skill, context)
+
     def from_exception(self, exception: Exception) -> ChatMessage:
         message = f"skill '{self._name}' raised exception: {exception}"
         return ChatMessage.skill(message, data=None, source=self._name, is_error=True)
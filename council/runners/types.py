@@ -1,6 +1,7 @@
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Sequence
 
-from council.contexts import ChainContext
+from council.contexts import ChainContext, ChatMessage, IterationContext
 
 RunnerPredicate = Callable[[ChainContext], bool]
 RunnerGenerator = Callable[[ChainContext], Iterable[Any]]
+RunnerIterationCallback = Callable[[IterationContext, Sequence[ChatMessage]], None]
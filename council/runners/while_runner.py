@@ -21,6 +21,10 @@ class While(RunnerBase):
         while self.check_predicate(context):
             self._body.inner.run(context, executor)
 
+    async def _arun(self, context: ChainContext) -> None:
+        while self.check_predicate(context):
+            await self._body.inner.arun(context)
+
     def check_predicate(self, context: ChainContext) -> bool:
         try:
             return self._predicate(context)
@@ -1,4 +1,4 @@
 """This package provides ready to use skills"""
 
-from .skill_base import SkillBase
+from .skill_base import AsyncSkillBase, SkillBase
 from .llm_skill import LLMSkill, PromptToMessages
@@ -1,7 +1,7 @@
 from typing import List, Protocol
 
 from council.contexts import ChatMessage, SkillContext
-from council.llm import LLMBase, LLMMessage, MonitoredLLM
+from council.llm import LLMBase, LLMMessage, LLMResult, MonitoredLLM
 from council.prompt import PromptBuilder
 from council.skills import SkillBase
 
@@ -80,10 +80,21 @@ class LLMSkill(SkillBase):
     def execute(self, context: SkillContext) -> ChatMessage:
         """Execute `LLMSkill`."""
 
+        llm_response = self._llm.post_chat_request(context, messages=self._build_messages(context))
+        return self._to_message(context, llm_response)
+
+    async def aexecute(self, context: SkillContext) -> ChatMessage:
+        """Execute `LLMSkill` asynchronously."""
+
+        llm_response = await self._llm.apost_chat_request(context, messages=self._build_messages(context))
+        return self._to_message(context, llm_response)
+
+    def _build_messages(self, context: SkillContext) -> List[LLMMessage]:
         history_messages = self._context_messages(context)
         system_prompt = LLMMessage.system_message(self._builder.apply(context))
-        messages = [system_prompt, *history_messages]
-        llm_response = self._llm.post_chat_request(context, messages=messages)
+        return [system_prompt, *history_messages]
+
+    def _to_message(self, context: SkillContext, llm_response: LLMResult) -> ChatMessage:
         if len(llm_response.choices) < 1:
             return self.build_error_message(message="no response")
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from abc import abstractmethod
 from typing import Any
 
 from council.contexts import ChatMessage, SkillContext
 from council.runners import SkillRunnerBase
+from council.utils import run_async
 
 
 class SkillBase(SkillRunnerBase):
@@ -55,6 +57,14 @@ class SkillBase(SkillRunnerBase):
         """
         pass
 
+    async def aexecute(self, context: SkillContext) -> ChatMessage:
+        """
+        Executes the skill asynchronously.
+        Defaults to running :meth:`execute` in a worker thread. Skills with a native asynchronous implementation
+        override it, see :class:`AsyncSkillBase`.
+        """
+        return await asyncio.to_thread(self.execute, context)
+
     def build_success_message(self, message: str, data: Any = None) -> ChatMessage:
         """
         Builds a success message for the skill with the provided message and optional data.
@@ -77,6 +87,16 @@ class SkillBase(SkillRunnerBase):
     def execute_skill(self, context: SkillContext) -> ChatMessage:
         context.logger.info(f'message="skill execution started" skill="{self.name}"')
         skill_message = self.execute(context)
+        self._log_skill_message(context, skill_message)
+        return skill_message
+
+    async def aexecute_skill(self, context: SkillContext) -> ChatMessage:
+        context.logger.info(f'message="skill execution started" skill="{self.name}"')
+        skill_message = await self.aexecute(context)
+        self._log_skill_message(context, skill_message)
+        return skill_message
+
+    def _log_skill_message(self, context: SkillContext, skill_message: ChatMessage) -> None:
         if skill_message.is_ok:
             context.logger.info(
                 f'message="skill execution ended" skill="{self.name}" skill_message="{skill_message.message}"'
@@ -85,10 +105,38 @@ class SkillBase(SkillRunnerBase):
             context.logger.warning(
                 f'message="skill execution ended" skill="{self.name}" skill_message="{skill_message.message}"'
             )
-        return skill_message
 
     def __repr__(self) -> str:
         return f"SkillBase({self.name})"
 
     def __str__(self) -> str:
         return f"Skill {self.name}"
+
+
+class AsyncSkillBase(SkillBase):
+    """
+    Abstract base class for a skill implemented as a coroutine.
+    """
+
+    def execute(self, context: SkillContext) -> ChatMessage:
+        """
+        Executes the skill synchronously, running :meth:`aexecute` in a new event loop.
+        The resources bound to the loop, like the async clients of the LLMs it used, are closed before it ends.
+        """
+        return run_async(self.aexecute(context))
+
+    @abstractmethod
+    async def aexecute(self, context: SkillContext) -> ChatMessage:
+        """
+        Executes the skill asynchronously on the provided chain context and budget.
+
+        Args:
+            context (SkillContext): The context for executing the skill.
+
+        Returns:
+            ChatMessage: The result of skill execution.
+        """
+        pass
+
+    def __repr__(self) -> str:
+        return f"AsyncSkillBase({self.name})"
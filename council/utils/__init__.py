@@ -29,3 +29,4 @@ from .data_object import DataObject, DataObjectSpecBase
 from .code_parser import CodeBlock, CodeParser
 from .env import OsEnviron
 from .utils import truncate_dict_values_to_str
+from .event_loop import on_loop_close, aclose_loop_resources, run_async
@@ -0,0 +1,45 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Coroutine, List, TypeVar
+from weakref import WeakKeyDictionary
+
+T = TypeVar("T")
+
+_closers: WeakKeyDictionary[asyncio.AbstractEventLoop, List[Callable[[], Awaitable[None]]]] = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def on_loop_close(closer: Callable[[], Awaitable[None]]) -> None:
+    """
+    Register a coroutine function releasing a resource bound to the running event loop,
+    awaited by :func:`run_async` before the loop ends.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        _closers.setdefault(loop, []).append(closer)
+
+
+async def aclose_loop_resources() -> None:
+    """
+    Await the closers registered with :func:`on_loop_close` for the running event loop, most recent first.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        closers = _closers.pop(loop, [])
+    for closer in reversed(closers):
+        await closer()
+
+
+def run_async(coroutine: Coroutine[None, None, T]) -> T:
+    """
+    Run a coroutine in a new event loop, like `asyncio.run`, releasing the resources registered with
+    :func:`on_loop_close` before the loop ends.
+    """
+
+    async def run() -> T:
+        try:
+            return await coroutine
+        finally:
+            await aclose_loop_resources()
+
+    return asyncio.run(run())
@@ -3,6 +3,7 @@ class LLMModels:
     OpenAI: str = "openai-llmodel.yaml"
     Anthropic: str = "anthropic-llmodel.yaml"
     AzureWithFallback: str = "azure-with-fallback-llmodel.yaml"
+    AzureLoadBalanced: str = "azure-load-balanced-llmodel.yaml"
     Gemini: str = "gemini-llmodel.yaml"
     Ollama: str = "ollama-llmodel.yaml"
     Groq: str = "groq-llmodel.yaml"
@@ -72,3 +72,22 @@ class ChainContextTests(unittest.TestCase):
 
         self.assertEqual(["first", "second"], [m.message for m in context._previous_messages.messages])
         self.assertEqual(["new"], [m.message for m in context._current_messages.messages])
+
+    def test_fork_is_not_affected_by_parent(self):
+        self.chain_context.extend(self.messages)
+        context = self.chain_context.fork_for(MockMonitored())
+        self.chain_context.append(ChatMessage.skill("after fork"))
+
+        self.assertEqual(["first", "second"], [m.message for m in context.messages])
+        self.assertEqual(["second", "first"], [m.message for m in context.reversed])
+        self.assertEqual(["first", "second", "after fork"], [m.message for m in self.chain_context.messages])
+
+    def test_fork_shares_messages(self):
+        self.chain_context.extend(self.messages)
+        context = self.chain_context.fork_for(MockMonitored())
+        new_context = context.fork_for(MockMonitored())
+        new_context.append(ChatMessage.skill("new"))
+        context.merge([new_context])
+
+        for message, expected in zip(new_context.messages, [*self.messages, context.last_message]):
+            self.assertIs(expected, message)
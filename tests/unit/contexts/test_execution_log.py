@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+import unittest
+
+from council import Agent, AgentContext
+from council.contexts import (
+    CallbackExecutionLogSink,
+    ExecutionLog,
+    JsonLinesExecutionLogSink,
+    LLMContext,
+    RingBufferExecutionLogSink,
+)
+from council.llm import LLMMessage, MonitoredLLM
+from council.mocks import MockLLM, MockSkill
+
+
+class TestExecutionLog(unittest.TestCase):
+    def test_default_keeps_all_entries(self):
+        log = ExecutionLog()
+        entries = [log.new_entry(f"entry {i}", node=None) for i in range(5)]
+        with entries[1]:
+            pass
+
+        self.assertEqual([f"entry {i}" for i in range(5)], [item["source"] for item in log.to_dict()["entries"]])
+
+    def test_retention(self):
+        log = ExecutionLog(retention=3)
+        for i in range(100):
+            with log.new_entry(f"entry {i}", node=None):
+                pass
+
+        opened = log.new_entry("opened", node=None)
+        self.assertEqual(["entry 97", "entry 98", "entry 99", "opened"], [item.source for item in log.entries])
+
+        del opened
+        self.assertEqual(["entry 97", "entry 98", "entry 99"], [item.source for item in log.entries])
+
+    def test_sinks(self):
+        ring = RingBufferExecutionLogSink(capacity=2)
+        received = []
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logs", "execution.jsonl")
+            jsonl = JsonLinesExecutionLogSink(path)
+            log = ExecutionLog(sinks=[ring, jsonl, CallbackExecutionLogSink(received.append)], retention=0)
+            for i in range(3):
+                with log.new_entry(f"entry {i}", node=None) as entry:
+                    entry.log_info("message %s", i)
+            log.close()
+
+            with open(path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual([], log.to_dict()["entries"])
+        self.assertEqual(["entry 1", "entry 2"], [item["source"] for item in ring.to_dict()["entries"]])
+        self.assertEqual(["entry 0", "entry 1", "entry 2"], [item["source"] for item in lines])
+        self.assertEqual("message 2", lines[2]["logs"][0]["message"])
+        self.assertEqual(["entry 0", "entry 1", "entry 2"], [item.source for item in received])
+
+    def test_sinks_reused_entry(self):
+        received = []
+        log = ExecutionLog(sinks=[CallbackExecutionLogSink(received.append)])
+        entry = log.new_entry("entry", node=None)
+        for i in range(3):
+            with entry:
+                entry.log_info("call %s", i)
+        with entry:
+            pass
+
+        self.assertEqual(["entry"] * 3, [item.source for item in received])
+        self.assertEqual([[f"call {i}"] for i in range(3)], [[log[2] for log in item._logs] for item in received])
+        self.assertEqual(["entry"], [item.source for item in log.entries])
+
+    def test_close_writes_open_entries(self):
+        received = []
+        log = ExecutionLog(sinks=[CallbackExecutionLogSink(received.append)], retention=0)
+        with log.new_entry("closed", node=None):
+            pass
+        opened = log.new_entry("opened", node=None)
+        opened.log_info("still running")
+        log.close()
+
+        self.assertEqual(["closed", "opened"], [item.source for item in received])
+
+    def test_sinks_reused_llm_context(self):
+        received = []
+        context = AgentContext.from_user_message(
+            "hello", execution_log=ExecutionLog(sinks=[CallbackExecutionLogSink(received.append)])
+        )
+        llm = MockLLM.from_response("response")
+        llm_context = LLMContext.from_context(context, MonitoredLLM("llm", llm))
+        for _ in range(3):
+            llm.post_chat_request(llm_context, [LLMMessage.user_message("hello")])
+
+        consumptions = [c for item in received if item.source == "agent/llm" for c in item.to_dict()["consumptions"]]
+        self.assertEqual(3, len([c for c in consumptions if c["unit"] == "call"]))
+
+    def test_debug_sampling(self):
+        log = ExecutionLog(debug_sample_rate=0.0)
+        entry = log.new_entry("entry", node=None)
+        entry.log_debug("debug")
+        entry.log_info("info")
+
+        self.assertEqual(["INFO"], [item["level"] for item in entry.to_dict()["logs"]])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ExecutionLog(retention=-1)
+        with self.assertRaises(ValueError):
+            ExecutionLog(debug_sample_rate=2.0)
+
+    def test_agent_streaming(self):
+        ring = RingBufferExecutionLogSink(capacity=100)
+        context = AgentContext.from_user_message("hello", execution_log=ExecutionLog(sinks=[ring], retention=1))
+        Agent.from_skill(MockSkill()).execute(context)
+
+        self.assertLessEqual(len(context.execution_log_to_dict()["entries"]), 2)
+        sources = [entry["source"] for entry in ring.entries]
+        self.assertEqual("agent", sources[-1])
+        self.assertEqual(1, sources.count("agent/iterations[0]/execution(BasicChain)/chain(BasicChain)/runner"))
@@ -1,8 +1,14 @@
+import logging
 from datetime import datetime, timezone
 
 from unittest import TestCase
 
-from council.contexts import ExecutionLogEntry
+from council.contexts import ContextLogger, ExecutionLogEntry
+
+
+class _NotFormattable:
+    def __str__(self) -> str:
+        raise AssertionError("message formatted")
 
 
 class TestExecutionLogEntry(TestCase):
@@ -19,3 +25,33 @@ class TestExecutionLogEntry(TestCase):
 
         self.assertEqual(instance._logs[0][2], "a % message")
         self.assertAlmostEquals(instance._logs[0][0].second, datetime.now(timezone.utc).second, delta=2)
+
+    def test_logger_format_at_log_time(self):
+        instance = ExecutionLogEntry("me", node=None)
+        values = ["first"]
+        instance.log_info("values %s", values)
+        values.append("second")
+
+        self.assertEqual(instance.to_dict()["logs"][0]["message"], "values ['first']")
+
+
+class TestContextLogger(TestCase):
+    def test_logs_with_caller_module(self):
+        entry = ExecutionLogEntry("me", node=None)
+        logger = ContextLogger(entry)
+        with self.assertLogs(__name__, level=logging.INFO) as logs:
+            logger.info("a %s message", "test")
+
+        self.assertEqual(logs.records[0].funcName, "test_logs_with_caller_module")
+        self.assertEqual(logs.records[0].getMessage(), "a test message")
+        self.assertEqual(entry.to_dict()["logs"][0]["message"], "a test message")
+        self.assertEqual(entry.to_dict()["logs"][0]["level"], "INFO")
+
+    def test_disabled_level_is_not_formatted(self):
+        entry = ExecutionLogEntry("me", node=None)
+        logger = ContextLogger(entry)
+        with self.assertLogs(__name__, level=logging.INFO):
+            logger.debug("a %s message", _NotFormattable())
+            logger.info("an info message")
+
+        self.assertEqual([item["level"] for item in entry.to_dict()["logs"]], ["INFO"])
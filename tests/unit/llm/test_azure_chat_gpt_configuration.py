@@ -1,5 +1,5 @@
 import unittest
-from council.llm import AzureChatGPTConfiguration
+from council.llm import AzureChatGPTConfiguration, AzureLLM
 from council.utils import OsEnviron, ParameterValueException
 
 
@@ -57,3 +57,26 @@ class TestAzureChatGPTConfiguration(unittest.TestCase):
             _ = AzureChatGPTConfiguration(api_key="aKeY", api_base=" ", deployment_name="gpt-4")
         with self.assertRaises(ParameterValueException):
             _ = AzureChatGPTConfiguration(api_key="aKeY", api_base="council", deployment_name=" ")
+
+    def test_connection_pool_from_env(self):
+        with (
+            OsEnviron("AZURE_LLM_API_KEY", "aKeY"),
+            OsEnviron("AZURE_LLM_API_BASE", "council"),
+            OsEnviron("AZURE_LLM_DEPLOYMENT_NAME", "gpt-4"),
+            OsEnviron("AZURE_LLM_MAX_KEEPALIVE_CONNECTIONS", "50"),
+            OsEnviron("AZURE_LLM_HTTP2", "true"),
+        ):
+            config = AzureChatGPTConfiguration.from_env()
+            self.assertEqual(100, config.max_connections.value)
+            self.assertEqual(50, config.max_keepalive_connections.value)
+            self.assertTrue(config.http2.value)
+
+    def test_llm_reuses_http_client(self):
+        llm = AzureLLM(AzureChatGPTConfiguration(api_key="aKeY", api_base="council", deployment_name="gpt-4"))
+        provider = llm._client_provider
+        client = provider.client
+        self.assertIs(client, provider.client)
+        llm.close()
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(client, provider.client)
+        llm.close()
@@ -0,0 +1,214 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from council.contexts import AgentContextStore, Budget, ChatHistory, ExecutionContext, LLMContext
+from council.llm import (
+    AdaptiveConcurrencyLimit,
+    LLMAdaptiveConcurrency,
+    LLMCallException,
+    LLMCallTimeoutException,
+    LLMMessage,
+)
+from council.mocks import MockErrorLLM, MockLLM
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def enter(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+class TrackingLLM(MockLLM):
+    def __init__(self, tracker: ConcurrencyTracker, delay: float) -> None:
+        super().__init__()
+        self._tracker = tracker
+        self._sleep = delay
+
+    def _post_chat_request(self, context, messages, **kwargs):
+        self._tracker.enter()
+        try:
+            time.sleep(self._sleep)
+            return self._to_result(messages)
+        finally:
+            self._tracker.exit()
+
+    async def _apost_chat_request(self, context, messages, **kwargs):
+        self._tracker.enter()
+        try:
+            await asyncio.sleep(self._sleep)
+            return self._to_result(messages)
+        finally:
+            self._tracker.exit()
+
+
+class TestAdaptiveConcurrencyLimit(unittest.TestCase):
+    def test_additive_increase(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=2, max_limit=4)
+        for _ in range(50):
+            started = [limit.acquire() for _ in range(limit.limit)]
+            for s in started:
+                limit.release(s, overloaded=False)
+        self.assertEqual(4, limit.limit)
+        self.assertEqual(0, limit.in_flight)
+
+    def test_no_increase_when_not_saturated(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=2)
+        for _ in range(50):
+            limit.release(limit.acquire(), overloaded=False)
+        self.assertEqual(2, limit.limit)
+
+    def test_multiplicative_decrease_once_per_burst(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=16)
+        started = [limit.acquire() for _ in range(8)]
+        for s in started:
+            limit.release(s, overloaded=True)
+        self.assertEqual(8, limit.limit)
+
+        limit.release(limit.acquire(), overloaded=True)
+        self.assertEqual(4, limit.limit)
+
+    def test_min_limit(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=2, min_limit=2)
+        limit.release(limit.acquire(), overloaded=True)
+        self.assertEqual(2, limit.limit)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimit(initial_limit=1, min_limit=2)
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimit(backoff=1.5)
+
+    def test_is_overload(self):
+        self.assertTrue(AdaptiveConcurrencyLimit.is_overload(LLMCallException(429, "Too many requests", "mock")))
+        self.assertTrue(AdaptiveConcurrencyLimit.is_overload(LLMCallException(503, "Unavailable", "mock")))
+        self.assertTrue(AdaptiveConcurrencyLimit.is_overload(LLMCallTimeoutException(30, "mock")))
+        self.assertFalse(AdaptiveConcurrencyLimit.is_overload(LLMCallException(401, "Unauthorized", "mock")))
+        self.assertFalse(AdaptiveConcurrencyLimit.is_overload(ValueError()))
+
+    def test_async_cancelled_waiter(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=1)
+
+        async def run():
+            started = await limit.aacquire()
+            waiter = asyncio.ensure_future(limit.aacquire())
+            await asyncio.sleep(0.01)
+            self.assertEqual(1, limit.queue_depth)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            limit.release(started, overloaded=False)
+
+        asyncio.run(run())
+        self.assertEqual(0, limit.in_flight)
+        self.assertEqual(0, limit.queue_depth)
+
+    def test_acquire_timeout(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=1)
+        started = limit.acquire()
+        with self.assertRaises(LLMCallTimeoutException):
+            limit.acquire(timeout=0.01)
+        self.assertEqual(0, limit.queue_depth)
+        limit.release(started, overloaded=False)
+        self.assertEqual(0, limit.in_flight)
+
+    def test_async_acquire_timeout(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=1)
+
+        async def run():
+            started = await limit.aacquire()
+            with self.assertRaises(LLMCallTimeoutException):
+                await limit.aacquire(timeout=0.01)
+            self.assertEqual(0, limit.queue_depth)
+            limit.release(started, overloaded=False)
+
+        asyncio.run(run())
+        self.assertEqual(0, limit.in_flight)
+
+
+class TestLLMAdaptiveConcurrency(unittest.TestCase):
+    def test_limits_in_flight_requests(self):
+        tracker = ConcurrencyTracker()
+        llm = LLMAdaptiveConcurrency(
+            TrackingLLM(tracker, delay=0.01), AdaptiveConcurrencyLimit(initial_limit=2, max_limit=6)
+        )
+        messages = [LLMMessage.user_message("hello")]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lambda _: llm.post_chat_request(LLMContext.empty(), messages), range(200)))
+
+        self.assertEqual(200, len(results))
+        self.assertLessEqual(tracker.peak, 6)
+        self.assertGreater(llm.limit.limit, 2)
+        self.assertEqual(0, llm.limit.in_flight)
+
+    def test_async_limits_in_flight_requests(self):
+        tracker = ConcurrencyTracker()
+        llm = LLMAdaptiveConcurrency(
+            TrackingLLM(tracker, delay=0.01), AdaptiveConcurrencyLimit(initial_limit=3, max_limit=3)
+        )
+
+        async def run_all():
+            messages = [LLMMessage.user_message("hello")]
+            return await asyncio.gather(*[llm.apost_chat_request(LLMContext.empty(), messages) for _ in range(30)])
+
+        results = asyncio.run(run_all())
+        self.assertEqual(30, len(results))
+        self.assertEqual(3, tracker.peak)
+
+    def test_backoff_on_overload(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=8)
+        llm = LLMAdaptiveConcurrency(MockErrorLLM(LLMCallException(429, "Too many requests", "mock")), limit)
+
+        with self.assertRaises(LLMCallException):
+            llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual(4, limit.limit)
+        self.assertEqual(0, limit.in_flight)
+
+    def test_no_backoff_on_other_errors(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=8)
+        llm = LLMAdaptiveConcurrency(MockErrorLLM(LLMCallException(401, "Unauthorized", "mock")), limit)
+
+        with self.assertRaises(LLMCallException):
+            llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual(8, limit.limit)
+        self.assertEqual(0, limit.in_flight)
+
+    def test_shared_limit(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=1, max_limit=1)
+        first = LLMAdaptiveConcurrency(MockLLM.from_response("first"), limit)
+        second = LLMAdaptiveConcurrency(MockLLM.from_response("second"), limit)
+
+        stream = first.stream_chat_request(LLMContext.empty(), [])
+        next(stream)
+        self.assertEqual(1, limit.in_flight)
+        stream.close()
+        self.assertEqual(0, limit.in_flight)
+        self.assertEqual("second", second.post_chat_request(LLMContext.empty(), []).first_choice)
+
+    def test_saturated_limit_respects_budget(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=1, max_limit=1)
+        llm = LLMAdaptiveConcurrency(MockLLM.from_response("hello"), limit)
+        context = LLMContext(AgentContextStore(ChatHistory()), ExecutionContext(), Budget(0.05))
+
+        stream = llm.stream_chat_request(LLMContext.empty(), [])
+        next(stream)
+        start = time.monotonic()
+        with self.assertRaises(LLMCallTimeoutException):
+            llm.post_chat_request(context, [])
+        self.assertLess(time.monotonic() - start, 1.0)
+        stream.close()
+        self.assertEqual(0, limit.in_flight)
+        self.assertEqual(0, limit.queue_depth)
@@ -0,0 +1,114 @@
+import unittest
+from tempfile import TemporaryDirectory
+
+from council.llm import (
+    FileBatchClient,
+    LLMBatchException,
+    LLMBatchExecutor,
+    LLMCallException,
+    LLMFunction,
+    LLMMessage,
+    LLMParsingException,
+    LLMRequest,
+    LLMResponse,
+    LLMRetryPolicy,
+    OpenAIChatGPTConfiguration,
+    OpenAILLM,
+)
+from council.llm.base import LLMBatchStatus
+from council.mocks import MockLLM
+from council.prompt import LLMDatasetObject
+
+from tests import get_data_filename
+from .. import LLMDatasets
+
+
+def _completion(body, content: str):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": 1000, "completion_tokens": 100, "total_tokens": 1100},
+    }
+
+
+def _echo(body):
+    content = body["messages"][-1]["content"][0]["text"]
+    if content == "fail":
+        raise LLMCallException(400, "bad request", "mock")
+    return _completion(body, content.upper())
+
+
+class TestLLMBatchExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        config = OpenAIChatGPTConfiguration(model="gpt-4o-mini", api_key="sk-key", api_host="https://api.openai.com")
+        self.llm = OpenAILLM(config)
+        self.directory = TemporaryDirectory()
+        self.poll_policy = LLMRetryPolicy(base_delay=0.01, max_delay=0.05)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _requests(self, *contents: str):
+        return [LLMRequest.default([LLMMessage.user_message(content)]) for content in contents]
+
+    def test_execute_joins_results(self):
+        executor = LLMBatchExecutor(FileBatchClient(self.llm, self.directory.name, _echo), self.poll_policy)
+
+        responses = executor.execute(self._requests("a", "fail", "c"))
+        self.assertEqual(["A", "", "C"], [response.value for response in responses])
+        self.assertFalse(responses[1].has_result)
+
+    def test_consumptions_at_batch_pricing(self):
+        executor = LLMBatchExecutor(FileBatchClient(self.llm, self.directory.name, _echo), self.poll_policy)
+
+        [response] = executor.execute(self._requests("a"))
+        costs = {c.kind: c.value for c in response.result.consumptions if c.unit == "USD"}
+        # gpt-4o-mini is $0.15/$0.6 per million tokens, half price in batch
+        self.assertAlmostEqual((1000 * 0.15 + 100 * 0.6) / 1e6 / 2, costs["gpt-4o-mini:total_tokens_cost"])
+
+    def test_poll_until_completed(self):
+        client = FileBatchClient(self.llm, self.directory.name)
+        executor = LLMBatchExecutor(client, self.poll_policy)
+        requests = self._requests("a")
+
+        batch_id = executor.submit(requests)
+        self.assertEqual(LLMBatchStatus.InProgress, client.status(batch_id))
+        client.complete(batch_id, _echo)
+        self.assertEqual(["A"], [response.value for response in executor.wait(batch_id, requests)])
+
+    def test_timeout(self):
+        executor = LLMBatchExecutor(FileBatchClient(self.llm, self.directory.name), self.poll_policy, timeout=0.05)
+
+        with self.assertRaises(LLMBatchException):
+            executor.execute(self._requests("a"))
+
+    def test_dataset(self):
+        dataset = LLMDatasetObject.from_yaml(get_data_filename(LLMDatasets.batch))
+        executor = LLMBatchExecutor(FileBatchClient(self.llm, self.directory.name, _echo), self.poll_policy)
+
+        responses = executor.execute_dataset(dataset)
+        self.assertEqual(len(dataset.conversations), len(responses))
+        self.assertEqual("system", responses[0].request.messages[0].role)
+        self.assertEqual(dataset.conversations[0].messages[0].content.upper(), responses[0].value)
+
+    def test_llm_function_self_corrects_online(self):
+        def handler(body):
+            content = body["messages"][-1]["content"][0]["text"]
+            return _completion(body, content.upper() if content != "b" else content)
+
+        def parse(response: LLMResponse) -> str:
+            if not response.value.isupper():
+                raise LLMParsingException("Answer in upper case.")
+            return response.value
+
+        executor = LLMBatchExecutor(FileBatchClient(self.llm, self.directory.name, handler), self.poll_policy)
+        function = LLMFunction(MockLLM.from_response("FIXED"), parse, system_message="Answer in upper case")
+
+        responses = function.execute_batch(executor, ["a", "b"])
+        self.assertEqual(["A", "FIXED"], [response.response for response in responses])
+        kinds = {consumption.kind for consumption in responses[1].consumptions}
+        self.assertIn("gpt-4o-mini", kinds)
+        self.assertIn("mock_llm", kinds)
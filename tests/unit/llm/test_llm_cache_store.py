@@ -0,0 +1,130 @@
+import asyncio
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from council.contexts import Consumption
+from council.llm import (
+    InMemoryLLMCacheStore,
+    LLMCachingMiddleware,
+    LLMMessage,
+    LLMMiddlewareChain,
+    LLMRequest,
+    LLMResult,
+    SQLiteLLMCacheStore,
+)
+from council.mocks import MockLLM
+
+
+def _put_many(path: str, start: int) -> None:
+    store = SQLiteLLMCacheStore(path)
+    for i in range(start, start + 20):
+        store.put(f"key-{i}", LLMResult([f"value-{i}"]))
+    store.close()
+
+
+class TestLLMCacheStores(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._temp_dir, "cache.db")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._temp_dir)
+
+    def test_serialization(self):
+        result = LLMResult(["a", "b"], [Consumption(3, "token", "model")], {"id": "x"})
+        restored = InMemoryLLMCacheStore.deserialize(InMemoryLLMCacheStore.serialize(result))
+        self.assertEqual(["a", "b"], restored.choices)
+        self.assertEqual({"id": "x"}, restored.raw_response)
+        self.assertEqual([{"kind": "model", "unit": "token", "value": 3}], [c.to_dict() for c in restored.consumptions])
+
+    def test_sqlite_persistent(self):
+        store = SQLiteLLMCacheStore(self._path)
+        store.put("key", LLMResult(["value"]))
+        store.close()
+
+        store = SQLiteLLMCacheStore(self._path)
+        self.assertEqual(["value"], store.get("key").choices)
+        self.assertIsNone(store.get("unknown"))
+        store.clear()
+        self.assertIsNone(store.get("key"))
+
+    def test_sqlite_ttl(self):
+        store = SQLiteLLMCacheStore(self._path, ttl=0.2)
+        store.put("key", LLMResult(["value"]))
+        self.assertIsNotNone(store.get("key"))
+        time.sleep(0.3)
+        self.assertIsNone(store.get("key"))
+        self.assertEqual(0, len(store))
+
+    def test_sqlite_lru(self):
+        store = SQLiteLLMCacheStore(self._path, cache_limit_size=2, mmap_size=1 << 20)
+        store.put("a", LLMResult(["a"]))
+        time.sleep(0.01)
+        store.put("b", LLMResult(["b"]))
+        time.sleep(0.01)
+        store.get("a")
+        time.sleep(0.01)
+        store.put("c", LLMResult(["c"]))
+        self.assertEqual(2, len(store))
+        self.assertIsNone(store.get("b"))
+        self.assertIsNotNone(store.get("a"))
+        self.assertIsNotNone(store.get("c"))
+
+    def test_sqlite_multi_process(self):
+        SQLiteLLMCacheStore(self._path).close()
+        processes = [multiprocessing.Process(target=_put_many, args=(self._path, i * 20)) for i in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        store = SQLiteLLMCacheStore(self._path)
+        self.assertEqual(80, len(store))
+        self.assertEqual(["value-42"], store.get("key-42").choices)
+
+    def test_middleware_with_sqlite_store(self):
+        request = LLMRequest.default([LLMMessage.user_message("Give me an example of a currency")])
+
+        chain = LLMMiddlewareChain(
+            MockLLM.from_response("USD"), [LLMCachingMiddleware(store=SQLiteLLMCacheStore(self._path))]
+        )
+        first = chain.execute(request)
+        self.assertEqual(["call"], [c.unit for c in first.result.consumptions])
+
+        # a new middleware instance, e.g. in another process, starts warm
+        chain = LLMMiddlewareChain(
+            MockLLM.from_response("EUR"), [LLMCachingMiddleware(store=SQLiteLLMCacheStore(self._path))]
+        )
+        second = chain.execute(request)
+        self.assertEqual("USD", second.result.first_choice)
+        self.assertEqual(["cached_call"], [c.unit for c in second.result.consumptions])
+        self.assertEqual(0, second.duration)
+
+    def test_async_middleware_with_sqlite_store_off_loop(self):
+        request = LLMRequest.default([LLMMessage.user_message("Give me an example of a currency")])
+        store = SQLiteLLMCacheStore(self._path)
+        threads = []
+        get = store.get
+
+        def tracked_get(key):
+            threads.append(threading.get_ident())
+            return get(key)
+
+        store.get = tracked_get
+        chain = LLMMiddlewareChain(MockLLM.from_response("USD"), [LLMCachingMiddleware(store=store)])
+
+        async def run():
+            await chain.aexecute(request)
+            return threading.get_ident(), await chain.aexecute(request)
+
+        loop_thread, second = asyncio.run(run())
+        self.assertEqual(["cached_call"], [c.unit for c in second.result.consumptions])
+        # the store is called from worker threads, never blocking the event loop
+        self.assertGreater(len(threads), 0)
+        self.assertNotIn(loop_thread, threads)
+        store.close()
@@ -1,19 +1,39 @@
+import asyncio
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import dotenv
 
+from council.contexts import AgentContextStore, Budget, ChatHistory, ExecutionContext, LLMContext
 from council.llm import (
     AnthropicLLMConfiguration,
+    InMemoryLLMCacheStore,
+    LLMMiddlewareChain,
+    LLMResult,
     GeminiLLMConfiguration,
     OpenAIChatGPTConfiguration,
     LLMCachingMiddleware,
+    LLMCallTimeoutException,
     LLMRequest,
     LLMMessage,
     LLMMessageData,
 )
+from council.mocks import MockLLM
 from council.utils import OsEnviron
 
 
+class CountingLLM(MockLLM):
+    def __init__(self, delay: float) -> None:
+        super().__init__(action=self._count, delay=delay)
+        self.calls = 0
+
+    def _count(self, messages):
+        self.calls += 1
+        return [f"response {messages[-1].content}"]
+
+
 class TestLlmCachingMiddleware(unittest.TestCase):
     def setUp(self) -> None:
         dotenv.load_dotenv()
@@ -66,3 +86,106 @@ class TestLlmCachingMiddleware(unittest.TestCase):
         self.assertNotEqual(self.get_hash(messages, self.anthropic_config), self.get_hash(messages, self.gemini_config))
         self.assertNotEqual(self.get_hash(messages, self.anthropic_config), self.get_hash(messages, self.openai_config))
         self.assertNotEqual(self.get_hash(messages, self.gemini_config), self.get_hash(messages, self.openai_config))
+
+    def test_single_flight(self):
+        llm = CountingLLM(delay=0.5)
+        chain = LLMMiddlewareChain(llm, [LLMCachingMiddleware()])
+        request = LLMRequest.default([LLMMessage.user_message("same")])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda _: chain.execute(request), range(8)))
+
+        self.assertEqual(1, llm.calls)
+        self.assertTrue(all(r.result.first_choice == "response same" for r in responses))
+        units = sorted(r.result.consumptions[0].unit for r in responses)
+        self.assertEqual(["cached_call"] * 7 + ["call"], units)
+
+    def test_async_single_flight(self):
+        llm = CountingLLM(delay=0.5)
+        chain = LLMMiddlewareChain(llm, [LLMCachingMiddleware()])
+
+        async def run_all():
+            requests = [LLMRequest.default([LLMMessage.user_message(f"message {i % 2}")]) for i in range(10)]
+            return await asyncio.gather(*[chain.aexecute(r) for r in requests])
+
+        responses = asyncio.run(run_all())
+        self.assertEqual(2, llm.calls)
+        self.assertEqual(10, len(responses))
+
+    def test_coalesced_request_respects_budget(self):
+        llm = CountingLLM(delay=0.5)
+        chain = LLMMiddlewareChain(llm, [LLMCachingMiddleware()])
+        messages = [LLMMessage.user_message("same")]
+        short = LLMRequest(LLMContext(AgentContextStore(ChatHistory()), ExecutionContext(), Budget(0.1)), messages)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(chain.execute, LLMRequest.default(messages))
+            time.sleep(0.05)
+            start = time.monotonic()
+            with self.assertRaises(LLMCallTimeoutException):
+                chain.execute(short)
+            self.assertLess(time.monotonic() - start, 0.4)
+            self.assertEqual("response same", leader.result().result.first_choice)
+        self.assertEqual(1, llm.calls)
+
+    def test_async_coalesced_request_respects_budget(self):
+        llm = CountingLLM(delay=0.5)
+        chain = LLMMiddlewareChain(llm, [LLMCachingMiddleware()])
+        messages = [LLMMessage.user_message("same")]
+
+        async def run():
+            leader = asyncio.ensure_future(chain.aexecute(LLMRequest.default(messages)))
+            await asyncio.sleep(0.05)
+            context = LLMContext(AgentContextStore(ChatHistory()), ExecutionContext(), Budget(0.1))
+            with self.assertRaises(LLMCallTimeoutException):
+                await chain.aexecute(LLMRequest(context, messages))
+            return await leader
+
+        self.assertEqual("response same", asyncio.run(run()).result.first_choice)
+        self.assertEqual(1, llm.calls)
+
+    def test_concurrent_distinct_requests(self):
+        llm = CountingLLM(delay=0.0)
+        chain = LLMMiddlewareChain(llm, [LLMCachingMiddleware(cache_limit_size=16)])
+
+        def run(i: int) -> str:
+            return chain.execute(LLMRequest.default([LLMMessage.user_message(f"{i % 32}")])).result.first_choice
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(run, range(256)))
+        self.assertEqual([f"response {i % 32}" for i in range(256)], results)
+
+    def test_in_memory_store_expiry(self):
+        store = InMemoryLLMCacheStore(ttl=0.2, cache_limit_size=10)
+        store.put("old", LLMResult(["old"]))
+        time.sleep(0.3)
+        store.put("new", LLMResult(["new"]))
+        self.assertEqual(1, len(store))
+        self.assertIsNone(store.get("old"))
+        self.assertEqual(["new"], store.get("new").choices)
+
+    def test_message_fingerprint_memoized(self):
+        message = LLMMessage.user_message("User message")
+        fingerprint = message.fingerprint
+        with patch.object(LLMMessage, "normalize", side_effect=AssertionError("normalize called")):
+            self.assertEqual(fingerprint, message.fingerprint)
+            self.get_hash([message])
+
+        message.add_data(LLMMessageData(content="data", mime_type=""))
+        self.assertNotEqual(fingerprint, message.fingerprint)
+
+    def test_configuration_fingerprint_reused(self):
+        llm = CountingLLM(delay=0.0)
+        middleware = LLMCachingMiddleware()
+        chain = LLMMiddlewareChain(llm, [middleware])
+        request = LLMRequest.default([LLMMessage.user_message("message")])
+
+        chain.execute(request)
+        with patch.object(
+            LLMCachingMiddleware, "get_configuration_fingerprint", side_effect=AssertionError("fingerprint computed")
+        ):
+            response = chain.execute(request)
+        self.assertEqual("cached_call", response.result.consumptions[0].unit)
+        self.assertEqual(
+            LLMCachingMiddleware.get_hash(request, llm.configuration), middleware._get_key(request, llm.configuration)
+        )
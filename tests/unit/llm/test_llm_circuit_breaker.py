@@ -0,0 +1,125 @@
+import asyncio
+import time
+import unittest
+
+from council.contexts import LLMContext
+from council.llm import (
+    CircuitBreaker,
+    CircuitState,
+    LLMCallException,
+    LLMCircuitBreaker,
+    LLMCircuitOpenException,
+    LLMFallback,
+    LLMRetryPolicy,
+)
+from council.mocks import MockErrorLLM, MockLLM
+
+
+class CountingErrorLLM(MockErrorLLM):
+    def __init__(self, exception: LLMCallException) -> None:
+        super().__init__(exception)
+        self.calls = 0
+
+    def _post_chat_request(self, context, messages, **kwargs):
+        self.calls += 1
+        return super()._post_chat_request(context, messages, **kwargs)
+
+    async def _apost_chat_request(self, context, messages, **kwargs):
+        self.calls += 1
+        return await super()._apost_chat_request(context, messages, **kwargs)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    @staticmethod
+    def _record(breaker: CircuitBreaker, exception=None) -> None:
+        breaker.release(breaker.acquire(), exception)
+
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4)
+        self._record(breaker)
+        self._record(breaker)
+        self._record(breaker, LLMCallException(500, "boom", "mock"))
+        self.assertEqual(CircuitState.Closed, breaker.state)
+
+        self._record(breaker, LLMCallException(503, "unavailable", "mock"))
+        self.assertEqual(CircuitState.Open, breaker.state)
+        self.assertIsNone(breaker.acquire())
+        self.assertGreater(breaker.retry_after, 0.0)
+
+    def test_client_errors_are_not_failures(self):
+        breaker = CircuitBreaker(window=2, min_calls=2)
+        self._record(breaker, LLMCallException(400, "bad request", "mock"))
+        self._record(breaker, LLMCallException(401, "unauthorized", "mock"))
+        self.assertEqual(CircuitState.Closed, breaker.state)
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker(window=1, min_calls=1, open_duration=0.05)
+        self._record(breaker, LLMCallException(500, "boom", "mock"))
+        self.assertEqual(CircuitState.Open, breaker.state)
+
+        time.sleep(0.06)
+        self.assertEqual(CircuitState.HalfOpen, breaker.state)
+        probe = breaker.acquire()
+        self.assertIsNotNone(probe)
+        self.assertIsNone(breaker.acquire())
+
+        breaker.release(probe, LLMCallException(500, "boom", "mock"))
+        self.assertEqual(CircuitState.Open, breaker.state)
+
+        time.sleep(0.06)
+        self._record(breaker)
+        self.assertEqual(CircuitState.Closed, breaker.state)
+
+    def test_cancelled_probe_frees_slot(self):
+        breaker = CircuitBreaker(window=1, min_calls=1, open_duration=0.0)
+        self._record(breaker, LLMCallException(500, "boom", "mock"))
+
+        breaker.release(breaker.acquire(), asyncio.CancelledError())
+        self.assertEqual(CircuitState.HalfOpen, breaker.state)
+        self.assertIsNotNone(breaker.acquire())
+
+
+class TestLLMCircuitBreaker(unittest.TestCase):
+    def test_fails_fast_when_open(self):
+        inner = CountingErrorLLM(LLMCallException(500, "boom", "mock"))
+        llm = LLMCircuitBreaker(inner, CircuitBreaker(window=2, min_calls=2))
+
+        for _ in range(2):
+            with self.assertRaises(LLMCallException):
+                llm.post_chat_request(LLMContext.empty(), [])
+        with self.assertRaises(LLMCircuitOpenException):
+            llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual(2, inner.calls)
+
+    def test_fallback_short_circuits(self):
+        primary = CountingErrorLLM(LLMCallException(503, "unavailable", "mock"))
+        fallback = MockLLM.from_response("FallBack")
+        breaker = CircuitBreaker(window=2, min_calls=2, open_duration=60)
+        llm = LLMFallback(
+            primary,
+            fallback,
+            retry_before_fallback=3,
+            retry_policy=LLMRetryPolicy(base_delay=0.01),
+            circuit_breaker=breaker,
+        )
+
+        self.assertEqual("FallBack", llm.post_chat_request(LLMContext.empty(), []).first_choice)
+        self.assertEqual(2, primary.calls)
+        self.assertEqual(CircuitState.Open, breaker.state)
+
+        start = time.monotonic()
+        for _ in range(5):
+            self.assertEqual("FallBack", llm.post_chat_request(LLMContext.empty(), []).first_choice)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(2, primary.calls)
+
+    def test_async_fallback_short_circuits(self):
+        primary = CountingErrorLLM(LLMCallException(500, "boom", "mock"))
+        fallback = MockLLM.from_response("FallBack")
+        llm = LLMFallback(primary, fallback, circuit_breaker=CircuitBreaker(window=1, min_calls=1, open_duration=60))
+
+        async def run():
+            return [await llm.apost_chat_request(LLMContext.empty(), []) for _ in range(3)]
+
+        self.assertEqual(["FallBack"] * 3, [result.first_choice for result in asyncio.run(run())])
+        self.assertEqual(1, primary.calls)
@@ -2,6 +2,8 @@ from council import OpenAILLM, AzureLLM, AnthropicLLM, GeminiLLM
 from council.llm import (
     get_llm_from_config,
     LLMFallback,
+    LLMLoadBalancer,
+    LoadBalancingStrategy,
     OpenAIChatGPTConfiguration,
     OllamaLLM,
     OllamaLLMConfiguration,
@@ -89,6 +91,27 @@ def test_azure_with_openai_fallback_from_yaml():
         assert isinstance(llm.fallback, OpenAILLM)
 
 
+def test_azure_load_balanced_with_openai_from_yaml():
+    filename = get_data_filename(LLMModels.AzureLoadBalanced)
+
+    with (
+        OsEnviron("OPENAI_API_KEY", "sk-key"),
+        OsEnviron("OPENAI_LLM_MODEL", "gpt-not-default"),
+        OsEnviron("AZURE_LLM_API_KEY", "abcd"),
+        OsEnviron("AZURE_LLM_API_BASE", "https://chainml"),
+    ):
+        llm = get_llm_from_config(filename)
+        assert isinstance(llm, LLMLoadBalancer)
+        assert llm.strategy == LoadBalancingStrategy.Weighted
+        assert isinstance(llm.llms[0], AzureLLM)
+        assert isinstance(llm.llms[1], OpenAILLM)
+
+    config = LLMConfigObject.from_yaml(filename)
+    assert config.spec.provider.weight == 2.0
+    assert config.spec.load_balancing.max_failures == 5
+    assert config.spec.load_balancing.ejection_duration == 60.0
+
+
 def test_ollama_from_yaml():
     filename = get_data_filename(LLMModels.Ollama)
 
@@ -26,6 +26,10 @@ class TestAnthropicConsumptionCalculator(unittest.TestCase):
         for model in calculator.COSTS_CACHING.keys():
             self.assertIn(model, calculator.COSTS)
 
+    def test_all_models_have_context_window(self):
+        for model in AnthropicConsumptionCalculator.COSTS.keys():
+            self.assertEqual(200_000, AnthropicConsumptionCalculator(model).find_context_window())
+
     def test_haiku_3_cost_calculation(self):
         cost_card = AnthropicConsumptionCalculator("claude-3-haiku-20240307").find_model_costs()
 
@@ -198,6 +202,11 @@ class TestGeminiConsumptionCalculator(unittest.TestCase):
 
         self.assertEqual(keys_up_to_128k, keys_longer_128k)
 
+    def test_all_models_have_context_window(self):
+        for model in GeminiConsumptionCalculator.COSTS_UNDER_128k.keys():
+            self.assertIsNotNone(GeminiConsumptionCalculator(model, 0).find_context_window())
+        self.assertEqual(2_097_152, GeminiConsumptionCalculator("gemini-1.5-pro", 0).find_context_window())
+
     def test_find_model_costs_under_128k(self):
         n = 100_000
 
@@ -372,6 +381,11 @@ class TestGroqConsumptionCalculator(unittest.TestCase):
         for cost_card in calculator.COSTS.values():
             ensure_cost_are_floats(cost_card)
 
+    def test_all_models_have_context_window(self):
+        for model in GroqConsumptionCalculator.COSTS.keys():
+            self.assertIsNotNone(GroqConsumptionCalculator(model).find_context_window())
+        self.assertIsNone(GroqConsumptionCalculator("model").find_context_window())
+
     def test_gemma_cost_calculations(self):
         cost_card = GroqConsumptionCalculator("gemma2-9b-it").find_model_costs()
         prompt_cost, completion_cost = cost_card.get_costs(1_000_000, 500_000)
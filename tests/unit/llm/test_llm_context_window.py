@@ -0,0 +1,47 @@
+import unittest
+
+from council.llm import LLMContextWindow, LLMMessage
+from council.mocks.mock_llm import MockTokenCounter
+
+
+class TestLLMContextWindow(unittest.TestCase):
+    def setUp(self) -> None:
+        self.messages = [
+            LLMMessage.system_message("system"),
+            LLMMessage.user_message("aaaa"),
+            LLMMessage.assistant_message("bbbb"),
+            LLMMessage.user_message("cc"),
+        ]
+
+    def test_token_count(self):
+        window = LLMContextWindow(MockTokenCounter(), self.messages)
+        self.assertEqual(16, window.token_count)
+        self.assertEqual(4, len(window))
+
+        window.append(LLMMessage.assistant_message("ddd"))
+        self.assertEqual(19, window.token_count)
+
+    def test_last_messages_pin_system(self):
+        window = LLMContextWindow(MockTokenCounter(), self.messages)
+        self.assertEqual(self.messages, window.last_messages(16))
+        self.assertEqual([self.messages[0], self.messages[3]], window.last_messages(11))
+        self.assertEqual([self.messages[0], *self.messages[2:]], window.last_messages(12))
+        self.assertEqual([self.messages[0]], window.last_messages(6))
+        self.assertEqual([], window.last_messages(5))
+
+    def test_last_messages(self):
+        window = LLMContextWindow(MockTokenCounter(), self.messages, pin_system=False)
+        self.assertEqual(self.messages[1:], window.last_messages(15))
+        self.assertEqual(self.messages[3:], window.last_messages(5))
+        self.assertEqual([], window.last_messages(1))
+
+    def test_first_messages(self):
+        window = LLMContextWindow(MockTokenCounter(), self.messages)
+        self.assertEqual(self.messages, window.first_messages(100))
+        self.assertEqual(self.messages[:2], window.first_messages(13))
+        self.assertEqual([], window.first_messages(5))
+
+    def test_count_over_limit(self):
+        window = LLMContextWindow(MockTokenCounter(limit=5), self.messages)
+        self.assertEqual(16, window.token_count)
+        self.assertEqual(self.messages[:2], window.first_messages(10))
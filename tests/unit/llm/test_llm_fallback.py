@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 
 from council.contexts import LLMContext
@@ -54,3 +55,24 @@ class TestLLMFallBack(unittest.TestCase):
         self.assertEqual(e.exception.code, 403)
         self.assertEqual(e.exception.__cause__.code, 401)
         self.assertIn("Wrong status code: 403", str(e.exception))
+
+    def test_async_fallback_with_retryable_error(self):
+        m = MockErrorLLM(exception=LLMCallException(503, "Service unavailable", "mock-503"))
+        fb = MockLLM.from_response("FallBack")
+
+        fb_llm = LLMFallback(m, fb, retry_before_fallback=2)
+
+        r = asyncio.run(fb_llm.apost_chat_request(LLMContext.empty(), []))
+        self.assertEqual("FallBack", r.first_choice)
+
+    def test_async_error(self):
+        m = MockErrorLLM(exception=LLMCallException(401, "Unauthorized", "mock-401"))
+        fb = MockErrorLLM(exception=LLMCallException(403, "Forbidden", "mock-403"))
+
+        fb_llm = LLMFallback(m, fb, retry_before_fallback=1000)
+
+        with self.assertRaises(LLMCallException) as e:
+            _r = asyncio.run(fb_llm.apost_chat_request(LLMContext.empty(), []))
+
+        self.assertEqual(e.exception.code, 403)
+        self.assertEqual(e.exception.__cause__.code, 401)
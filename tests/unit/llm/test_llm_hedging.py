@@ -0,0 +1,152 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+from council.contexts import Budget, Consumption, LLMContext, Monitored
+from council.llm import LLMCallException, LLMCallTimeoutException, LLMHedging, LLMMessage
+from council.mocks import MockErrorLLM, MockLLM
+
+
+class ScriptedLLM(MockLLM):
+    """Mock LLM answering with the next delay of a script, then with the default delay."""
+
+    def __init__(self, response: str, delays: List[float], default_delay: float = 0.0) -> None:
+        super().__init__(action=lambda messages: [response])
+        self._delays = list(delays)
+        self._default_delay = default_delay
+        self.calls = 0
+        self.cancelled = 0
+
+    def _next_delay(self) -> float:
+        self.calls += 1
+        return self._delays.pop(0) if len(self._delays) > 0 else self._default_delay
+
+    def _post_chat_request(self, context, messages, **kwargs):
+        time.sleep(self._next_delay())
+        return self._to_result(messages)
+
+    async def _apost_chat_request(self, context, messages, **kwargs):
+        try:
+            await asyncio.sleep(self._next_delay())
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self._to_result(messages)
+
+
+class TestLLMHedging(unittest.TestCase):
+    def _warm_up(self, llm: LLMHedging, count: int) -> None:
+        for _ in range(count):
+            llm.post_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")])
+
+    def test_no_hedge_before_warm_up(self):
+        primary = ScriptedLLM("primary", [0.2])
+        hedge = ScriptedLLM("hedge", [])
+        llm = LLMHedging(primary, hedge, min_samples=5)
+
+        result = llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual("primary", result.first_choice)
+        self.assertEqual(0, hedge.calls)
+        llm.close()
+        self.assertIsNone(llm.hedge_delay)
+
+    def test_hedge_slow_request(self):
+        primary = ScriptedLLM("primary", [0.01] * 10 + [2.0], default_delay=0.01)
+        hedge = ScriptedLLM("hedge", [], default_delay=0.01)
+        llm = LLMHedging(primary, hedge, quantile=0.9, max_hedge_rate=0.5, min_samples=10)
+        self._warm_up(llm, 10)
+        self.assertIsNotNone(llm.hedge_delay)
+
+        start = time.monotonic()
+        result = llm.post_chat_request(LLMContext.empty(), [])
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual("hedge", result.first_choice)
+        self.assertEqual(1, hedge.calls)
+
+        self.assertIn("hedged_call", [c.unit for c in result.consumptions])
+        llm.close()
+
+    def test_learns_latency_of_losing_primary(self):
+        primary = ScriptedLLM("primary", [0.01] * 10 + [0.3], default_delay=0.01)
+        hedge = ScriptedLLM("hedge", [], default_delay=0.01)
+        llm = LLMHedging(primary, hedge, quantile=0.95, max_hedge_rate=0.5, min_samples=10, window=11)
+        self._warm_up(llm, 10)
+
+        result = llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual("hedge", result.first_choice)
+        time.sleep(0.5)
+        self.assertGreaterEqual(llm.hedge_delay, 0.3)
+        llm.close()
+
+    def test_late_loser_consumptions_hedged(self):
+        primary = ScriptedLLM("primary", [0.01] * 10 + [0.3], default_delay=0.01)
+        hedge = ScriptedLLM("hedge", [], default_delay=0.01)
+        llm = LLMHedging(primary, hedge, quantile=0.9, max_hedge_rate=0.5, min_samples=10)
+        self._warm_up(llm, 10)
+
+        budget = Budget(5, limits=[Consumption.call(2, "mock_llm"), Consumption(2, "hedged_call", "mock_llm")])
+        context = LLMContext.from_context(LLMContext.empty(), Monitored("llm", llm), budget)
+        result = llm.post_chat_request(context, [])
+        self.assertEqual("hedge", result.first_choice)
+        self.assertNotIn("hedged_call", [c.unit for c in result.consumptions if c.kind == "mock_llm"])
+
+        time.sleep(0.5)
+        # only the winner is a regular call, the loser completing after the result is a hedged one
+        self.assertTrue(budget.can_consume(1, "call", "mock_llm"))
+        self.assertFalse(budget.can_consume(2, "call", "mock_llm"))
+        self.assertTrue(budget.can_consume(1, "hedged_call", "mock_llm"))
+        self.assertFalse(budget.can_consume(2, "hedged_call", "mock_llm"))
+        llm.close()
+
+    def test_primary_not_started_within_budget(self):
+        primary = ScriptedLLM("primary", [])
+        llm = LLMHedging(primary, max_workers=1)
+        # keep the only worker thread busy
+        busy = llm._executor.submit(time.sleep, 0.5)
+
+        context = LLMContext.from_context(LLMContext.empty(), Monitored("llm", llm), Budget(0.2))
+        start = time.monotonic()
+        with self.assertRaises(LLMCallTimeoutException):
+            llm.post_chat_request(context, [])
+        self.assertLess(time.monotonic() - start, 0.5)
+        busy.result()
+        self.assertEqual(0, primary.calls)
+        llm.close()
+
+    def test_hedge_rate_capped(self):
+        primary = ScriptedLLM("primary", [0.01] * 10, default_delay=0.1)
+        hedge = ScriptedLLM("hedge", [], default_delay=0.5)
+        llm = LLMHedging(primary, hedge, max_hedge_rate=0.2, min_samples=10, window=20)
+        self._warm_up(llm, 20)
+
+        self.assertLessEqual(llm.hedge_rate, 0.2)
+        self.assertGreater(hedge.calls, 0)
+        self.assertLessEqual(hedge.calls, 4)
+        llm.close()
+
+    def test_no_hedge_on_fast_failure(self):
+        hedge = ScriptedLLM("hedge", [])
+        llm = LLMHedging(MockErrorLLM(LLMCallException(500, "boom", "mock")), hedge)
+
+        with self.assertRaises(LLMCallException):
+            llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual(0, hedge.calls)
+        llm.close()
+
+    def test_async_hedge_cancels_loser(self):
+        primary = ScriptedLLM("primary", [0.01] * 10 + [5.0], default_delay=0.01)
+        hedge = ScriptedLLM("hedge", [], default_delay=0.01)
+        llm = LLMHedging(primary, hedge, quantile=0.9, max_hedge_rate=0.5, min_samples=10)
+
+        async def run():
+            for _ in range(10):
+                await llm.apost_chat_request(LLMContext.empty(), [])
+            return await llm.apost_chat_request(LLMContext.empty(), [])
+
+        start = time.monotonic()
+        result = asyncio.run(run())
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual("hedge", result.first_choice)
+        self.assertEqual(1, primary.cancelled)
+        self.assertIn("hedged_call", [c.unit for c in result.consumptions])
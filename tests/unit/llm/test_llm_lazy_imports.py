@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import unittest
+
+from council.llm import LLMProviders
+from council.llm.base import _PROVIDER_TO_LLM
+
+_SDKS = ["anthropic", "google.generativeai", "groq", "ollama", "tiktoken"]
+
+
+def _loaded_sdks(statement: str) -> str:
+    script = f"import sys\n{statement}\nprint(','.join(m for m in {_SDKS!r} if m in sys.modules))"
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.strip()
+
+
+class TestLLMLazyImports(unittest.TestCase):
+    def test_import_council_loads_no_sdk(self):
+        self.assertEqual("", _loaded_sdks("import council"))
+
+    def test_provider_loads_its_sdk_only(self):
+        self.assertEqual("anthropic", _loaded_sdks("from council.llm import AnthropicLLM"))
+        self.assertEqual("groq", _loaded_sdks("import council\ncouncil.GroqLLM"))
+
+    def test_provider_to_llm(self):
+        self.assertEqual(6, len(_PROVIDER_TO_LLM))
+        self.assertEqual("OllamaLLM", _PROVIDER_TO_LLM[LLMProviders.Ollama].__name__)
+
+    def test_unknown_attribute(self):
+        import council.llm
+
+        with self.assertRaises(AttributeError):
+            _ = council.llm.UnknownLLM
@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from council.contexts import LLMContext
+from council.llm import LLMCallException, LLMLoadBalancer, LoadBalancingStrategy
+from council.mocks import MockErrorLLM, MockLLM
+
+
+class InterruptedLLM(MockLLM):
+    def _post_chat_request(self, context, messages, **kwargs):
+        raise KeyboardInterrupt()
+
+
+class TestLLMLoadBalancer(unittest.TestCase):
+    def _answers(self, llm: LLMLoadBalancer, count: int) -> Counter:
+        return Counter(llm.post_chat_request(LLMContext.empty(), []).first_choice for _ in range(count))
+
+    def test_weighted(self):
+        llm = LLMLoadBalancer(
+            [MockLLM.from_response("a"), MockLLM.from_response("b")],
+            strategy=LoadBalancingStrategy.Weighted,
+            weights=[3, 1],
+        )
+
+        self.assertEqual(Counter({"a": 30, "b": 10}), self._answers(llm, 40))
+
+    def test_least_outstanding_spreads_concurrent_requests(self):
+        llm = LLMLoadBalancer([MockLLM.from_response("a", delay=0.2), MockLLM.from_response("b", delay=0.2)])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(llm.post_chat_request, LLMContext.empty(), []) for _ in range(4)]
+            answers = Counter(future.result().first_choice for future in futures)
+        self.assertEqual(Counter({"a": 2, "b": 2}), answers)
+
+    def test_ewma_latency_prefers_fastest(self):
+        llm = LLMLoadBalancer(
+            [MockLLM.from_response("slow", delay=0.05), MockLLM.from_response("fast", delay=0.01)],
+            strategy=LoadBalancingStrategy.EWMALatency,
+        )
+
+        answers = self._answers(llm, 10)
+        self.assertGreater(answers["fast"], answers["slow"])
+
+    def test_ewma_latency_penalizes_fast_failures(self):
+        unauthorized = MockErrorLLM(LLMCallException(401, "unauthorized", "mock"))
+        llm = LLMLoadBalancer(
+            [unauthorized, MockLLM.from_response("ok", delay=0.01)],
+            strategy=LoadBalancingStrategy.EWMALatency,
+            failure_penalty=1.0,
+        )
+
+        errors = 0
+        for _ in range(20):
+            try:
+                llm.post_chat_request(LLMContext.empty(), [])
+            except LLMCallException:
+                errors += 1
+        self.assertLessEqual(errors, 1)
+        self.assertEqual(2, len(llm.healthy_llms))
+
+    def test_eject_unhealthy_member(self):
+        failing = MockErrorLLM(LLMCallException(503, "unavailable", "mock"))
+        llm = LLMLoadBalancer(
+            [failing, MockLLM.from_response("ok")],
+            strategy=LoadBalancingStrategy.Weighted,
+            max_failures=2,
+            ejection_duration=60,
+        )
+
+        errors = 0
+        for _ in range(4):
+            try:
+                llm.post_chat_request(LLMContext.empty(), [])
+            except LLMCallException:
+                errors += 1
+        self.assertEqual(2, errors)
+        self.assertEqual([llm.llms[1]], llm.healthy_llms)
+        self.assertEqual(Counter({"ok": 10}), self._answers(llm, 10))
+
+    def test_client_errors_do_not_eject(self):
+        llm = LLMLoadBalancer([MockErrorLLM(LLMCallException(400, "bad request", "mock"))], max_failures=1)
+
+        with self.assertRaises(LLMCallException):
+            llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual(1, len(llm.healthy_llms))
+
+    def test_interrupted_request_is_released(self):
+        llm = LLMLoadBalancer([InterruptedLLM()])
+
+        with self.assertRaises(KeyboardInterrupt):
+            llm.post_chat_request(LLMContext.empty(), [])
+        self.assertEqual(0, llm._members[0].outstanding)
+
+    def test_consumptions_reported_per_member(self):
+        llm = LLMLoadBalancer([MockLLM.from_response("a"), MockLLM.from_response("b")])
+        context = LLMContext.empty()
+
+        llm.post_chat_request(context, [])
+        llm.post_chat_request(context, [])
+        members = [child["name"] for child in llm.render_as_dict()["children"]]
+        self.assertEqual(["members[0]", "members[1]"], members)
+
+    def test_async(self):
+        llm = LLMLoadBalancer(
+            [MockLLM.from_response("a", delay=0.1), MockLLM.from_response("b", delay=0.1)],
+        )
+
+        async def run():
+            return await asyncio.gather(*[llm.apost_chat_request(LLMContext.empty(), []) for _ in range(4)])
+
+        answers = Counter(result.first_choice for result in asyncio.run(run()))
+        self.assertEqual(Counter({"a": 2, "b": 2}), answers)
+
+    def test_invalid_weights(self):
+        with self.assertRaises(ValueError):
+            LLMLoadBalancer([MockLLM()], weights=[0])
+        with self.assertRaises(ValueError):
+            LLMLoadBalancer([])
@@ -1,3 +1,4 @@
+import asyncio
 import glob
 import os
 import shutil
@@ -6,6 +7,8 @@ import time
 import unittest
 
 from council.llm import (
+    FunctionOutOfRetryError,
+    LLMFunction,
     LLMMessage,
     LLMException,
     LLMFallback,
@@ -16,6 +19,7 @@ from council.llm import (
     LLMLoggingMiddleware,
     LLMRetryMiddleware,
     LLMTimestampFileLoggingMiddleware,
+    StringResponseParser,
 )
 from council.mocks import MockLLM, MockErrorLLM
 
@@ -65,6 +69,68 @@ class TestLlmMiddleware(unittest.TestCase):
         response = with_retry.execute(request)
         self.assertEqual("USD", response.result.first_choice)
 
+    def test_async_with_retry(self):
+        messages = [LLMMessage.user_message("Give me an example of a currency")]
+        request = LLMRequest.default(messages)
+
+        with_retry = LLMMiddlewareChain(MockErrorLLM())
+        with_retry.add_middleware(LLMLoggingMiddleware())
+        with_retry.add_middleware(LLMRetryMiddleware(retries=3, delay=0.1, exception_to_check=LLMException))
+        with self.assertRaises(LLMOutOfRetriesException):
+            _ = asyncio.run(with_retry.aexecute(request))
+
+    def test_async_with_sync_only_middleware(self):
+        messages = [LLMMessage.user_message("Give me an example of a currency")]
+        request = LLMRequest.default(messages)
+        calls = []
+
+        def sync_middleware(llm, execute, r):
+            calls.append("before")
+            response = execute(r)
+            calls.append("after")
+            return response
+
+        chain = LLMMiddlewareChain(self._llm, [LLMLoggingMiddleware(), sync_middleware])
+        response = asyncio.run(chain.aexecute(request))
+        self.assertEqual("USD", response.result.first_choice)
+        self.assertEqual(["before", "after"], calls)
+
+    def test_async_llm_function(self):
+        llm_function = LLMFunction(self._llm, StringResponseParser.from_response, system_message="Be helpful")
+        llm_function.add_middleware(LLMLoggingMiddleware())
+
+        async def run_all():
+            return await asyncio.gather(*[llm_function.aexecute(f"currency {i}") for i in range(5)])
+
+        self.assertEqual(["USD"] * 5, asyncio.run(run_all()))
+
+    def test_llm_function_call_error_without_response(self):
+        error = LLMCallTimeoutException(timeout=1.0, llm_name="mock")
+        llm_function = LLMFunction(MockErrorLLM(error), StringResponseParser.from_response, "Be helpful", max_retries=1)
+
+        for execute in [llm_function.execute, lambda message: asyncio.run(llm_function.aexecute(message))]:
+            with self.assertRaises(FunctionOutOfRetryError) as cm:
+                execute("currency")
+            self.assertEqual([error, error], cm.exception.exceptions)
+
+    def test_llm_function_retries_call_error(self):
+        calls = []
+
+        def fail_once(llm, execute, request):
+            calls.append(request)
+            if len(calls) % 2 == 1:
+                raise LLMCallTimeoutException(timeout=1.0, llm_name="mock")
+            return execute(request)
+
+        llm_function = LLMFunction(self._llm, StringResponseParser.from_response, "Be helpful", max_retries=1)
+        llm_function.add_middleware(fail_once)
+
+        response = llm_function.execute_with_llm_response("currency")
+        self.assertEqual("USD", response.response)
+        self.assertGreaterEqual(response.duration, 0.0)
+        self.assertEqual("USD", asyncio.run(llm_function.aexecute("currency")))
+        self.assertEqual(4, len(calls))
+
 
 class TestLlmTimestampFileLoggingMiddleware(unittest.TestCase):
     def setUp(self) -> None:
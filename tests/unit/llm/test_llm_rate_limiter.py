@@ -0,0 +1,145 @@
+import asyncio
+import time
+import unittest
+
+from council.contexts import AgentContextStore, Budget, ChatHistory, Consumption, ExecutionContext, LLMContext
+from council.llm import (
+    LLMConfigObject,
+    LLMMessage,
+    LLMRateLimiter,
+    LLMRateLimitException,
+    get_llm_from_config_obj,
+)
+from council.llm.base.llm_rate_limiter import TokenBucket
+from council.mocks import MockLLM
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_reserve(self):
+        bucket = TokenBucket(capacity=2, refill_per_second=1)
+        now = time.monotonic()
+        self.assertEqual(0.0, bucket.reserve(1, now))
+        self.assertEqual(0.0, bucket.reserve(1, now))
+        self.assertAlmostEqual(1.0, bucket.reserve(1, now), places=3)
+        self.assertAlmostEqual(2.0, bucket.reserve(1, now), places=3)
+
+    def test_release(self):
+        bucket = TokenBucket(capacity=1, refill_per_second=1)
+        now = time.monotonic()
+        bucket.reserve(1, now)
+        bucket.release(1)
+        self.assertEqual(0.0, bucket.reserve(1, now))
+
+    def test_amount_capped_at_capacity(self):
+        bucket = TokenBucket(capacity=10, refill_per_second=10)
+        self.assertEqual(0.0, bucket.reserve(100, time.monotonic()))
+
+
+class TestLLMRateLimiter(unittest.TestCase):
+    def test_acquire_waits(self):
+        limiter = LLMRateLimiter(requests_per_minute=120)  # 2 per second
+        start = time.monotonic()
+        for _ in range(121):
+            limiter.acquire()
+        self.assertGreater(time.monotonic() - start, 0.4)
+
+    def test_fail_fast(self):
+        limiter = LLMRateLimiter(tokens_per_minute=60, fail_fast=True)
+        limiter.acquire(tokens=60)
+        with self.assertRaises(LLMRateLimitException) as cm:
+            limiter.acquire(tokens=30, llm_name="llm")
+        self.assertAlmostEqual(30.0, cm.exception.wait, places=1)
+
+        # the failed reservation is given back
+        limiter.adjust(-30)
+        limiter.acquire(tokens=30)
+
+    def test_timeout(self):
+        limiter = LLMRateLimiter(requests_per_minute=1)
+        limiter.acquire()
+        with self.assertRaises(LLMRateLimitException):
+            limiter.acquire(timeout=1.0)
+
+    def test_reconcile(self):
+        limiter = LLMRateLimiter(tokens_per_minute=100, fail_fast=True)
+        limiter.acquire(tokens=100)
+        limiter.reconcile(100, [Consumption.token(10, "model:total_tokens")])
+        limiter.acquire(tokens=80)
+
+    def test_shared(self):
+        limiter = LLMRateLimiter.shared("test:shared", requests_per_minute=10)
+        self.assertIs(limiter, LLMRateLimiter.shared("test:shared", requests_per_minute=10))
+        self.assertIsNot(limiter, LLMRateLimiter.shared("test:other", requests_per_minute=10))
+
+    def test_shared_with_different_limits(self):
+        LLMRateLimiter.shared("test:conflict", requests_per_minute=10, tokens_per_minute=1000)
+        with self.assertRaises(ValueError):
+            LLMRateLimiter.shared("test:conflict", requests_per_minute=20, tokens_per_minute=1000)
+        with self.assertRaises(ValueError):
+            LLMRateLimiter.from_dict("test:conflict", {"requestsPerMinute": 10, "tokensPerMinute": 2000})
+        with self.assertRaises(ValueError):
+            LLMRateLimiter.from_dict(
+                "test:conflict", {"requestsPerMinute": 10, "tokensPerMinute": 1000, "failFast": True}
+            )
+
+
+class TestLLMWithRateLimiter(unittest.TestCase):
+    def test_llm_fails_fast_within_budget(self):
+        llm = MockLLM()
+        llm.set_rate_limiter(LLMRateLimiter(requests_per_minute=1))
+        messages = [LLMMessage.user_message("hello")]
+
+        llm.post_chat_request(LLMContext.empty(), messages)
+        with self.assertRaises(LLMRateLimitException):
+            llm.post_chat_request(LLMContext(AgentContextStore(ChatHistory()), ExecutionContext(), Budget(1)), messages)
+
+    def test_llm_tokens_per_minute(self):
+        llm = MockLLM()
+        llm.set_rate_limiter(LLMRateLimiter(tokens_per_minute=6000))  # 100 per second
+        messages = [LLMMessage.user_message("x" * 100)]
+
+        start = time.monotonic()
+        for _ in range(61):
+            llm.post_chat_request(LLMContext.empty(), messages)
+        self.assertGreater(time.monotonic() - start, 0.5)
+
+    def test_async_llm(self):
+        llm = MockLLM()
+        llm.set_rate_limiter(LLMRateLimiter(requests_per_minute=600))  # 10 per second
+
+        async def run_all():
+            messages = [LLMMessage.user_message("hello")]
+            return await asyncio.gather(*[llm.apost_chat_request(LLMContext.empty(), messages) for _ in range(605)])
+
+        start = time.monotonic()
+        results = asyncio.run(run_all())
+        self.assertEqual(605, len(results))
+        self.assertGreater(time.monotonic() - start, 0.3)
+
+    def test_from_config(self):
+        values = {
+            "kind": "LLMConfig",
+            "version": 0.1,
+            "metadata": {"name": "rate-limited"},
+            "spec": {
+                "description": "rate limited model",
+                "provider": {
+                    "name": "Ollama",
+                    "ollamaSpec": {"model": "llama3.2"},
+                    "rateLimit": {"requestsPerMinute": 500, "tokensPerMinute": 200000},
+                },
+            },
+        }
+
+        config = LLMConfigObject.from_dict(values)
+        self.assertEqual(
+            {"requestsPerMinute": 500, "tokensPerMinute": 200000}, config.spec.provider.to_dict()["rateLimit"]
+        )
+
+        llm = get_llm_from_config_obj(config)
+        other = get_llm_from_config_obj(LLMConfigObject.from_dict(values))
+
+        self.assertIsNotNone(llm.rate_limiter)
+        self.assertIs(llm.rate_limiter, other.rate_limiter)
+        self.assertEqual(500, llm.rate_limiter.requests_per_minute)
+        self.assertEqual(200000, llm.rate_limiter.tokens_per_minute)
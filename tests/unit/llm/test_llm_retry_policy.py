@@ -0,0 +1,143 @@
+import asyncio
+import time
+import unittest
+from email.utils import formatdate
+
+import httpx
+
+from council.contexts import AgentContextStore, Budget, ChatHistory, ExecutionContext, LLMContext
+from council.llm import (
+    AzureChatGPTConfiguration,
+    AzureLLM,
+    LLMCallException,
+    LLMFallback,
+    LLMMessage,
+    LLMMiddlewareChain,
+    LLMOutOfRetriesException,
+    LLMRequest,
+    LLMRetryMiddleware,
+    LLMRetryPolicy,
+)
+from council.mocks import MockErrorLLM, MockLLM
+
+
+def _context(duration: float) -> LLMContext:
+    return LLMContext(AgentContextStore(ChatHistory()), ExecutionContext(), Budget(duration))
+
+
+class TestLLMRetryPolicy(unittest.TestCase):
+    def test_exponential_without_jitter(self):
+        policy = LLMRetryPolicy(base_delay=1.0, max_delay=5.0, multiplier=2.0, jitter=False)
+        delays = []
+        delay = None
+        for _ in range(5):
+            delay = policy.next_delay(delay)
+            delays.append(delay)
+        self.assertEqual([1.0, 2.0, 4.0, 5.0, 5.0], delays)
+
+    def test_decorrelated_jitter(self):
+        policy = LLMRetryPolicy(base_delay=1.0, max_delay=10.0)
+        delays = set()
+        for _ in range(100):
+            delay = policy.next_delay(2.0)
+            self.assertTrue(1.0 <= delay <= 6.0)
+            delays.add(delay)
+        self.assertGreater(len(delays), 1)
+
+    def test_retry_after(self):
+        policy = LLMRetryPolicy(base_delay=1.0, max_delay=2.0, jitter=False)
+        e = LLMCallException(429, "Too many requests", "mock", retry_after=12.0)
+        self.assertEqual(2.0, policy.next_delay(None, e))
+        self.assertEqual(12.0, LLMRetryPolicy(max_delay=60.0, jitter=False).next_delay(None, e))
+        self.assertEqual(1.0, LLMRetryPolicy(jitter=False, respect_retry_after=False).next_delay(None, e))
+
+        jittered = LLMRetryPolicy().next_delay(None, e)
+        self.assertTrue(12.0 <= jittered <= 13.2)
+
+    def test_can_wait(self):
+        policy = LLMRetryPolicy()
+        self.assertTrue(policy.can_wait(100.0, None))
+        self.assertTrue(policy.can_wait(0.5, Budget(10)))
+        self.assertFalse(policy.can_wait(20.0, Budget(10)))
+
+    def test_retry_after_from_headers(self):
+        parse = LLMRetryPolicy.retry_after_from_headers
+        self.assertEqual(1.5, parse(httpx.Headers({"Retry-After-Ms": "1500", "Retry-After": "2"})))
+        self.assertEqual(2.0, parse(httpx.Headers({"Retry-After": "2"})))
+        self.assertAlmostEqual(30.0, parse(httpx.Headers({"Retry-After": formatdate(time.time() + 30)})), delta=1.5)
+        resets = {"x-ratelimit-reset-requests": "20ms", "x-ratelimit-reset-tokens": "6m0s"}
+        self.assertIsNone(parse(httpx.Headers(resets)))
+        self.assertIsNone(parse(httpx.Headers(resets), 500))
+        self.assertEqual(0.02, parse(httpx.Headers({**resets, "x-ratelimit-remaining-requests": "0"}), 429))
+        self.assertEqual(360.0, parse(httpx.Headers({**resets, "x-ratelimit-remaining-tokens": "0"}), 429))
+        self.assertEqual(0.02, parse(httpx.Headers(resets), 429))
+        self.assertEqual(2.0, parse(httpx.Headers({**resets, "Retry-After": "2"}), 429))
+        self.assertIsNone(parse(httpx.Headers({"Retry-After": "soon"})))
+        self.assertIsNone(parse(httpx.Headers({})))
+
+    def test_azure_exception_retry_after(self):
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"retry-after": "7"}, text="too many requests")
+        )
+        llm = AzureLLM(
+            AzureChatGPTConfiguration(
+                api_key="aKeY", api_base="https://council.openai.azure.com", deployment_name="gpt-4"
+            )
+        )
+        llm._client_provider._client = httpx.Client(transport=transport)
+
+        with self.assertRaises(LLMCallException) as cm:
+            llm.post_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")])
+        self.assertEqual(429, cm.exception.code)
+        self.assertEqual(7.0, cm.exception.retry_after)
+
+
+class TestRetryWithPolicy(unittest.TestCase):
+    def test_middleware_honours_retry_after(self):
+        e = LLMCallException(429, "Too many requests", "mock", retry_after=0.3)
+        chain = LLMMiddlewareChain(MockErrorLLM(e))
+        chain.add_middleware(LLMRetryMiddleware(retries=2, delay=0.0, policy=LLMRetryPolicy(0.0, jitter=False)))
+
+        start = time.monotonic()
+        with self.assertRaises(LLMOutOfRetriesException) as cm:
+            chain.execute(LLMRequest.default([]))
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+        self.assertEqual(2, len(cm.exception.exceptions))
+
+    def test_middleware_stops_at_deadline(self):
+        chain = LLMMiddlewareChain(MockErrorLLM())
+        chain.add_middleware(LLMRetryMiddleware(retries=10, delay=2.0))
+
+        start = time.monotonic()
+        with self.assertRaises(LLMOutOfRetriesException) as cm:
+            chain.execute(LLMRequest(_context(1.0), []))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(1, len(cm.exception.exceptions))
+
+    def test_async_middleware_stops_at_deadline(self):
+        chain = LLMMiddlewareChain(MockErrorLLM())
+        chain.add_middleware(LLMRetryMiddleware(retries=10, delay=2.0))
+
+        start = time.monotonic()
+        with self.assertRaises(LLMOutOfRetriesException):
+            asyncio.run(chain.aexecute(LLMRequest(_context(1.0), [])))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_fallback_stops_retrying_at_deadline(self):
+        primary = MockErrorLLM(LLMCallException(503, "Service unavailable", "mock", retry_after=5.0))
+        llm = LLMFallback(primary, MockLLM.from_response("fallback"), retry_before_fallback=3)
+
+        start = time.monotonic()
+        result = llm.post_chat_request(_context(2.0), [])
+        self.assertEqual("fallback", result.first_choice)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_fallback_with_policy(self):
+        primary = MockErrorLLM(LLMCallException(503, "Service unavailable", "mock"))
+        policy = LLMRetryPolicy(base_delay=0.1, jitter=False)
+        llm = LLMFallback(primary, MockLLM.from_response("fallback"), retry_before_fallback=3, retry_policy=policy)
+
+        start = time.monotonic()
+        result = asyncio.run(llm.apost_chat_request(LLMContext.empty(), []))
+        self.assertEqual("fallback", result.first_choice)
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
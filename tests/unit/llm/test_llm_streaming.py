@@ -0,0 +1,199 @@
+import asyncio
+import json
+import threading
+import unittest
+from typing import List
+from unittest.mock import patch
+
+import httpx
+
+from council.contexts import Consumption, LLMContext
+from council.llm import (
+    AzureChatGPTConfiguration,
+    AzureLLM,
+    EchoResponseParser,
+    LLMCallException,
+    LLMFallback,
+    LLMFunction,
+    LLMMessage,
+    LLMStreamChunk,
+    OllamaLLM,
+    OllamaLLMConfiguration,
+)
+from council.mocks import MockErrorLLM, MockLLM
+
+_EVENTS = [
+    {"id": "1", "object": "chat.completion.chunk", "created": 1, "model": "gpt-4o-mini", "choices": []},
+    {"id": "1", "model": "gpt-4o-mini", "choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hello"}}]},
+    {"id": "1", "model": "gpt-4o-mini", "choices": [{"index": 0, "delta": {"content": " world"}}]},
+    {"id": "1", "model": "gpt-4o-mini", "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+    {
+        "id": "1",
+        "model": "gpt-4o-mini",
+        "choices": [],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+    },
+]
+
+
+def _sse_body() -> bytes:
+    return "".join(f"data: {json.dumps(event)}\n\n" for event in _EVENTS).encode() + b"data: [DONE]\n\n"
+
+
+def _collect(chunks) -> List[LLMStreamChunk]:
+    return list(chunks)
+
+
+async def _acollect(chunks) -> List[LLMStreamChunk]:
+    return [chunk async for chunk in chunks]
+
+
+def _consumption(chunk: LLMStreamChunk, kind: str) -> Consumption:
+    return next(c for c in chunk.consumptions if c.kind == kind)
+
+
+class TestLLMStreaming(unittest.TestCase):
+    def setUp(self) -> None:
+        self.payloads: List[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.payloads.append(json.loads(request.content))
+            return httpx.Response(200, content=_sse_body(), headers={"content-type": "text/event-stream"})
+
+        self.transport = httpx.MockTransport(handler)
+        self.llm = AzureLLM(
+            AzureChatGPTConfiguration(
+                api_key="aKeY", api_base="https://council.openai.azure.com", deployment_name="gpt-4"
+            )
+        )
+
+    def test_default_stream(self):
+        context = LLMContext.empty()
+        chunks = _collect(MockLLM.from_response("USD").stream_chat_request(context, [LLMMessage.user_message("hi")]))
+
+        self.assertEqual(1, len(chunks))
+        self.assertTrue(chunks[0].is_final)
+        self.assertEqual("USD", chunks[0].content)
+        self.assertEqual("call", chunks[0].consumptions[0].unit)
+
+    def test_default_async_stream(self):
+        llm = MockLLM.from_response("USD")
+        chunks = asyncio.run(_acollect(llm.astream_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")])))
+
+        self.assertEqual(["USD"], [chunk.content for chunk in chunks])
+        self.assertTrue(chunks[-1].is_final)
+
+    def test_openai_server_sent_events(self):
+        self.llm._client_provider._client = httpx.Client(transport=self.transport)
+        chunks = _collect(self.llm.stream_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")]))
+
+        self.assertEqual(["Hello", " world", ""], [chunk.content for chunk in chunks])
+        self.assertEqual([False, False, True], [chunk.is_final for chunk in chunks])
+        self.assertEqual("Hello world", chunks[-1].result.first_choice)
+        self.assertEqual(10, _consumption(chunks[-1], "gpt-4o-mini:prompt_tokens").value)
+        self.assertEqual(2, _consumption(chunks[-1], "gpt-4o-mini:completion_tokens").value)
+        self.assertTrue(self.payloads[0]["stream"])
+        self.assertTrue(self.payloads[0]["stream_options"]["include_usage"])
+
+    def test_openai_async_server_sent_events(self):
+        async def run():
+            loop = asyncio.get_running_loop()
+            self.llm._client_provider._async_clients[loop] = httpx.AsyncClient(transport=self.transport)
+            return await _acollect(self.llm.astream_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")]))
+
+        chunks = asyncio.run(run())
+        self.assertEqual("Hello world", "".join(chunk.content for chunk in chunks))
+        self.assertEqual(12, _consumption(chunks[-1], "gpt-4o-mini:total_tokens").value)
+
+    def test_openai_async_client_closed_with_aclose(self):
+        provider = self.llm._client_provider
+
+        async def bind() -> httpx.AsyncClient:
+            async with self.llm:
+                client = provider.async_client
+                self.assertIs(client, provider.async_client)
+                self.assertEqual({asyncio.current_task()}, asyncio.all_tasks())
+            return client
+
+        first = asyncio.run(bind())
+        second = asyncio.run(bind())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertTrue(second.is_closed)
+        self.assertEqual(0, len(provider._async_clients))
+
+    def test_openai_async_client_of_closed_loop_forgotten(self):
+        provider = self.llm._client_provider
+
+        async def bind() -> httpx.AsyncClient:
+            return provider.async_client
+
+        loop = asyncio.new_event_loop()
+        first = loop.run_until_complete(bind())
+        loop.close()
+        second = asyncio.run(bind())
+        self.assertIsNot(first, second)
+        self.assertNotIn(loop, provider._async_clients)
+
+    def test_openai_async_client_per_loop(self):
+        provider = self.llm._client_provider
+        barrier = threading.Barrier(4)
+        clients = []
+        still_open = []
+
+        async def bind() -> None:
+            client = provider.async_client
+            clients.append(client)
+            # every loop is running when the clients of the others are created
+            await asyncio.to_thread(barrier.wait, 2)
+            still_open.append(client is provider.async_client and not client.is_closed)
+            await provider.aclose()
+
+        threads = [threading.Thread(target=asyncio.run, args=(bind(),)) for _ in range(4)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+
+        self.assertEqual([True] * 4, still_open)
+        self.assertEqual(4, len(set(map(id, clients))))
+        self.assertTrue(all(client.is_closed for client in clients))
+
+    def test_openai_stream_error(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(429, text="too many requests"))
+        self.llm._client_provider._client = httpx.Client(transport=transport)
+
+        with self.assertRaises(LLMCallException) as cm:
+            _collect(self.llm.stream_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")]))
+        self.assertEqual(429, cm.exception.code)
+
+    def test_fallback_stream(self):
+        llm = LLMFallback(MockErrorLLM(), MockLLM.from_response("fallback"), retry_before_fallback=1)
+        chunks = _collect(llm.stream_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")]))
+
+        self.assertEqual("fallback", chunks[-1].result.first_choice)
+
+    def test_ollama_stream(self):
+        llm = OllamaLLM(OllamaLLMConfiguration(model="llama3.2"))
+        responses = [
+            {"model": "llama3.2", "message": {"role": "assistant", "content": "Hello"}, "done": False},
+            {"model": "llama3.2", "message": {"role": "assistant", "content": " world"}, "done": False},
+            {
+                "model": "llama3.2",
+                "message": {"role": "assistant", "content": ""},
+                "done": True,
+                "prompt_eval_count": 10,
+                "eval_count": 2,
+            },
+        ]
+        with patch.object(llm.client, "chat", return_value=iter(responses)) as chat:
+            chunks = _collect(llm.stream_chat_request(LLMContext.empty(), [LLMMessage.user_message("hi")]))
+
+        self.assertTrue(chat.call_args.kwargs["stream"])
+        self.assertEqual(["Hello", " world", ""], [chunk.content for chunk in chunks])
+        self.assertEqual("Hello world", chunks[-1].result.first_choice)
+        self.assertEqual(10, _consumption(chunks[-1], "llama3.2:prompt_tokens").value)
+
+    def test_llm_function_stream(self):
+        llm_function: LLMFunction = LLMFunction(MockLLM.from_response("streamed"), EchoResponseParser.from_response, "")
+        chunks = _collect(llm_function.stream("hi"))
+
+        self.assertEqual("streamed", chunks[-1].result.first_choice)
@@ -0,0 +1,113 @@
+import unittest
+
+from council.contexts import Consumption
+from council.llm import LLMMessage, LLMMessageData, LLMTokenEstimator, LLMTokenLimitException
+
+
+class TestLLMTokenEstimator(unittest.TestCase):
+    def test_count(self):
+        estimator = LLMTokenEstimator("model", chars_per_token=4.0, tokens_per_message=4, reply_tokens=3)
+        messages = [LLMMessage.system_message("a" * 40), LLMMessage.user_message("b" * 6)]
+
+        self.assertEqual([14, 6], estimator.count_each_message_token(messages))
+        self.assertEqual(23, estimator.count_messages_token(messages))
+        self.assertEqual(3, estimator.count_messages_token([]))
+
+    def test_limit(self):
+        estimator = LLMTokenEstimator("model", limit=20)
+        with self.assertRaises(LLMTokenLimitException) as cm:
+            estimator.count_messages_token([LLMMessage.user_message("a" * 100)])
+        self.assertEqual(32, cm.exception.token_count)
+        self.assertEqual(20, cm.exception.limit)
+
+    def test_limit_margin(self):
+        estimator = LLMTokenEstimator("model", limit=100, margin=0.1)
+        self.assertEqual(107, estimator.count_messages_token([LLMMessage.user_message("a" * 400)]))
+        with self.assertRaises(LLMTokenLimitException):
+            estimator.count_messages_token([LLMMessage.user_message("a" * 420)])
+
+    def test_calibrate(self):
+        estimator = LLMTokenEstimator("model", smoothing=0.5)
+        # 1000 content tokens and 7 fixed tokens, reported as 2007 prompt tokens
+        messages = [LLMMessage.user_message("a" * 4_000)]
+        estimator.calibrate(messages, [Consumption.token(2_007, "model:prompt_tokens")])
+        self.assertAlmostEqual(1.5, estimator.scale)
+
+        estimator.calibrate(
+            messages,
+            [
+                Consumption.token(507, "model:cache_read_prompt_tokens"),
+                Consumption.token(1_500, "model:prompt_tokens"),
+                Consumption.token(5_000, "model:total_tokens"),
+            ],
+        )
+        self.assertAlmostEqual(1.75, estimator.scale)
+        self.assertEqual(0.0, estimator.overhead)
+
+    def test_calibrate_overhead(self):
+        estimator = LLMTokenEstimator("model", smoothing=0.5)
+        messages = [LLMMessage.system_message("a" * 40), LLMMessage.user_message("b" * 8)]
+        estimator.calibrate(messages, [Consumption.token(43, "model:prompt_tokens")])
+        self.assertEqual(1.0, estimator.scale)
+        self.assertAlmostEqual(10.0, estimator.overhead)
+        self.assertEqual(33, estimator.count_messages_token(messages))
+
+    def test_calibrate_without_prompt_tokens(self):
+        estimator = LLMTokenEstimator("model")
+        messages = [LLMMessage.user_message("a" * 4_000)]
+        estimator.calibrate(messages, [Consumption.call(1, "model")])
+        estimator.calibrate(messages, [Consumption.token(0, "model:prompt_tokens")])
+        self.assertEqual(1.0, estimator.scale)
+        self.assertEqual(0.0, estimator.overhead)
+
+    def test_calibrate_bounded(self):
+        estimator = LLMTokenEstimator("model", smoothing=1.0)
+        messages = [LLMMessage.user_message("a" * 4_000)]
+        estimator.calibrate(messages, [Consumption.token(100_000, "model:prompt_tokens")])
+        self.assertEqual(LLMTokenEstimator.MAX_SCALE, estimator.scale)
+        estimator.calibrate(messages, [Consumption.token(10, "model:prompt_tokens")])
+        self.assertEqual(LLMTokenEstimator.MIN_SCALE, estimator.scale)
+
+        estimator.calibrate([LLMMessage.user_message("a")], [Consumption.token(100_000, "model:prompt_tokens")])
+        self.assertEqual(LLMTokenEstimator.MAX_OVERHEAD, estimator.overhead)
+
+    def test_calibrate_does_not_drift(self):
+        estimator = LLMTokenEstimator("claude", limit=200_000, chars_per_token=3.5)
+        messages = [LLMMessage.user_message("a" * 3_500)]
+        for _ in range(100):
+            estimator.calibrate(messages, [Consumption.token(50_000, "claude:prompt_tokens")])
+        self.assertAlmostEqual(LLMTokenEstimator.MAX_SCALE, estimator.scale, places=3)
+
+        # ~43k actual tokens, still accepted after many underestimated requests
+        tokens = estimator.count_messages_token([LLMMessage.user_message("a" * 150_000)])
+        self.assertLess(tokens, 200_000)
+
+    def test_short_prompts_do_not_inflate_long_prompts(self):
+        estimator = LLMTokenEstimator("llama-3.3-70b-versatile", limit=128_000)
+        short = [LLMMessage.system_message("You are a helpful assistant."), LLMMessage.user_message("Hello!")]
+        for _ in range(50):
+            estimator.calibrate(short, [Consumption.token(48, "llama-3.3-70b-versatile:prompt_tokens")])
+        self.assertEqual(1.0, estimator.scale)
+        self.assertLess(estimator.overhead, 48)
+
+        # ~84k tokens prompt, within the context window
+        tokens = estimator.count_messages_token([LLMMessage.user_message("word " * 84_000)])
+        self.assertLess(tokens, 128_000 * 1.1)
+
+    def test_limit_uncalibrated(self):
+        estimator = LLMTokenEstimator("model", limit=1_000, smoothing=1.0)
+        estimator.calibrate([LLMMessage.user_message("a" * 4_000)], [Consumption.token(10_000, "model:prompt_tokens")])
+        self.assertEqual(LLMTokenEstimator.MAX_SCALE, estimator.scale)
+
+        # calibrated to ~2000 tokens, but ~1000 tokens without calibration
+        messages = [LLMMessage.user_message("a" * 3_960)]
+        self.assertGreater(estimator.count_messages_token(messages), 1_100)
+
+    def test_calibrate_ignores_data(self):
+        estimator = LLMTokenEstimator("model")
+        message = LLMMessage.user_message("describe this image")
+        message.add_data(LLMMessageData(content="aGVsbG8=", mime_type="image/png"))
+        for _ in range(10):
+            estimator.calibrate([message], [Consumption.token(1_500, "model:prompt_tokens")])
+        self.assertEqual(1.0, estimator.scale)
+        self.assertEqual(0.0, estimator.overhead)
@@ -1,5 +1,5 @@
 import unittest
-from council.llm import OpenAIChatGPTConfiguration
+from council.llm import LLMConfigObject, OpenAIChatGPTConfiguration
 from council.utils import OsEnviron, ParameterValueException
 
 
@@ -31,3 +31,46 @@ class TestOpenAIChatGPTConfiguration(unittest.TestCase):
             _ = OpenAIChatGPTConfiguration(model="gpt-model", api_key="a-sk-key", api_host="https://api.openai.com")
         with self.assertRaises(ParameterValueException):
             _ = OpenAIChatGPTConfiguration(model="gpt-model", api_key="sk-key", api_host="api.openai.com")
+
+    def test_connection_pool_default(self):
+        config = OpenAIChatGPTConfiguration(model="gpt-model", api_key="sk-key", api_host="https://api.openai.com")
+        self.assertEqual(100, config.max_connections.value)
+        self.assertEqual(20, config.max_keepalive_connections.value)
+        self.assertEqual(5.0, config.keepalive_expiry.value)
+        self.assertFalse(config.http2.value)
+
+    def test_connection_pool_from_env(self):
+        with (
+            OsEnviron("OPENAI_API_KEY", "sk-key"),
+            OsEnviron("OPENAI_LLM_MAX_CONNECTIONS", "8"),
+            OsEnviron("OPENAI_LLM_KEEPALIVE_EXPIRY", "30"),
+        ):
+            config = OpenAIChatGPTConfiguration.from_env()
+            self.assertEqual(8, config.max_connections.value)
+            self.assertEqual(30.0, config.keepalive_expiry.value)
+            limits = config.http_limits()
+            self.assertEqual(8, limits.max_connections)
+            self.assertEqual(30.0, limits.keepalive_expiry)
+
+    def test_connection_pool_from_spec(self):
+        values = {
+            "kind": "LLMConfig",
+            "version": "0.1",
+            "metadata": {"name": "an-openai-model"},
+            "spec": {
+                "provider": {
+                    "name": "OpenAI",
+                    "openAISpec": {
+                        "model": "gpt-4o",
+                        "apiKey": "sk-key",
+                        "maxConnections": 4,
+                        "maxKeepaliveConnections": 2,
+                        "http2": True,
+                    },
+                },
+            },
+        }
+        config = OpenAIChatGPTConfiguration.from_spec(LLMConfigObject.from_dict(values).spec)
+        self.assertEqual(4, config.max_connections.value)
+        self.assertEqual(2, config.max_keepalive_connections.value)
+        self.assertTrue(config.http2.value)
@@ -1,4 +1,6 @@
 import unittest
+from typing import List
+from unittest.mock import Mock
 
 from council.llm import LLMMessage, LLMTokenLimitException
 from council.llm.base.providers.openai.openai_token_counter import OpenAITokenCounter
@@ -63,6 +65,48 @@ class TestLlmOpenAI(unittest.TestCase):
         self.assertEqual(messages[0], filtered[0])
         self.assertGreaterEqual(counter.token_limit - counter.count_messages_token(filtered), 4000)
 
+    def test_token_count_cached(self):
+        counter = OpenAITokenCounter.from_model("gpt-3.5-turbo")
+        messages = self._get_messages()
+        expected = counter.count_messages_token(messages)
+
+        encoded: List[str] = []
+        encoding = counter._encoding
+        counter._encoding = Mock(wraps=encoding)
+        counter._encoding.encode.side_effect = lambda text: encoded.append(text) or encoding.encode(text)
+        counter._encoding.encode_batch.side_effect = lambda texts: encoded.extend(texts) or encoding.encode_batch(texts)
+
+        self.assertEqual(expected, counter.count_messages_token(messages))
+        self.assertEqual([], encoded)
+
+        new_message = LLMMessage.assistant_message("Sure, let's get started.")
+        counter.count_messages_token(messages + [new_message])
+        self.assertEqual([new_message.content, "Assistant"], encoded)
+
+    def test_token_count_cache_bounded(self):
+        counter = OpenAITokenCounter.from_model("gpt-3.5-turbo")
+        cached = OpenAITokenCounter(
+            counter._encoding, "gpt-3.5-turbo-0125", tokens_per_message=3, tokens_per_name=1, cache_size=2
+        )
+        messages = self._get_messages()
+
+        self.assertEqual(counter.count_each_message_token(messages), cached.count_each_message_token(messages))
+        self.assertEqual(2, len(cached._cache))
+
+    def test_batch_encode_large_texts_only(self):
+        encoding = Mock()
+        encoding.encode.side_effect = lambda text: text.split()
+        encoding.encode_batch.side_effect = lambda texts: [text.split() for text in texts]
+        counter = OpenAITokenCounter(encoding, "gpt-3.5-turbo-0125", tokens_per_message=3, cache_size=0)
+
+        small = [LLMMessage.user_message(f"message {i}") for i in range(8)]
+        self.assertEqual([6] * 8, counter.count_each_message_token(small))
+        encoding.encode_batch.assert_not_called()
+
+        large = [LLMMessage.user_message(f"word{i} " * 10_000) for i in range(2)]
+        self.assertEqual([10_004] * 2, counter.count_each_message_token(large))
+        encoding.encode_batch.assert_called_once()
+
     @staticmethod
     def _get_messages(repeat: int = 1):
         messages = [
@@ -1,3 +1,5 @@
+import asyncio
+import time
 import unittest
 
 from council.contexts import LLMContext
@@ -30,3 +32,19 @@ class TestPrompt(unittest.TestCase):
         m = MockLLM(action=llm_message_content_to_str, token_limit=3)
         with self.assertRaises(LLMTokenLimitException):
             _ = m.post_chat_request(LLMContext.empty(), [LLMMessage.user_message("Test")])
+
+    def test_async_from_response(self):
+        m = MockLLM.from_response("Test", delay=0.5)
+
+        async def run_all():
+            return await asyncio.gather(*[m.apost_chat_request(LLMContext.empty(), []) for _ in range(10)])
+
+        start = time.time()
+        results = asyncio.run(run_all())
+        self.assertLess(time.time() - start, 2.0)
+        self.assertEqual(["Test"] * 10, [r.first_choice for r in results])
+
+    def test_async_token_limit(self):
+        m = MockLLM(action=llm_message_content_to_str, token_limit=3)
+        with self.assertRaises(LLMTokenLimitException):
+            _ = asyncio.run(m.apost_chat_request(LLMContext.empty(), [LLMMessage.user_message("Test")]))
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import unittest
 from typing import List, Optional
@@ -5,7 +6,7 @@ from typing import List, Optional
 from council.contexts import AgentContext, Budget, ChainContext, ChatMessage, SkillContext
 from council.mocks import MockMonitored
 from council.runners import RunnerBase, new_runner_executor
-from council.skills import SkillBase
+from council.skills import AsyncSkillBase, SkillBase
 
 
 class MySkillException(Exception):
@@ -29,6 +30,18 @@ class SkillTest(SkillBase):
         return self.build_success_message(self._name, context.iteration.map_or(lambda i: i.value, -1))
 
 
+class AsyncSkillTest(AsyncSkillBase):
+    def __init__(self, name: str, wait: float):
+        super().__init__(name)
+        self.wait = wait
+
+    async def aexecute(self, context: SkillContext) -> ChatMessage:
+        await asyncio.sleep(abs(self.wait))
+        if self.wait < 0:
+            raise MySkillException("invalid wait")
+        return self.build_success_message(self._name, context.iteration.map_or(lambda i: i.value, -1))
+
+
 class SkillTestAppend(SkillBase):
     def execute(self, context: SkillContext) -> ChatMessage:
         message = context.current.try_last_message.map_or(lambda m: m.message, "")
@@ -59,6 +72,14 @@ class RunnerTestCase(unittest.TestCase):
 
             print(f"\n{context.execution_log_to_json()}")
 
+    def aexecute(self, runner: RunnerBase, budget: Budget) -> None:
+        context = AgentContext.empty()
+        context.new_iteration()
+        with context.log_entry:
+            self.context = ChainContext.from_agent_context(context, MockMonitored("test"), "chain", budget)
+            with self.context:
+                asyncio.run(runner.arun(self.context))
+
     def assertSuccessMessages(self, expected: List[str]):
         self.assertEqual(
             expected,
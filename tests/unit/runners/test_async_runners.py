@@ -0,0 +1,143 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+from council.chains import Chain
+from council.contexts import Budget, ChainContext, ChatMessage, SkillContext
+from council.llm import AzureChatGPTConfiguration, AzureLLM, LLMBase, LLMMessage, MonitoredLLM
+from council.runners import DoWhile, If, Parallel, ParallelFor, RunnerSkillError, RunnerTimeoutError, Sequential, While
+from council.skills import AsyncSkillBase
+
+from .helpers import AsyncSkillTest, MySkillException, RunnerTestCase, SkillTest, SkillTestAppend, SkillTestMerge
+
+
+class AsyncLLMSkillTest(AsyncSkillBase):
+    def __init__(self, name: str, llm: LLMBase, calls: int) -> None:
+        super().__init__(name)
+        self.llm = self.register_monitor(MonitoredLLM("llm", llm))
+        self.calls = calls
+
+    async def aexecute(self, context: SkillContext) -> ChatMessage:
+        choices = []
+        for _ in range(self.calls):
+            result = await self.llm.apost_chat_request(context, [LLMMessage.user_message(self.name)])
+            choices.append(result.first_choice)
+        return self.build_success_message(self.name, choices)
+
+
+async def _completion(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.01)
+    content = json.loads(request.content)["messages"][-1]["content"][0]["text"]
+    return httpx.Response(
+        200,
+        json={
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11},
+        },
+    )
+
+
+class TestAsyncRunners(RunnerTestCase):
+    def test_sequence(self):
+        instance = Sequential(AsyncSkillTest("first", 0.1), SkillTest("second", 0.1))
+        self.aexecute(instance, Budget(1))
+        self.assertSuccessMessages(["first", "second"])
+
+    def test_sequence_timeout(self):
+        instance = Sequential(AsyncSkillTest("first", 0.2), AsyncSkillTest("second", 0.1))
+        with self.assertRaises(RunnerTimeoutError):
+            self.aexecute(instance, Budget(0.25))
+        self.assertSuccessMessages(["first"])
+
+    def test_parallel(self):
+        instance = Parallel(*[AsyncSkillTest(f"skill {i}", 0.2) for i in range(50)])
+        start = time.monotonic()
+        self.aexecute(instance, Budget(1))
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertSuccessMessages([f"skill {i}" for i in range(50)])
+
+    def test_parallel_many_sequences(self):
+        instance = Sequential(
+            SkillTestAppend("a"),
+            Parallel(
+                Sequential(SkillTestAppend("b"), SkillTestAppend("c")),
+                Sequential(SkillTestAppend("d"), SkillTestAppend("e")),
+            ),
+            SkillTestMerge(["c", "e"]),
+        )
+
+        self.aexecute(instance, Budget(1))
+        self.assertEqual(self.context.last_message.message, "abcade")
+
+    def test_parallel_with_exception(self):
+        instance = Parallel(AsyncSkillTest("first", 0.3), AsyncSkillTest("second", -0.1))
+        with self.assertRaises(RunnerSkillError) as cm:
+            self.aexecute(instance, Budget(1))
+        self.assertIsInstance(cm.exception.__cause__, MySkillException)
+
+    def test_parallel_for(self):
+        def generator(context: ChainContext):
+            for i in range(20):
+                yield i
+
+        instance = ParallelFor(generator, AsyncSkillTest("for each", 0.01), parallelism=4)
+        self.aexecute(instance, Budget(1))
+        data = [m.data for m in self.context.current.messages if m.is_ok]
+        self.assertEqual([i for i in range(20)], data)
+
+    def test_if(self):
+        instance = If(lambda context: False, AsyncSkillTest("then", 0.01), AsyncSkillTest("else", 0.01))
+        self.aexecute(instance, Budget(1))
+        self.assertSuccessMessages(["else"])
+
+    def test_while(self):
+        instance = While(lambda context: len(list(context.current.messages)) < 3, AsyncSkillTest("body", 0.01))
+        self.aexecute(instance, Budget(1))
+        self.assertSuccessMessages(["body", "body", "body"])
+
+    def test_do_while(self):
+        instance = DoWhile(lambda context: False, AsyncSkillTest("body", 0.01))
+        self.aexecute(instance, Budget(1))
+        self.assertSuccessMessages(["body"])
+
+    def test_async_skill_in_sync_runner(self):
+        instance = Sequential(AsyncSkillTest("first", 0.01), SkillTest("second", 0.01))
+        self.execute(instance, Budget(1))
+        self.assertSuccessMessages(["first", "second"])
+
+    def test_async_llm_skills_in_sync_parallel(self):
+        # each async skill runs its own event loop in a worker thread, sharing the clients of the LLM
+        llm = AzureLLM(
+            AzureChatGPTConfiguration(
+                api_key="aKeY", api_base="https://council.openai.azure.com", deployment_name="gpt-4"
+            )
+        )
+        async_client = httpx.AsyncClient
+        clients = []
+
+        def new_client(**kwargs) -> httpx.AsyncClient:
+            clients.append(async_client(transport=httpx.MockTransport(_completion)))
+            return clients[-1]
+
+        with patch("httpx.AsyncClient", new_client):
+            instance = Parallel(AsyncLLMSkillTest("first", llm, 5), AsyncLLMSkillTest("second", llm, 5))
+            self.execute(instance, Budget(5))
+
+        self.assertSuccessMessages(["first", "second"])
+        self.assertEqual([["first"] * 5, ["second"] * 5], [m.data for m in self.context.current.messages])
+        # one client per event loop, used for all its requests
+        self.assertEqual(2, len(clients))
+        # closed when the event loop of its skill ends
+        self.assertTrue(all(client.is_closed for client in clients))
+
+    def test_chain(self):
+        chain = Chain("chain", "async chain", [AsyncSkillTest("first", 0.01), SkillTest("second", 0.01)])
+        context = ChainContext.empty()
+        asyncio.run(chain.aexecute(context))
+        self.assertEqual(["first", "second"], [m.message for m in context.messages if m.is_kind_skill])
@@ -1,14 +1,55 @@
-from typing import Any
+from threading import Event
+from typing import Any, Sequence
 
-from council.contexts import Budget, ChainContext, Consumption
+from council.contexts import Budget, ChainContext, ChatMessage, Consumption, IterationContext, SkillContext
 from council.runners import (
     ParallelFor,
     RunnerGeneratorError,
     RunnerSkillError,
 )
+from council.skills import SkillBase
+
 from .helpers import MySkillException, RunnerTestCase, SkillTest
 
 
+class SkillWaitForOthers(SkillBase):
+    """
+    The first iteration waits until all the others are done.
+    """
+
+    def __init__(self, others: int):
+        super().__init__("wait for others")
+        self.others = others
+        self.done = 0
+        self.event = Event()
+
+    def execute(self, context: SkillContext) -> ChatMessage:
+        index = context.iteration.unwrap().index
+        if index == 0:
+            if not self.event.wait(1.0):
+                raise MySkillException("other iterations did not run")
+        else:
+            self.done += 1
+            if self.done == self.others:
+                self.event.set()
+        return self.build_success_message(self._name, index)
+
+
+class SkillCountVisible(SkillBase):
+    """
+    Records the number of messages visible to each iteration.
+    """
+
+    def __init__(self):
+        super().__init__("count visible")
+        self.visible = {}
+
+    def execute(self, context: SkillContext) -> ChatMessage:
+        index = context.iteration.unwrap().index
+        self.visible[index] = len(list(context.current.messages))
+        return self.build_success_message(self._name, index)
+
+
 class TestParallelFor(RunnerTestCase):
     def test_parallel_for(self):
         count = 100
@@ -23,6 +64,16 @@ class TestParallelFor(RunnerTestCase):
         data = [m.data for m in self.context.current.messages if m.is_ok]
         self.assertEqual([i for i in range(count)], data)
 
+    def test_parallel_for_slow_iteration_does_not_block(self):
+        def generator(chain_context: ChainContext) -> Any:
+            for i in range(7):
+                yield i
+
+        instance = ParallelFor(generator, SkillWaitForOthers(6), parallelism=2)
+        self.execute(instance, Budget(2))
+        data = [m.data for m in self.context.current.messages if m.is_ok]
+        self.assertEqual([i for i in range(7)], data)
+
     def test_parallel_for_last_throw(self):
         def generator(chain_context: ChainContext):
             for _ in [1, 2, 3, 4]:
@@ -64,3 +115,38 @@ class TestParallelFor(RunnerTestCase):
         data = [m.data for m in self.context.current.messages if m.is_ok]
         self.assertEqual([i for i in range(count)], data)
         self.assertEqual(self.context.budget._remaining[0].value, 10)
+
+    def test_parallel_for_streaming(self):
+        count = 20
+        pulled = []
+        results = {}
+
+        def generator(chain_context: ChainContext) -> Any:
+            for i in range(count):
+                pulled.append(i)
+                yield i
+
+        def on_result(iteration: IterationContext, messages: Sequence[ChatMessage]) -> None:
+            # values are only pulled when an iteration can start
+            self.assertLessEqual(len(pulled) - len(results), 3)
+            results[iteration.index] = [m.data for m in messages]
+
+        instance = ParallelFor(
+            generator, SkillTest("for each", 0.01), parallelism=3, streaming=True, on_result=on_result
+        )
+        self.execute(instance, Budget(2))
+        self.assertEqual({i: [i] for i in range(count)}, results)
+        data = [m.data for m in self.context.current.messages if m.is_ok]
+        self.assertEqual([i for i in range(count)], sorted(data))
+
+    def test_parallel_for_streaming_iterations_are_isolated(self):
+        def generator(chain_context: ChainContext) -> Any:
+            for i in range(10):
+                yield i
+
+        for execute in [self.execute, self.aexecute]:
+            for streaming in [False, True]:
+                skill = SkillCountVisible()
+                execute(ParallelFor(generator, skill, parallelism=2, streaming=streaming), Budget(2))
+                self.assertEqual(10, len(list(self.context.current.messages)))
+                self.assertEqual({i: 0 for i in range(10)}, skill.visible)
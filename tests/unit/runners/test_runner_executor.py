@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+
+from council.runners import RunnerExecutor, shared_runner_executor
+
+
+class TestRunnerExecutor(unittest.TestCase):
+    def test_nested_submissions_do_not_deadlock(self):
+        executor = RunnerExecutor(max_workers=2, thread_name_prefix="test")
+
+        def leaf(value: int) -> int:
+            time.sleep(0.01)
+            return value
+
+        def node(value: int) -> int:
+            fs = [executor.submit(leaf, value * 10 + i) for i in range(4)]
+            return sum(f.result(timeout=1) for f in fs)
+
+        try:
+            fs = [executor.submit(node, i) for i in range(4)]
+            self.assertEqual([6, 46, 86, 126], [f.result(timeout=2) for f in fs])
+        finally:
+            executor.shutdown()
+
+    def test_queue_depth(self):
+        executor = RunnerExecutor(max_workers=1, thread_name_prefix="test")
+        started = threading.Event()
+        release = threading.Event()
+
+        def block() -> None:
+            started.set()
+            release.wait(1)
+
+        try:
+            fs = [executor.submit(block) for _ in range(3)]
+            started.wait(1)
+            self.assertEqual(1, executor.running)
+            self.assertEqual(2, executor.queue_depth)
+            release.set()
+            self.assertEqual([None, None, None], [f.result(timeout=2) for f in fs])
+        finally:
+            executor.shutdown()
+        self.assertEqual(0, executor.queue_depth)
+
+    def test_exception_overflow(self):
+        executor = RunnerExecutor(max_workers=1, thread_name_prefix="test")
+
+        def fail() -> None:
+            raise ValueError("failed")
+
+        def node() -> None:
+            executor.submit(fail).result(timeout=1)
+
+        try:
+            with self.assertRaises(ValueError):
+                executor.submit(node).result(timeout=1)
+        finally:
+            executor.shutdown()
+
+    def test_overflow_keeps_timeout(self):
+        executor = RunnerExecutor(max_workers=1, thread_name_prefix="test")
+        release = threading.Event()
+
+        def node() -> None:
+            future = executor.submit(release.wait, 1)
+            self.assertFalse(future.done())
+            future.result(timeout=0.05)
+
+        try:
+            with self.assertRaises(TimeoutError):
+                executor.submit(node).result(timeout=1)
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_shared_executor(self):
+        executor = shared_runner_executor()
+        self.assertIs(executor, shared_runner_executor())
+
+        executor.shutdown()
+        self.assertTrue(executor.is_shutdown)
+        self.assertIsNot(executor, shared_runner_executor())